@@ -4,67 +4,132 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from flask import Flask, send_from_directory
-from flask_cors import CORS
+from sqlalchemy.schema import CreateIndex
 from src.models import db
-from src.routes.user import user_bp
-from src.routes.automation import automation_bp
-from src.routes.analytics import analytics_bp
-from src.routes.dashboard import dashboard_bp
-from src.routes.validation import validation_bp
-from src.routes.tasks import tasks_bp
 
-app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
-app.config['SECRET_KEY'] = 'facebook_marketplace_secret_key_2025'
 
-# Enable CORS for all routes
-CORS(app)
-
-app.register_blueprint(user_bp, url_prefix='/api')
-app.register_blueprint(automation_bp, url_prefix='/api/automation')
-app.register_blueprint(analytics_bp, url_prefix='/api/analytics')
-app.register_blueprint(dashboard_bp, url_prefix='/api/dashboard')
-app.register_blueprint(validation_bp, url_prefix='/api/validation')
-app.register_blueprint(tasks_bp, url_prefix='/api/tasks')
+def create_app(config: str = 'default', database_uri: str = None) -> Flask:
+    """
+    Build the Flask app.
+    
+    Args:
+        config: 'default' for the full server; 'testing' for just the
+            database and models, without the API blueprints, the background
+            task manager or the sample-data seeding
+        database_uri: SQLAlchemy URI to use instead of src/database/app.db
+            
+    Returns:
+        The configured Flask app
+    """
+    app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+    app.config['SECRET_KEY'] = 'facebook_marketplace_secret_key_2025'
+    
+    # Database configuration
+    if database_uri is None:
+        database_dir = os.path.join(os.path.dirname(__file__), 'database')
+        os.makedirs(database_dir, exist_ok=True)
+        database_uri = f"sqlite:///{os.path.join(database_dir, 'app.db')}"
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Pooled connections so parallel automation workers don't serialize on one connection
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': 20,
+        'max_overflow': 10,
+        'pool_pre_ping': True
+    }
+    db.init_app(app)
+    
+    # Create all tables
+    with app.app_context():
+        db.create_all()
+        # create_all skips tables that already exist, so indexes added to the
+        # models since a database was created are created here (IF NOT EXISTS
+        # rather than checkfirst, which can't see expression indexes)
+        with db.engine.begin() as conn:
+            for table in db.metadata.sorted_tables:
+                for index in table.indexes:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+        print("Database tables created successfully")
+        
+        # Write-ahead logging lets the concurrent readers (validators, dashboards)
+        # run alongside the automation's writes; the mode is stored in the file
+        with db.engine.connect() as conn:
+            conn.exec_driver_sql('PRAGMA journal_mode=WAL')
+    
+    if config == 'testing':
+        return app
+    
+    # The API, and the services behind it, are only imported for the full server
+    from flask_cors import CORS
+    from src.routes.user import user_bp
+    from src.routes.automation import automation_bp
+    from src.routes.analytics import analytics_bp
+    from src.routes.dashboard import dashboard_bp
+    from src.routes.validation import validation_bp
+    from src.routes.tasks import tasks_bp
+    from src.services.task_manager import get_task_manager
+    
+    # Enable CORS for all routes
+    CORS(app)
+    
+    app.register_blueprint(user_bp, url_prefix='/api')
+    app.register_blueprint(automation_bp, url_prefix='/api/automation')
+    app.register_blueprint(analytics_bp, url_prefix='/api/analytics')
+    app.register_blueprint(dashboard_bp, url_prefix='/api/dashboard')
+    app.register_blueprint(validation_bp, url_prefix='/api/validation')
+    app.register_blueprint(tasks_bp, url_prefix='/api/tasks')
+    
+    # Background tasks run inside this app's context
+    get_task_manager().init_app(app)
+    
+    with app.app_context():
+        # Seed database with sample data
+        from src.services.data_seeder import seed_database
+        try:
+            seed_database()
+            print("Sample data seeded successfully")
+        except Exception as e:
+            print(f"Error seeding data: {e}")
+            # Continue anyway
+    
+    @app.route('/', defaults={'path': ''})
+    @app.route('/<path:path>')
+    def serve(path):
+        static_folder_path = app.static_folder
+        if static_folder_path is None:
+                return "Static folder not configured", 404
+    
+        if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
+            return send_from_directory(static_folder_path, path)
+        else:
+            index_path = os.path.join(static_folder_path, 'index.html')
+            if os.path.exists(index_path):
+                return send_from_directory(static_folder_path, 'index.html')
+            else:
+                return "index.html not found", 404
+    
+    return app
 
-# Database configuration
-database_dir = os.path.join(os.path.dirname(__file__), 'database')
-os.makedirs(database_dir, exist_ok=True)
-app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(database_dir, 'app.db')}"
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db.init_app(app)
 
-# Create all tables
-with app.app_context():
-    db.create_all()
-    print("Database tables created successfully")
-    
-    # Seed database with sample data
-    from src.services.data_seeder import seed_database
-    try:
-        seed_database()
-        print("Sample data seeded successfully")
-    except Exception as e:
-        print(f"Error seeding data: {e}")
-        # Continue anyway
+_app = None
 
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
-def serve(path):
-    static_folder_path = app.static_folder
-    if static_folder_path is None:
-            return "Static folder not configured", 404
 
-    if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
-        return send_from_directory(static_folder_path, path)
-    else:
-        index_path = os.path.join(static_folder_path, 'index.html')
-        if os.path.exists(index_path):
-            return send_from_directory(static_folder_path, 'index.html')
-        else:
-            return "index.html not found", 404
+def __getattr__(name):
+    """
+    Build the full app on first access to `src.main.app` (e.g. gunicorn's
+    `src.main:app`), so importing create_app alone stays light.
+    """
+    global _app
+    if name == 'app':
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == '__main__':
+    app = create_app()
+    
     # Initialize and start task manager
     from src.services.task_manager import get_task_manager
     task_manager = get_task_manager()
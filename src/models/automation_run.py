@@ -4,6 +4,17 @@ from src.models.facebook_account import db
 
 class AutomationRun(db.Model):
     __tablename__ = 'automation_runs'
+    __table_args__ = (
+        # Recent-run windows filtered or grouped by status; the trailing columns
+        # cover the windowed run aggregates so they never touch the table rows
+        db.Index(
+            'ix_automation_runs_start_covering',
+            'start_time', 'status', 'duration_seconds', 'messages_processed', 'responses_sent'
+        ),
+        # Validation probes: runs stuck in a status, and runs ending before
+        # they started, read from the index instead of the table
+        db.Index('ix_automation_runs_status_times', 'status', 'end_time', 'start_time'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     facebook_account_id = db.Column(db.Integer, db.ForeignKey('facebook_accounts.id'), nullable=False)
@@ -178,6 +189,10 @@ class SystemMetric(db.Model):
 
 class ValidationLog(db.Model):
     __tablename__ = 'validation_logs'
+    __table_args__ = (
+        # Recent-issue windows counted by status
+        db.Index('ix_validation_logs_timestamp_status', 'timestamp', 'validation_status'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     validation_type = db.Column(db.String(100), nullable=False)
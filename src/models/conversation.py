@@ -2,8 +2,61 @@ from sqlalchemy import Numeric
 from datetime import datetime
 from src.models.facebook_account import db
 
+def compute_message_stats(messages):
+    """
+    Compute conversation statistics from its messages.
+    
+    Args:
+        messages: Iterable of (timestamp, is_from_customer, is_processed) tuples
+        
+    Returns:
+        Dict of Conversation column values to set. Last-message times and the
+        average response time are only included when they can be computed.
+    """
+    messages = list(messages)
+    customer_times = sorted(timestamp for timestamp, is_from_customer, _ in messages if is_from_customer)
+    bot_times = sorted(timestamp for timestamp, is_from_customer, _ in messages if not is_from_customer)
+    
+    # Count messages
+    stats = {
+        'message_count': len(messages),
+        'customer_message_count': len(customer_times),
+        'bot_response_count': len(bot_times),
+        # Calculate unread count (customer messages without bot responses after them)
+        'unread_count': len([m for m in messages if m[1] and not m[2]]),
+        'updated_at': datetime.utcnow()
+    }
+    
+    # Update last message times
+    if messages:
+        stats['last_message_time'] = max(timestamp for timestamp, _, _ in messages)
+        if customer_times:
+            stats['last_customer_message_time'] = customer_times[-1]
+        if bot_times:
+            stats['last_bot_response_time'] = bot_times[-1]
+    
+    # Calculate average response time
+    response_times = []
+    for customer_time in customer_times:
+        # Find next bot response after this customer message
+        next_bot_response = next((b for b in bot_times if b > customer_time), None)
+        if next_bot_response:
+            response_times.append((next_bot_response - customer_time).total_seconds() / 60)
+    
+    if response_times:
+        stats['response_time_avg_minutes'] = sum(response_times) / len(response_times)
+    
+    return stats
+
 class Conversation(db.Model):
     __tablename__ = 'conversations'
+    __table_args__ = (
+        # Per-account status filters (e.g. an account's active conversations)
+        db.Index('ix_conversations_account_status', 'facebook_account_id', 'status'),
+        # Analytics windows (conversations created in the last N days),
+        # with status so per-status breakdowns are answered from the index
+        db.Index('ix_conversations_created_status', 'created_at', 'status'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     facebook_account_id = db.Column(db.Integer, db.ForeignKey('facebook_accounts.id'), nullable=False)
@@ -62,44 +115,11 @@ class Conversation(db.Model):
     
     def update_message_stats(self):
         """Update conversation statistics based on messages"""
-        from src.models.message import Message
-        
-        # Count messages
-        self.message_count = len(self.messages)
-        self.customer_message_count = len([m for m in self.messages if m.is_from_customer])
-        self.bot_response_count = len([m for m in self.messages if not m.is_from_customer])
-        
-        # Update last message times
-        if self.messages:
-            self.last_message_time = max(m.timestamp for m in self.messages)
-            
-            customer_messages = [m for m in self.messages if m.is_from_customer]
-            if customer_messages:
-                self.last_customer_message_time = max(m.timestamp for m in customer_messages)
-            
-            bot_messages = [m for m in self.messages if not m.is_from_customer]
-            if bot_messages:
-                self.last_bot_response_time = max(m.timestamp for m in bot_messages)
-        
-        # Calculate unread count (customer messages without bot responses after them)
-        self.unread_count = len([m for m in self.messages if m.is_from_customer and not m.is_processed])
-        
-        # Calculate average response time
-        response_times = []
-        customer_msgs = sorted([m for m in self.messages if m.is_from_customer], key=lambda x: x.timestamp)
-        bot_msgs = sorted([m for m in self.messages if not m.is_from_customer], key=lambda x: x.timestamp)
-        
-        for customer_msg in customer_msgs:
-            # Find next bot response after this customer message
-            next_bot_response = next((b for b in bot_msgs if b.timestamp > customer_msg.timestamp), None)
-            if next_bot_response:
-                response_time = (next_bot_response.timestamp - customer_msg.timestamp).total_seconds() / 60
-                response_times.append(response_time)
-        
-        if response_times:
-            self.response_time_avg_minutes = sum(response_times) / len(response_times)
-        
-        self.updated_at = datetime.utcnow()
+        stats = compute_message_stats(
+            (m.timestamp, m.is_from_customer, m.is_processed) for m in self.messages
+        )
+        for field, value in stats.items():
+            setattr(self, field, value)
     
     def add_tag(self, tag):
         """Add a tag to the conversation"""
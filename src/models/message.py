@@ -1,9 +1,110 @@
 from datetime import datetime
+import functools
 import json
+import re
 from src.models.facebook_account import db
 
+# Keyword categories for Message.classify_message, in priority order:
+# (message_type, confidence, keywords)
+MESSAGE_CLASSIFIERS = (
+    ('price_inquiry', 0.8, ('price', 'cost', 'how much', 'expensive', 'cheap', 'dollar', '$', 'money', 'pay')),
+    ('availability_check', 0.8, ('available', 'still have', 'in stock', 'sold', 'buy', 'purchase', 'get')),
+    ('location_inquiry', 0.7, ('pickup', 'location', 'where', 'address', 'meet', 'come')),
+    ('condition_inquiry', 0.7, ('condition', 'quality', 'new', 'used', 'broken', 'work', 'function')),
+    ('initial_contact', 0.6, ('hi', 'hello', 'hey', 'interested', 'want', 'like')),
+)
+
+# Keyword -> index of the first category listing it
+_KEYWORD_RANKS = {}
+for _rank, (_, _, _keywords) in enumerate(MESSAGE_CLASSIFIERS):
+    for _keyword in _keywords:
+        _KEYWORD_RANKS.setdefault(_keyword, _rank)
+
+# All keywords compiled into one pattern. The lookahead yields a match at every
+# position (so overlapping keywords are not skipped), and alternatives are in
+# priority order so each position reports its highest-priority keyword.
+_CLASSIFIER_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in _KEYWORD_RANKS) + '))'
+)
+
+def classify_text(message_text):
+    """
+    Classify message text by its keywords.
+    
+    Args:
+        message_text: Raw message text
+        
+    Returns:
+        (message_type, confidence) tuple
+    """
+    text = message_text.lower()
+    
+    # One scan of the text finds the highest-priority keyword category
+    best = None
+    for match in _CLASSIFIER_PATTERN.finditer(text):
+        rank = _KEYWORD_RANKS[match.group(1)]
+        if best is None or rank < best:
+            best = rank
+            if rank == 0:
+                break
+    
+    if best is None:
+        # Default to general inquiry
+        return 'general_inquiry', 0.5
+    message_type, confidence, _ = MESSAGE_CLASSIFIERS[best]
+    return message_type, confidence
+
+# Template placeholders look like {customer_name}
+_PLACEHOLDER_PATTERN = re.compile(r'\{(\w+)\}')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template_text):
+    """Split template text once into alternating literal and placeholder-name parts."""
+    return tuple(_PLACEHOLDER_PATTERN.split(template_text))
+
+
+def render_template_text(template_text, **values):
+    """
+    Render template text, substituting placeholders found in values.
+    
+    Placeholders without a value are left in place. The text is parsed once
+    per distinct template, so repeated renders only join the parts.
+    """
+    parts = _compile_template(template_text)
+    return ''.join(
+        part if i % 2 == 0 else (str(values[part]) if part in values else f'{{{part}}}')
+        for i, part in enumerate(parts)
+    )
+
 class Message(db.Model):
     __tablename__ = 'messages'
+    __table_args__ = (
+        # Unprocessed customer message lookups and counts
+        db.Index('ix_messages_customer_processed', 'is_from_customer', 'is_processed'),
+        # Analytics windows (customer messages in the last N days)
+        db.Index('ix_messages_customer_timestamp', 'is_from_customer', 'timestamp'),
+        # Covers the all-message time windows (overview, real-time activity),
+        # which count by these flags
+        db.Index(
+            'ix_messages_timestamp_flags',
+            'timestamp', 'is_from_customer', 'is_automated_response', 'is_processed'
+        ),
+        # A conversation's messages, and the orphaned-message check, which
+        # anti-joins on conversation_id from this index alone
+        db.Index('ix_messages_conversation', 'conversation_id'),
+        # Hourly analytics: customer messages in hour-of-day order, covering
+        # the window and the aggregated columns, so the GROUP BY reads this
+        # index alone with no per-row strftime or sort. The expression is
+        # what func.extract('hour', timestamp) compiles to on SQLite, and it
+        # must stay identical to it for the index to be used.
+        db.Index(
+            'ix_messages_customer_hour',
+            db.text("CAST(STRFTIME('%H', timestamp) AS INTEGER)"),
+            'timestamp', 'processing_time_seconds', 'response_sent',
+            sqlite_where=db.text('is_from_customer = 1')
+        ),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     conversation_id = db.Column(db.Integer, db.ForeignKey('conversations.id'), nullable=False)
@@ -61,46 +162,7 @@ class Message(db.Model):
     
     def classify_message(self):
         """Classify the message type based on content"""
-        text = self.message_text.lower()
-        
-        # Price-related keywords
-        price_keywords = ['price', 'cost', 'how much', 'expensive', 'cheap', 'dollar', '$', 'money', 'pay']
-        if any(keyword in text for keyword in price_keywords):
-            self.message_type = 'price_inquiry'
-            self.classification_confidence = 0.8
-            return
-        
-        # Availability keywords
-        availability_keywords = ['available', 'still have', 'in stock', 'sold', 'buy', 'purchase', 'get']
-        if any(keyword in text for keyword in availability_keywords):
-            self.message_type = 'availability_check'
-            self.classification_confidence = 0.8
-            return
-        
-        # Location/pickup keywords
-        location_keywords = ['pickup', 'location', 'where', 'address', 'meet', 'come']
-        if any(keyword in text for keyword in location_keywords):
-            self.message_type = 'location_inquiry'
-            self.classification_confidence = 0.7
-            return
-        
-        # Condition/details keywords
-        condition_keywords = ['condition', 'quality', 'new', 'used', 'broken', 'work', 'function']
-        if any(keyword in text for keyword in condition_keywords):
-            self.message_type = 'condition_inquiry'
-            self.classification_confidence = 0.7
-            return
-        
-        # Greeting/initial contact
-        greeting_keywords = ['hi', 'hello', 'hey', 'interested', 'want', 'like']
-        if any(keyword in text for keyword in greeting_keywords):
-            self.message_type = 'initial_contact'
-            self.classification_confidence = 0.6
-            return
-        
-        # Default to general inquiry
-        self.message_type = 'general_inquiry'
-        self.classification_confidence = 0.5
+        self.message_type, self.classification_confidence = classify_text(self.message_text)
     
     def mark_processed(self, template_used=None, response_generated=None, processing_time=None):
         """Mark message as processed"""
@@ -162,10 +224,7 @@ class MessageTemplate(db.Model):
     
     def render(self, **kwargs):
         """Render template with provided variables"""
-        template_text = self.template_text
-        for key, value in kwargs.items():
-            template_text = template_text.replace(f'{{{key}}}', str(value))
-        return template_text
+        return render_template_text(self.template_text, **kwargs)
     
     def increment_usage(self):
         """Increment usage count"""
@@ -1,7 +1,7 @@
 from flask import Blueprint, request, jsonify
 from src.models import db, FacebookAccount, Conversation, Message, MessageTemplate, AutomationRun, SystemMetric, ValidationLog
 from datetime import datetime, timedelta
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, case
 
 analytics_bp = Blueprint('analytics', __name__)
 
@@ -132,8 +132,8 @@ def get_message_classification_stats(filters):
     
     templates = template_query.all()
     
-    # Calculate processing accuracy
-    processed_messages = db.session.query(Message).filter(
+    # Calculate processing accuracy (only counted, so no message columns are loaded)
+    processed_messages = db.session.query(Message.id).filter(
         Message.is_from_customer == True,
         Message.is_processed == True
     )
@@ -204,21 +204,44 @@ def get_account_performance(filters):
     
     accounts = query.group_by(FacebookAccount.id).all()
     
+    # Aggregate each account's 50 most recent runs in the database in one
+    # grouped query, instead of loading every account's runs into Python
+    run_rank = func.row_number().over(
+        partition_by=AutomationRun.facebook_account_id,
+        order_by=AutomationRun.start_time.desc()
+    ).label('run_rank')
+    recent_runs = db.session.query(
+        AutomationRun.facebook_account_id,
+        AutomationRun.status,
+        AutomationRun.messages_processed,
+        AutomationRun.responses_sent,
+        AutomationRun.duration_seconds,
+        run_rank
+    )
+    if filters.get('date_from'):
+        recent_runs = recent_runs.filter(AutomationRun.start_time >= datetime.fromisoformat(filters['date_from']))
+    recent_runs = recent_runs.subquery()
+    
+    run_stats = {
+        row.facebook_account_id: row for row in db.session.query(
+            recent_runs.c.facebook_account_id,
+            func.count().label('total_runs'),
+            func.sum(case((recent_runs.c.status == 'completed', 1), else_=0)).label('successful_runs'),
+            func.coalesce(func.sum(recent_runs.c.messages_processed), 0).label('total_messages_processed'),
+            func.coalesce(func.sum(recent_runs.c.responses_sent), 0).label('total_responses_sent'),
+            func.avg(func.coalesce(recent_runs.c.duration_seconds, 0)).label('avg_duration')
+        ).filter(recent_runs.c.run_rank <= 50).group_by(recent_runs.c.facebook_account_id)
+    }
+    
     # Get detailed automation stats for each account
     account_details = []
     for account in accounts:
-        # Get recent automation runs
-        recent_runs = AutomationRun.query.filter_by(facebook_account_id=account.id)
-        
-        if filters.get('date_from'):
-            recent_runs = recent_runs.filter(AutomationRun.start_time >= datetime.fromisoformat(filters['date_from']))
-        
-        runs = recent_runs.order_by(AutomationRun.start_time.desc()).limit(50).all()
-        
-        successful_runs = len([r for r in runs if r.status == 'completed'])
-        total_messages_processed = sum(r.messages_processed for r in runs)
-        total_responses_sent = sum(r.responses_sent for r in runs)
-        avg_duration = sum(r.duration_seconds or 0 for r in runs) / len(runs) if runs else 0
+        stats = run_stats.get(account.id)
+        total_runs = stats.total_runs if stats else 0
+        successful_runs = stats.successful_runs if stats else 0
+        total_messages_processed = stats.total_messages_processed if stats else 0
+        total_responses_sent = stats.total_responses_sent if stats else 0
+        avg_duration = stats.avg_duration if stats else 0
         
         account_details.append({
             'id': account.id,
@@ -231,9 +254,9 @@ def get_account_performance(filters):
             'last_used': account.last_used.isoformat() if account.last_used else None,
             'total_conversations': account.total_conversations,
             'automation_stats': {
-                'total_runs': len(runs),
+                'total_runs': total_runs,
                 'successful_runs': successful_runs,
-                'success_rate': (successful_runs / len(runs) * 100) if runs else 0,
+                'success_rate': (successful_runs / total_runs * 100) if total_runs else 0,
                 'total_messages_processed': total_messages_processed,
                 'total_responses_sent': total_responses_sent,
                 'avg_duration_seconds': avg_duration,
@@ -1,4 +1,6 @@
 from flask import Blueprint, request, jsonify
+from sqlalchemy import func, case, and_
+from sqlalchemy.orm import selectinload
 from src.models import db, FacebookAccount, Conversation, Message, AutomationRun
 from src.services.automation_service import AutomationService
 from datetime import datetime, timedelta
@@ -23,7 +25,7 @@ def get_accounts():
 def get_account(account_id):
     """Get specific account details"""
     try:
-        account = FacebookAccount.query.get(account_id)
+        account = db.session.get(FacebookAccount, account_id)
         if not account:
             return jsonify({'success': False, 'error': 'Account not found'}), 404
         
@@ -115,7 +117,7 @@ def get_conversation_messages(conversation_id):
         limit = request.args.get('limit', 100, type=int)
         offset = request.args.get('offset', 0, type=int)
         
-        conversation = Conversation.query.get(conversation_id)
+        conversation = db.session.get(Conversation, conversation_id)
         if not conversation:
             return jsonify({'success': False, 'error': 'Conversation not found'}), 404
         
@@ -147,7 +149,8 @@ def get_unprocessed_messages():
             # Join with conversations to filter by account
             query = query.join(Conversation).filter(Conversation.facebook_account_id == account_id)
         
-        messages = query.order_by(Message.timestamp.desc()).limit(limit).all()
+        # Conversations are loaded in one batched IN query rather than lazily per message
+        messages = query.options(selectinload(Message.conversation)).order_by(Message.timestamp.desc()).limit(limit).all()
         
         # Include conversation details
         result_messages = []
@@ -196,47 +199,58 @@ def get_recent_runs():
 def get_dashboard_stats():
     """Get comprehensive dashboard statistics"""
     try:
-        # Account statistics
-        total_accounts = FacebookAccount.query.count()
-        active_accounts = FacebookAccount.query.filter_by(is_active=True, is_locked=False).count()
-        locked_accounts = FacebookAccount.query.filter_by(is_locked=True).count()
+        since_24h = datetime.utcnow() - timedelta(hours=24)
         
-        # Conversation statistics
-        total_conversations = Conversation.query.count()
-        active_conversations = Conversation.query.filter_by(status='active').count()
+        # Account statistics (one pass over accounts)
+        account_stats = db.session.query(
+            func.count(FacebookAccount.id),
+            func.sum(case((and_(FacebookAccount.is_active == True, FacebookAccount.is_locked == False), 1), else_=0)),
+            func.sum(case((FacebookAccount.is_locked == True, 1), else_=0))
+        ).one()
+        total_accounts = account_stats[0]
+        active_accounts = account_stats[1] or 0
+        locked_accounts = account_stats[2] or 0
         
-        # Message statistics
-        total_messages = Message.query.count()
-        customer_messages = Message.query.filter_by(is_from_customer=True).count()
-        bot_responses = Message.query.filter_by(is_from_customer=False).count()
-        unprocessed_messages = Message.query.filter_by(is_from_customer=True, is_processed=False).count()
+        # Conversation statistics and average response time of recently updated conversations
+        conversation_stats = db.session.query(
+            func.count(Conversation.id),
+            func.sum(case((Conversation.status == 'active', 1), else_=0)),
+            func.avg(case((and_(Conversation.updated_at >= since_24h,
+                                Conversation.response_time_avg_minutes != 0),
+                           Conversation.response_time_avg_minutes)))
+        ).one()
+        total_conversations = conversation_stats[0]
+        active_conversations = conversation_stats[1] or 0
+        avg_response_time = conversation_stats[2] or 0
+        
+        # Message statistics (one pass over messages)
+        message_stats = db.session.query(
+            func.count(Message.id),
+            func.sum(case((Message.is_from_customer == True, 1), else_=0)),
+            func.sum(case((and_(Message.is_from_customer == True, Message.is_processed == False), 1), else_=0)),
+            func.sum(case((and_(Message.is_from_customer == True, Message.is_processed == True), 1), else_=0)),
+            func.sum(case((and_(Message.is_from_customer == True, Message.timestamp >= since_24h), 1), else_=0))
+        ).one()
+        total_messages = message_stats[0]
+        customer_messages = message_stats[1] or 0
+        bot_responses = total_messages - customer_messages
+        unprocessed_messages = message_stats[2] or 0
+        processed_customer_messages = message_stats[3] or 0
+        recent_messages = message_stats[4] or 0
         
         # Response rate
-        processed_customer_messages = Message.query.filter_by(is_from_customer=True, is_processed=True).count()
         response_rate = (processed_customer_messages / customer_messages * 100) if customer_messages > 0 else 0
         
-        # Recent automation runs (last 24 hours)
-        recent_runs = AutomationRun.query.filter(
-            AutomationRun.start_time >= datetime.utcnow() - timedelta(hours=24)
-        ).all()
-        
-        successful_runs = len([r for r in recent_runs if r.status == 'completed'])
-        failed_runs = len([r for r in recent_runs if r.status == 'failed'])
-        automation_success_rate = (successful_runs / len(recent_runs) * 100) if recent_runs else 100
-        
-        # Average response time (last 24 hours)
-        recent_conversations = Conversation.query.filter(
-            Conversation.updated_at >= datetime.utcnow() - timedelta(hours=24)
-        ).all()
-        
-        response_times = [c.response_time_avg_minutes for c in recent_conversations if c.response_time_avg_minutes]
-        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
-        
-        # Messages processed in last 24 hours
-        recent_messages = Message.query.filter(
-            Message.timestamp >= datetime.utcnow() - timedelta(hours=24),
-            Message.is_from_customer == True
-        ).count()
+        # Recent automation runs (last 24 hours), counted in the database
+        run_stats = db.session.query(
+            func.count(AutomationRun.id),
+            func.sum(case((AutomationRun.status == 'completed', 1), else_=0)),
+            func.sum(case((AutomationRun.status == 'failed', 1), else_=0))
+        ).filter(AutomationRun.start_time >= since_24h).one()
+        recent_run_count = run_stats[0]
+        successful_runs = run_stats[1] or 0
+        failed_runs = run_stats[2] or 0
+        automation_success_rate = (successful_runs / recent_run_count * 100) if recent_run_count else 100
         
         return jsonify({
             'success': True,
@@ -261,7 +275,7 @@ def get_dashboard_stats():
                     'recent_24h': recent_messages
                 },
                 'automation': {
-                    'recent_runs': len(recent_runs),
+                    'recent_runs': recent_run_count,
                     'successful_runs': successful_runs,
                     'failed_runs': failed_runs,
                     'success_rate': automation_success_rate,
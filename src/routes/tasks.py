@@ -446,8 +446,7 @@ def bulk_operations():
                     success = task_manager.retry_task(task.id)
                 elif operation == 'delete':
                     # Remove task from manager (only if not running)
-                    if task.status not in [TaskStatus.RUNNING, TaskStatus.QUEUED]:
-                        task_manager.tasks.pop(task.id, None)
+                    if task_manager.remove_task(task.id):
                         success = True
                     else:
                         success = False
@@ -551,7 +550,8 @@ def get_manager_status():
             'is_running': task_manager.is_running,
             'max_workers': task_manager.max_workers,
             'active_tasks': len(task_manager.running_tasks),
-            'queued_tasks': task_manager.task_queue.qsize(),
+            'queued_tasks': task_manager.queued_count(),
+            'queues': task_manager.get_queue_stats(),
             'total_tasks': len(task_manager.tasks),
             'metrics': task_manager.get_metrics()
         }
@@ -1,12 +1,121 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
 from src.services.validation_service import ValidationService
 from src.services.task_manager import get_task_manager, TaskPriority
+from src.services.cache import TTLCache
+import heapq
 from datetime import datetime
+from typing import List, Literal
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 validation_bp = Blueprint('validation', __name__)
 validation_service = ValidationService()
 task_manager = get_task_manager()
 
+# Full validation runs are expensive; reuse a recent result across endpoints.
+# Validation results may be up to a minute old, so the dashboard's 30-second
+# refresh only triggers a new run every other time. The cache is per process,
+# so each worker process keeps its own snapshot; responses carry validated_at
+# so clients can tell how old the results are.
+VALIDATION_CACHE_TTL = 60
+validation_cache = TTLCache(ttl=VALIDATION_CACHE_TTL)
+
+def _is_validation_result(value):
+    """Check that a cached object has the shape returned by validate_all_systems."""
+    return isinstance(value, dict) and isinstance(value.get('validations'), dict)
+
+def _run_all_validations():
+    """Run the full validation suite and cache each domain's sub-result for the per-domain endpoints."""
+    result = validation_service.validate_all_systems()
+    for domain, domain_result in result.get('validations', {}).items():
+        validation_cache.set(domain, (result['timestamp'], domain_result))
+    return result
+
+def _get_validation_result(force_refresh=False):
+    """
+    Return the full system validation result, reusing a cached run when fresh.
+    
+    Args:
+        force_refresh: Run the validation even if a cached result is available
+        
+    Returns:
+        Result of ValidationService.validate_all_systems
+    """
+    return validation_cache.get_or_compute(
+        'all_systems',
+        _run_all_validations,
+        force_refresh=force_refresh,
+        validator=_is_validation_result
+    )
+
+def _get_domain_result(domain, validator):
+    """
+    Return a single validation domain's result from the cache.
+    
+    Domains are populated by any recent full run; the individual validator
+    only runs when nothing fresh is cached for that domain.
+    
+    Returns:
+        (validated_at, result): when the result was computed (ISO format) and the result
+    """
+    return validation_cache.get_or_compute(domain, lambda: (datetime.utcnow().isoformat(), validator()))
+
+class ValidationReportRequest(BaseModel):
+    """Request body for /validation-report."""
+    model_config = ConfigDict(extra='ignore')
+    
+    report_type: Literal['summary', 'detailed', 'full'] = 'summary'
+    include_history: bool = False
+
+class FixIssuesRequest(BaseModel):
+    """Request body for /fix-issues."""
+    model_config = ConfigDict(extra='ignore')
+    
+    issue_types: List[str] = []
+    dry_run: bool = True
+
+def _parse_body(model):
+    """Decode and validate the raw request body against a pydantic model in one pass."""
+    raw = request.get_data(cache=False)
+    if not raw.strip():
+        return model()
+    return model.model_validate_json(raw)
+
+def _iter_json(value, dumps, depth):
+    """
+    Yield the JSON encoding of a value in chunks.
+    
+    Dicts and lists are descended into up to ``depth`` levels so that large
+    nested payloads are serialized piece by piece instead of as one buffer.
+    """
+    if depth and isinstance(value, dict):
+        yield '{'
+        for index, (key, item) in enumerate(value.items()):
+            yield f'{"," if index else ""}{dumps(str(key))}:'
+            yield from _iter_json(item, dumps, depth - 1)
+        yield '}'
+    elif depth and isinstance(value, list):
+        yield '['
+        for index, item in enumerate(value):
+            if index:
+                yield ','
+            yield from _iter_json(item, dumps, depth - 1)
+        yield ']'
+    else:
+        yield dumps(value)
+
+def _stream_json_response(payload, depth=3):
+    """
+    Return a streamed application/json response for a (potentially large) payload.
+    
+    The payload must already be built: the response has been started by the
+    time the stream is consumed, so errors raised while producing values
+    there can no longer become an error response.
+    """
+    return Response(
+        stream_with_context(_iter_json(payload, current_app.json.dumps, depth)),
+        mimetype='application/json'
+    )
+
 @validation_bp.route('/run-full-validation', methods=['POST'])
 def run_full_validation():
     """
@@ -21,7 +130,8 @@ def run_full_validation():
             name="Full System Validation",
             task_type="validate_system",
             priority=TaskPriority.HIGH,
-            metadata={'requested_by': 'api', 'validation_type': 'full'}
+            metadata={'requested_by': 'api', 'validation_type': 'full'},
+            queue='validation'
         )
         
         return jsonify({
@@ -45,14 +155,17 @@ def run_quick_validation():
     
     Returns:
         JSON response with validation results
+        (reused for up to VALIDATION_CACHE_TTL seconds; validated_at is when
+        they were computed)
     """
     try:
         # Run basic validation checks synchronously
-        validation_result = validation_service.validate_all_systems()
+        validation_result = _get_validation_result()
         
         return jsonify({
             'success': True,
             'validation_result': validation_result,
+            'validated_at': validation_result['timestamp'],
             'timestamp': datetime.utcnow().isoformat()
         })
         
@@ -70,13 +183,16 @@ def check_database_integrity():
     
     Returns:
         JSON response with database validation results
+        (reused for up to VALIDATION_CACHE_TTL seconds; validated_at is when
+        they were computed)
     """
     try:
-        integrity_result = validation_service.validate_database_integrity()
+        validated_at, integrity_result = _get_domain_result('database', validation_service.validate_database_integrity)
         
         return jsonify({
             'success': True,
             'database_integrity': integrity_result,
+            'validated_at': validated_at,
             'timestamp': datetime.utcnow().isoformat()
         })
         
@@ -94,13 +210,16 @@ def check_data_quality():
     
     Returns:
         JSON response with data quality results
+        (reused for up to VALIDATION_CACHE_TTL seconds; validated_at is when
+        they were computed)
     """
     try:
-        quality_result = validation_service.validate_data_quality()
+        validated_at, quality_result = _get_domain_result('data_quality', validation_service.validate_data_quality)
         
         return jsonify({
             'success': True,
             'data_quality': quality_result,
+            'validated_at': validated_at,
             'timestamp': datetime.utcnow().isoformat()
         })
         
@@ -118,13 +237,16 @@ def check_business_logic():
     
     Returns:
         JSON response with business logic validation results
+        (reused for up to VALIDATION_CACHE_TTL seconds; validated_at is when
+        they were computed)
     """
     try:
-        logic_result = validation_service.validate_business_logic()
+        validated_at, logic_result = _get_domain_result('business_logic', validation_service.validate_business_logic)
         
         return jsonify({
             'success': True,
             'business_logic': logic_result,
+            'validated_at': validated_at,
             'timestamp': datetime.utcnow().isoformat()
         })
         
@@ -142,13 +264,16 @@ def check_performance():
     
     Returns:
         JSON response with performance validation results
+        (reused for up to VALIDATION_CACHE_TTL seconds; validated_at is when
+        they were computed)
     """
     try:
-        performance_result = validation_service.validate_system_performance()
+        validated_at, performance_result = _get_domain_result('performance', validation_service.validate_system_performance)
         
         return jsonify({
             'success': True,
             'performance': performance_result,
+            'validated_at': validated_at,
             'timestamp': datetime.utcnow().isoformat()
         })
         
@@ -166,13 +291,16 @@ def check_security():
     
     Returns:
         JSON response with security validation results
+        (reused for up to VALIDATION_CACHE_TTL seconds; validated_at is when
+        they were computed)
     """
     try:
-        security_result = validation_service.validate_security_measures()
+        validated_at, security_result = _get_domain_result('security', validation_service.validate_security_measures)
         
         return jsonify({
             'success': True,
             'security': security_result,
+            'validated_at': validated_at,
             'timestamp': datetime.utcnow().isoformat()
         })
         
@@ -190,13 +318,16 @@ def check_system_health():
     
     Returns:
         JSON response with system health validation results
+        (reused for up to VALIDATION_CACHE_TTL seconds; validated_at is when
+        they were computed)
     """
     try:
-        health_result = validation_service.validate_system_health()
+        validated_at, health_result = _get_domain_result('system_health', validation_service.validate_system_health)
         
         return jsonify({
             'success': True,
             'system_health': health_result,
+            'validated_at': validated_at,
             'timestamp': datetime.utcnow().isoformat()
         })
         
@@ -221,22 +352,18 @@ def get_validation_history():
     try:
         limit = request.args.get('limit', 20, type=int)
         
-        # Get validation tasks from task manager
-        validation_tasks = task_manager.get_tasks_by_type('validate_system')
-        
-        # Sort by creation time and limit
-        validation_tasks.sort(key=lambda t: t.created_at, reverse=True)
-        validation_tasks = validation_tasks[:limit]
-        
-        # Convert to serializable format
-        history = []
-        for task in validation_tasks:
-            task_data = task.to_dict()
-            history.append(task_data)
+        # Get the most recent validation tasks without sorting the whole history
+        validation_tasks = heapq.nlargest(
+            limit,
+            task_manager.get_tasks_by_type('validate_system'),
+            key=lambda t: t.created_at
+        )
         
-        return jsonify({
+        # Convert the tasks here so a failure is still reported as a 500;
+        # only their serialization is streamed
+        return _stream_json_response({
             'success': True,
-            'validation_history': history,
+            'validation_history': [task.to_dict() for task in validation_tasks],
             'total_count': len(validation_tasks),
             'timestamp': datetime.utcnow().isoformat()
         })
@@ -261,12 +388,12 @@ def generate_validation_report():
         JSON response with validation report
     """
     try:
-        data = request.get_json() or {}
-        report_type = data.get('report_type', 'summary')
-        include_history = data.get('include_history', False)
+        body = _parse_body(ValidationReportRequest)
+        report_type = body.report_type
+        include_history = body.include_history
         
         # Run current validation
-        current_validation = validation_service.validate_all_systems()
+        current_validation = _get_validation_result()
         
         report = {
             'report_type': report_type,
@@ -300,12 +427,19 @@ def generate_validation_report():
             query_engine = QueryEngine()
             report['system_overview'] = query_engine.get_system_overview()
         
-        return jsonify({
+        # Full reports can run to megabytes; stream them key by key
+        return _stream_json_response({
             'success': True,
             'report': report,
             'timestamp': datetime.utcnow().isoformat()
         })
         
+    except ValidationError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'timestamp': datetime.utcnow().isoformat()
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -323,12 +457,14 @@ def fix_validation_issues():
         dry_run: Whether to perform a dry run (default: true)
         
     Returns:
-        JSON response with fix results
+        JSON response with fix results; a dry run may use validation results
+        up to VALIDATION_CACHE_TTL seconds old (validated_at is when they
+        were computed)
     """
     try:
-        data = request.get_json() or {}
-        issue_types = data.get('issue_types', [])
-        dry_run = data.get('dry_run', True)
+        body = _parse_body(FixIssuesRequest)
+        issue_types_set = frozenset(body.issue_types) if body.issue_types else None
+        dry_run = body.dry_run
         
         fix_results = {
             'dry_run': dry_run,
@@ -337,19 +473,18 @@ def fix_validation_issues():
             'recommendations': []
         }
         
-        # Run validation to identify issues
-        validation_result = validation_service.validate_all_systems()
+        # Run validation to identify issues; dry-run previews may reuse a cached run
+        validation_result = _get_validation_result(force_refresh=not dry_run)
         
-        # Collect all errors and warnings
+        # Collect all errors and warnings, filtered by requested issue types if specified
         all_issues = []
         for validation_type, results in validation_result['validations'].items():
-            all_issues.extend(results.get('errors', []))
-            all_issues.extend(results.get('warnings', []))
-        
-        # Filter by requested issue types if specified
-        if issue_types:
-            all_issues = [issue for issue in all_issues if issue.get('type') in issue_types]
-        
+            for key in ('errors', 'warnings'):
+                for issue in results.get(key, []):
+                    if issue_types_set and issue.get('type') not in issue_types_set:
+                        continue
+                    all_issues.append(issue)
+
         # Attempt to fix issues
         for issue in all_issues:
             issue_type = issue.get('type')
@@ -387,13 +522,24 @@ def fix_validation_issues():
                     'recommended_action': 'manual_investigation_required'
                 })
         
+        if fix_results['fixes_applied']:
+            # Drop the full and per-domain results that still report the fixed issues
+            validation_cache.invalidate()
+        
         return jsonify({
             'success': True,
             'fix_results': fix_results,
             'total_issues_found': len(all_issues),
+            'validated_at': validation_result['timestamp'],
             'timestamp': datetime.utcnow().isoformat()
         })
         
+    except ValidationError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'timestamp': datetime.utcnow().isoformat()
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
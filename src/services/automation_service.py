@@ -1,16 +1,108 @@
 import asyncio
+import functools
 import os
+import threading
+from collections import Counter
 from datetime import datetime
+from flask import current_app
+from sqlalchemy import case, event, func, update
 from src.models import db, FacebookAccount, Conversation, Message, MessageTemplate, AutomationRun
+from src.models.message import render_template_text
 from src.services.browser_service import BrowserService
 
+
+@functools.lru_cache(maxsize=64)
+def _template_for(message_type):
+    """
+    Get the active template for a message type as (template_id, template_text).
+    
+    Templates rarely change, so lookups are cached across cycles; plain values
+    are cached rather than ORM rows so they stay valid outside any session.
+    Returns None when no active template exists for the type.
+    """
+    template = MessageTemplate.query.filter_by(
+        message_type=message_type, is_active=True
+    ).order_by(MessageTemplate.id).first()
+    return (template.id, template.template_text) if template else None
+
+
+@event.listens_for(MessageTemplate, 'after_insert')
+@event.listens_for(MessageTemplate, 'after_update')
+@event.listens_for(MessageTemplate, 'after_delete')
+def _invalidate_template_cache(mapper, connection, target):
+    """Drop cached template lookups whenever a template row changes."""
+    _template_for.cache_clear()
+
 class AutomationService:
+    # Accounts are independent, so run_all_accounts processes up to this many at once
+    MAX_PARALLEL_ACCOUNTS = 4
+
+    # One long-lived event loop, shared by all service instances and run on a
+    # background thread, instead of a fresh loop per asyncio.run call
+    _loop = None
+    _loop_lock = threading.Lock()
+
     def __init__(self):
         self.current_run = None
 
+    @classmethod
+    def _get_loop(cls):
+        """Get the shared automation event loop, starting its thread on first use."""
+        with cls._loop_lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='automation-loop', daemon=True).start()
+                cls._loop = loop
+        return cls._loop
+
+    def _run_in_loop(self, coro):
+        """
+        Run a coroutine on the shared event loop and wait for its result.
+        
+        The coroutine runs inside its own app context (and so its own session),
+        since the loop thread has none of its own.
+        """
+        app = current_app._get_current_object()
+
+        async def runner():
+            with app.app_context():
+                return await coro
+
+        return asyncio.run_coroutine_threadsafe(runner(), self._get_loop()).result()
+
     def run_automation_cycle(self, account_id):
         """Run a complete automation cycle for an account using browser automation."""
-        account = FacebookAccount.query.get(account_id)
+        # Run the entire browser automation on the shared event loop
+        return self._run_in_loop(self.run_automation_cycle_async(account_id))
+
+    async def run_automation_cycle_async(self, account_id, browser=None):
+        """
+        Async form of run_automation_cycle.
+        
+        The cycle runs in a fresh context on the given Playwright browser, or
+        on the process-wide shared browser when none is given.
+        """
+        # Blocking database work runs on a worker thread (sharing this
+        # coroutine's app context and session) so the shared loop keeps
+        # driving other accounts' browser I/O in the meantime
+        account = await asyncio.to_thread(self._begin_run, account_id)
+
+        try:
+            await self.async_automation_wrapper(account, browser)
+
+            summary = await asyncio.to_thread(self._finish_run, account, True)
+            return {
+                'success': True,
+                'run_id': self.current_run.id,
+                'summary': summary
+            }
+        except Exception as e:
+            await asyncio.to_thread(self._finish_run, account, False, str(e))
+            raise
+
+    def _begin_run(self, account_id):
+        """Load and check the account, then record a new running AutomationRun for it."""
+        account = db.session.get(FacebookAccount, account_id)
         if not account:
             raise ValueError(f"Account {account_id} not found")
 
@@ -24,41 +116,37 @@ class AutomationService:
         )
         self.current_run.start_run()
         db.session.add(self.current_run)
+        # Committed rather than just flushed: an open write transaction would
+        # hold SQLite's write lock for the whole browser cycle, stalling the
+        # other accounts' runs. Everything else is committed once in _finish_run.
         db.session.commit()
+        return account
 
-        try:
-            # Run the entire browser automation within a single event loop
-            asyncio.run(self.async_automation_wrapper(account))
-
+    def _finish_run(self, account, success, error=None):
+        """Complete or fail the current run, record the login outcome and return the run summary."""
+        if success:
             self.current_run.complete_run()
-            account.record_login_attempt(success=True)
-            db.session.commit()
+        else:
+            self.current_run.fail_run(error)
+        account.record_login_attempt(success=success)
+        db.session.commit()
 
-            return {
-                'success': True,
-                'run_id': self.current_run.id,
-                'summary': {
-                    'conversations_checked': self.current_run.conversations_checked,
-                    'new_messages_found': self.current_run.new_messages_found,
-                    'messages_processed': self.current_run.messages_processed,
-                    'responses_sent': self.current_run.responses_sent,
-                    'duration_seconds': self.current_run.duration_seconds
-                }
-            }
-        except Exception as e:
-            self.current_run.fail_run(str(e))
-            account.record_login_attempt(success=False)
-            db.session.commit()
-            raise
+        return {
+            'conversations_checked': self.current_run.conversations_checked,
+            'new_messages_found': self.current_run.new_messages_found,
+            'messages_processed': self.current_run.messages_processed,
+            'responses_sent': self.current_run.responses_sent,
+            'duration_seconds': self.current_run.duration_seconds
+        }
 
-    async def async_automation_wrapper(self, account: FacebookAccount):
+    async def async_automation_wrapper(self, account: FacebookAccount, browser=None):
         """
         A wrapper to run the entire browser automation lifecycle in a single async context.
         """
         user_data_dir = os.path.join('browser_data', f'account_{account.id}')
         os.makedirs(user_data_dir, exist_ok=True)
         
-        browser_service = BrowserService(user_data_dir, persistent=False)
+        browser_service = BrowserService(user_data_dir, persistent=False, browser=browser)
 
         try:
             await browser_service.start()
@@ -73,65 +161,93 @@ class AutomationService:
             else:
                 print(f"Found {len(unanswered_conversations)} unanswered conversations. Processing...")
                 
-                for conversation in unanswered_conversations:
-                    message_text = conversation.get("last_message_text")
-                    if not message_text:
-                        print(f"Skipping conversation {conversation.get('conversation_id')} due to empty message text.")
-                        continue
-
-                    # Create a temporary message object to use the classification logic
-                    temp_message = Message(message_text=message_text)
-                    temp_message.classify_message()
-                    
-                    message_type = temp_message.message_type
-                    print(f"Message classified as: {message_type}")
-                    
-                    # Find a template for this message type
-                    template = MessageTemplate.query.filter_by(message_type=message_type, is_active=True).first()
-                    
-                    if template:
-                        # For now, we don't have the variables to render the template fully.
-                        # We will just use the raw template text.
-                        # In a real scenario, we would get customer_name, item_name, etc.
-                        reply_text = template.template_text
-
-                        # A simple substitution for now
-                        if '{customer_name}' in reply_text:
-                            reply_text = reply_text.replace('{customer_name}', 'there')
-
-                        await browser_service.send_reply(conversation, reply_text)
-
-                        # Update run stats
-                        if self.current_run:
-                            self.current_run.messages_processed += 1
-                            self.current_run.responses_sent += 1
-                    else:
-                        print(f"No active template found for message type: {message_type}")
+                # Tallied locally and written once after the loop
+                replies_sent = 0
+                template_usage = Counter()
+                
+                try:
+                    for conversation in unanswered_conversations:
+                        message_text = conversation.get("last_message_text")
+                        if not message_text:
+                            print(f"Skipping conversation {conversation.get('conversation_id')} due to empty message text.")
+                            continue
+
+                        # Create a temporary message object to use the classification logic
+                        temp_message = Message(message_text=message_text)
+                        temp_message.classify_message()
+                        
+                        message_type = temp_message.message_type
+                        print(f"Message classified as: {message_type}")
+                        
+                        # Find a template for this message type
+                        template = await asyncio.to_thread(_template_for, message_type)
+                        
+                        if template:
+                            # For now, we don't have the variables to render the template fully.
+                            # We will just use the raw template text.
+                            # In a real scenario, we would get customer_name, item_name, etc.
+                            template_id, template_text = template
+
+                            # A simple substitution for now
+                            reply_text = render_template_text(template_text, customer_name='there')
+
+                            await browser_service.send_reply(conversation, reply_text)
+
+                            replies_sent += 1
+                            template_usage[template_id] += 1
+                        else:
+                            print(f"No active template found for message type: {message_type}")
+                finally:
+                    # Update run stats and template usage in one go, even if a reply failed midway
+                    if self.current_run:
+                        self.current_run.messages_processed += replies_sent
+                        self.current_run.responses_sent += replies_sent
+                    if template_usage:
+                        await asyncio.to_thread(self._record_template_usage, template_usage)
 
             await browser_service.logout()
         finally:
             await browser_service.close()
 
+    def _record_template_usage(self, template_usage):
+        """Apply per-template usage increments with one UPDATE per template."""
+        now = datetime.utcnow()
+        for template_id, count in template_usage.items():
+            db.session.execute(
+                update(MessageTemplate)
+                .where(MessageTemplate.id == template_id)
+                .values(usage_count=MessageTemplate.usage_count + count, updated_at=now)
+            )
+
     def run_all_accounts(self):
         """Run automation for all active accounts"""
         accounts = FacebookAccount.query.filter_by(is_active=True, is_locked=False).all()
         
+        outcomes = {}
+        if accounts:
+            app = current_app._get_current_object()
+            workers = min(len(accounts), self.MAX_PARALLEL_ACCOUNTS)
+            # One concurrent batch per worker, all sharing the process-wide browser
+            batches = [[account.id for account in accounts[i::workers]] for i in range(workers)]
+            for batch_outcomes in self._run_in_loop(self._run_account_batches(app, batches)):
+                outcomes.update(batch_outcomes)
+        
         results = []
         for account in accounts:
-            try:
-                result = self.run_automation_cycle(account.id)
+            outcome = outcomes[account.id]
+            if isinstance(outcome, Exception):
                 results.append({
                     'account_id': account.id,
                     'account_name': account.display_name,
-                    'success': True,
-                    'summary': result['summary']
+                    'success': False,
+                    'error': str(outcome)
                 })
-            except Exception as e:
+            else:
                 results.append({
                     'account_id': account.id,
                     'account_name': account.display_name,
-                    'success': False,
-                    'error': str(e)
+                    'success': True,
+                    'summary': outcome['summary']
                 })
         
         return {
@@ -141,15 +257,64 @@ class AutomationService:
             'results': results
         }
 
+    async def _run_account_batches(self, app, batches):
+        """Run account batches concurrently on the event loop."""
+        return await asyncio.gather(*(self._run_account_batch(app, batch) for batch in batches))
+
+    @staticmethod
+    async def _run_account_batch(app, account_ids):
+        """
+        Run a batch of accounts' cycles.
+        
+        Each batch gets its own app context (and therefore its own scoped
+        session and pooled connection, released when the context ends) and its
+        own service instance, since current_run is per-cycle state.
+        
+        Returns a dict of account_id -> cycle result or the exception raised.
+        """
+        with app.app_context():
+            return await AutomationService()._run_accounts(account_ids)
+
+    async def _run_accounts(self, account_ids):
+        """Run each account's cycle in turn; every cycle gets its own context on the shared browser."""
+        outcomes = {}
+        for account_id in account_ids:
+            try:
+                outcomes[account_id] = await self.run_automation_cycle_async(account_id)
+            except Exception as e:
+                outcomes[account_id] = e
+        return outcomes
+
     def get_automation_stats(self, account_id=None):
-        """Get automation statistics"""
-        query = AutomationRun.query
+        """
+        Get automation statistics.
+
+        All aggregation happens in SQL (func.count/sum/avg), leaving only a
+        few scalar divisions in Python. Don't JIT-compile this (e.g. numba):
+        there is no numeric loop to speed up, and object-mode fallback on the
+        ORM/dict code would only make it slower.
+        """
+        # Aggregate the 50 most recent runs in SQL rather than loading them
+        recent_runs = db.session.query(
+            AutomationRun.status,
+            AutomationRun.messages_processed,
+            AutomationRun.responses_sent,
+            AutomationRun.duration_seconds
+        )
         if account_id:
-            query = query.filter_by(facebook_account_id=account_id)
+            recent_runs = recent_runs.filter(AutomationRun.facebook_account_id == account_id)
+        recent_runs = recent_runs.order_by(AutomationRun.start_time.desc()).limit(50).subquery()
         
-        runs = query.order_by(AutomationRun.start_time.desc()).limit(50).all()
+        stats = db.session.query(
+            func.count().label('total_runs'),
+            func.sum(case((recent_runs.c.status == 'completed', 1), else_=0)).label('successful_runs'),
+            func.sum(case((recent_runs.c.status == 'failed', 1), else_=0)).label('failed_runs'),
+            func.sum(recent_runs.c.messages_processed).label('total_messages'),
+            func.sum(recent_runs.c.responses_sent).label('total_responses'),
+            func.avg(func.coalesce(recent_runs.c.duration_seconds, 0)).label('avg_duration')
+        ).one()
         
-        if not runs:
+        if not stats.total_runs:
             return {
                 'total_runs': 0,
                 'successful_runs': 0,
@@ -160,19 +325,15 @@ class AutomationService:
                 'total_responses_sent': 0
             }
         
-        successful_runs = [r for r in runs if r.status == 'completed']
-        failed_runs = [r for r in runs if r.status == 'failed']
-        
-        total_messages = sum(r.messages_processed for r in runs)
-        total_responses = sum(r.responses_sent for r in runs)
-        avg_duration = sum(r.duration_seconds or 0 for r in runs) / len(runs)
+        total_messages = stats.total_messages or 0
+        total_responses = stats.total_responses or 0
         
         return {
-            'total_runs': len(runs),
-            'successful_runs': len(successful_runs),
-            'failed_runs': len(failed_runs),
-            'success_rate': len(successful_runs) / len(runs) * 100,
-            'avg_duration': avg_duration,
+            'total_runs': stats.total_runs,
+            'successful_runs': stats.successful_runs,
+            'failed_runs': stats.failed_runs,
+            'success_rate': stats.successful_runs / stats.total_runs * 100,
+            'avg_duration': stats.avg_duration,
             'total_messages_processed': total_messages,
             'total_responses_sent': total_responses,
             'response_rate': (total_responses / total_messages * 100) if total_messages > 0 else 0
@@ -1,53 +1,164 @@
 import asyncio
-from typing import List, Dict
-from playwright.async_api import Page, BrowserContext
+import os
+from typing import List, Dict, Tuple
+from playwright.async_api import Page, Browser, BrowserContext, Locator, Playwright, Route
 from src.models import FacebookAccount
 
+BROWSER_LAUNCH_ARGS = ['--disable-blink-features=AutomationControlled']
+
+# Page diagnostics (title, URL, full HTML dump) cost extra round-trips and, for the
+# HTML, a multi-MB copy per call, so they are only printed when debugging
+BROWSER_DEBUG = os.environ.get('DEBUG', '').lower() in ('1', 'true', 'yes')
+
+# Runs in the page: summarises every conversation thread link matching the given
+# selector. The last span inside a thread is likely the message preview text.
+THREAD_LIST_SCRIPT = """
+(selector) => Array.from(document.querySelectorAll(selector)).map(thread => {
+    const spans = thread.querySelectorAll('span');
+    return {
+        href: thread.getAttribute('href'),
+        last_message_text: spans.length > 1 ? spans[spans.length - 1].textContent : ''
+    };
+})
+"""
+
+# Facebook UI selectors
+ACCOUNT_MENU_SELECTOR = "div[aria-label='Account Controls and Settings']"
+CONVERSATION_LIST_SELECTOR = "div[aria-label='Chats']"
+# Links to individual threads within the 'Chats' container
+THREAD_LINK_SELECTOR = "a[href^='/messages/t/']"
+UNREAD_INDICATOR_SELECTOR = "div[aria-label='Unread']"
+# Only the threads carrying the unread indicator, matched by the browser itself
+UNREAD_THREAD_SELECTOR = f"{THREAD_LINK_SELECTOR}:has({UNREAD_INDICATOR_SELECTOR})"
+# The send button is often an SVG inside a div with a specific aria-label
+SEND_BUTTON_SELECTOR = "div[aria-label='Press Enter to send']"
+# A div with a role of button containing the text 'Log Out'
+LOGOUT_BUTTON_SELECTOR = "div[role='button']:has-text('Log Out')"
+# Shown on the logged-out page
+EMAIL_INPUT_SELECTOR = "input[name='email']"
+
+# Subresources the automation never looks at. Stylesheets still load, since
+# element visibility (and so locator waits) depends on them.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+
+async def _block_unneeded_resources(route: Route):
+    """Aborts requests for blocked resource types and lets everything else through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Process-wide (playwright, browser), launched on first use and shared by every
+# non-persistent BrowserService; each account still gets its own context
+_shared_browser: Tuple[Playwright, Browser] | None = None
+_shared_browser_lock = asyncio.Lock()
+
+
+async def get_shared_browser() -> Browser:
+    """
+    Returns the shared browser, launching it on first use or if it has disconnected.
+    Must be called from the event loop that runs the automation.
+    """
+    global _shared_browser
+    async with _shared_browser_lock:
+        if _shared_browser is None or not _shared_browser[1].is_connected():
+            _shared_browser = await BrowserService.launch_browser()
+        return _shared_browser[1]
+
+
 class BrowserService:
     """
     A service to encapsulate all browser automation logic using Playwright.
     """
 
-    def __init__(self, user_data_dir: str, persistent: bool = True):
+    def __init__(self, user_data_dir: str, persistent: bool = True, browser: Browser | None = None):
         self.playwright = None
+        self.browser = browser
         self.browser_context: BrowserContext | None = None
         self.page: Page | None = None
+        # Locators for the fixed page controls, built once the page exists
+        self.account_menu: Locator | None = None
+        self.conversation_list: Locator | None = None
+        self.message_input: Locator | None = None
+        self.send_button: Locator | None = None
+        self.logout_button: Locator | None = None
+        self.email_input: Locator | None = None
         self.user_data_dir = user_data_dir
         self.persistent = persistent
+        self.storage_state_path = os.path.join(user_data_dir, 'storage_state.json')
+
+    @staticmethod
+    async def launch_browser() -> Tuple[Playwright, Browser]:
+        """
+        Starts the playwright driver and launches a browser that several
+        BrowserService instances can share, each with its own context.
+        The caller owns the returned objects and must close/stop them.
+        """
+        from playwright.async_api import async_playwright
+        playwright = await async_playwright().start()
+        browser = await playwright.chromium.launch(headless=True, args=BROWSER_LAUNCH_ARGS)
+        return playwright, browser
 
     async def start(self):
         """
         Starts the playwright driver and launches a browser context.
         It can be persistent or non-persistent based on the `persistent` flag.
+        A non-persistent service opens a new context on a shared browser (the one
+        passed in, or the process-wide one) instead of launching its own.
         """
-        from playwright.async_api import async_playwright
-        self.playwright = await async_playwright().start()
+        if self.browser is None and not self.persistent:
+            self.browser = await get_shared_browser()
+
+        if self.browser is not None:
+            # Shared browser: an isolated context per account, seeded with its saved session
+            storage_state = self.storage_state_path if os.path.exists(self.storage_state_path) else None
+            self.browser_context = await self.browser.new_context(storage_state=storage_state)
+        else:
+            from playwright.async_api import async_playwright
+            self.playwright = await async_playwright().start()
 
-        if self.persistent:
             self.browser_context = await self.playwright.chromium.launch_persistent_context(
                 self.user_data_dir,
                 headless=True,
-                args=['--disable-blink-features=AutomationControlled']
-            )
-        else:
-            browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=['--disable-blink-features=AutomationControlled']
+                args=BROWSER_LAUNCH_ARGS
             )
-            self.browser_context = await browser.new_context()
+
+        await self.browser_context.route("**/*", _block_unneeded_resources)
 
         self.page = self.browser_context.pages[0] if self.browser_context.pages else await self.browser_context.new_page()
         await self.page.set_viewport_size({"width": 1920, "height": 1080})
 
+        self.account_menu = self.page.locator(ACCOUNT_MENU_SELECTOR)
+        self.conversation_list = self.page.locator(CONVERSATION_LIST_SELECTOR)
+        # Facebook's message input is a div with role='textbox' labelled 'Message'
+        self.message_input = self.page.get_by_role("textbox", name="Message", exact=True)
+        self.send_button = self.page.locator(SEND_BUTTON_SELECTOR)
+        self.logout_button = self.page.locator(LOGOUT_BUTTON_SELECTOR)
+        self.email_input = self.page.locator(EMAIL_INPUT_SELECTOR)
+
     async def close(self):
         """
         Closes the browser context and stops the playwright driver.
+        A shared browser is left running; its session state is saved for the next context.
         """
         if self.browser_context:
+            if self.browser is not None:
+                try:
+                    await self.browser_context.storage_state(path=self.storage_state_path)
+                except Exception as e:
+                    print(f"Could not save session state: {e}")
             await self.browser_context.close()
         if self.playwright:
             await self.playwright.stop()
 
+    async def save_failure_screenshot(self, name: str):
+        """
+        Saves a viewport-only, compressed JPEG screenshot as '<name>.jpg'.
+        Much smaller to encode and transfer than a full-page PNG.
+        """
+        await self.page.screenshot(path=f"{name}.jpg", type="jpeg", quality=50, full_page=False)
+
     async def set_cookies(self, cookies: list):
         """Adds cookies to the browser context."""
         if cookies:
@@ -59,25 +170,27 @@ class BrowserService:
         Verifies that the user is logged in by checking for a known element.
         """
         print("Verifying login status...")
-        await self.page.goto("https://www.facebook.com/", wait_until="networkidle")
-
-        print(f"Page title: {await self.page.title()}")
-        print(f"Page URL: {self.page.url}")
-
-        try:
-            print("Page content:")
-            print(await self.page.content())
-        except Exception as e:
-            print(f"Could not get page content: {e}")
+        # The account menu wait below is the real readiness check; Facebook keeps
+        # polling, so networkidle would often stall until its timeout
+        await self.page.goto("https://www.facebook.com/", wait_until="domcontentloaded")
+
+        if BROWSER_DEBUG:
+            title, url = await self.page.evaluate("() => [document.title, location.href]")
+            print(f"Page title: {title}")
+            print(f"Page URL: {url}")
+            try:
+                print("Page content:")
+                print(await self.page.content())
+            except Exception as e:
+                print(f"Could not get page content: {e}")
 
         try:
-            account_menu_selector = "div[aria-label='Account Controls and Settings']"
-            await self.page.wait_for_selector(account_menu_selector, timeout=10000)
+            await self.account_menu.wait_for(timeout=10000)
             print("Login verified successfully.")
             return True
         except Exception:
             print("Login verification failed.")
-            await self.page.screenshot(path="login_verification_failed.png")
+            await self.save_failure_screenshot("login_verification_failed")
             return False
 
     async def get_unanswered_messages(self) -> List[dict]:
@@ -86,70 +199,31 @@ class BrowserService:
         Returns a list of conversation details for unanswered threads.
         """
         print("Navigating to messages page...")
-        await self.page.goto("https://www.facebook.com/messages/t/", wait_until="networkidle")
-
-        conversation_list_selector = "div[aria-label='Chats']"
-        await self.page.wait_for_selector(conversation_list_selector, timeout=15000)
-
-        # A more specific selector for individual threads. Facebook uses roles for accessibility.
-        # This selector looks for links within the 'Chats' container.
-        conversation_thread_selector = "a[href^='/messages/t/']"
-
-        threads = await self.page.query_selector_all(conversation_thread_selector)
-        print(f"Found {len(threads)} conversation threads.")
-
-        unanswered_conversations = []
-
-        for thread in threads:
-            try:
-                href = await thread.get_attribute('href')
-                if not href:
-                    continue
-
-                conversation_id = href.split('/')[-2]
-
-                # Strategy 1: Check for a visual 'Unread' indicator. This is often reliable.
-                unread_indicator_selector = "div[aria-label='Unread']"
-                unread_indicator = await thread.query_selector(unread_indicator_selector)
-
-                # Let's try to get the last message text as well.
-                last_message_text = ""
-                # This selector will need to be very specific to the message preview text.
-                # It's likely a span within the link.
-                last_message_text_selector = "span"
-                last_message_spans = await thread.query_selector_all(last_message_text_selector)
-                if len(last_message_spans) > 1:
-                    last_message_text = await last_message_spans[-1].text_content() or ""
-
-                if unread_indicator:
-                    unanswered_conversations.append({
-                        "conversation_id": conversation_id,
-                        "thread_element": thread,
-                        "last_message_text": last_message_text.strip()
-                    })
-                    continue # Move to the next thread
-
-                # Strategy 2: Check the last message text preview.
-                # If it starts with "You:", it's a message sent by us.
-                # This is a fallback in case the 'Unread' indicator isn't present.
-                last_message_text_selector = "span" # This is a generic selector, might need refinement
-
-                # We need to get the text content of the last message preview.
-                # This requires finding the right element within the thread.
-                # Let's assume the last message text is in a span inside the thread link.
-                last_message_spans = await thread.query_selector_all(last_message_text_selector)
-                last_message_text = ""
-                if len(last_message_spans) > 1: # Often there are multiple spans, one for name, one for message
-                    last_message_text = await last_message_spans[-1].text_content()
-
-                if last_message_text and not last_message_text.strip().startswith("You:"):
-                    # This is likely an unanswered message, but it's less certain than the unread indicator.
-                    # For now, let's be conservative and only rely on the unread indicator.
-                    # In a future iteration, we could add a more complex logic here.
-                    pass
-
-            except Exception as e:
-                print(f"Could not process a thread: {e}")
+        await self.page.goto("https://www.facebook.com/messages/t/", wait_until="domcontentloaded")
+
+        await self.conversation_list.wait_for(timeout=15000)
+
+        # Strategy 1: Check for a visual 'Unread' indicator. This is often reliable.
+        # Strategy 2 would treat a last message preview not starting with "You:"
+        # as unanswered, but it's less certain than the unread indicator.
+        # For now, let's be conservative and only rely on the unread indicator.
+        #
+        # The indicator is matched by the :has() selector in the page, and the
+        # unread threads are read in one in-page DOM walk, so read threads are
+        # never sent back. Thread elements are re-resolved by href only when a
+        # reply is actually sent.
+        threads = await self.page.evaluate(THREAD_LIST_SCRIPT, UNREAD_THREAD_SELECTOR)
+        print(f"Found {len(threads)} unread conversation threads.")
+
+        unanswered_conversations = [
+            {
+                "conversation_id": thread['href'].split('/')[-2],
+                "href": thread['href'],
+                "last_message_text": (thread.get('last_message_text') or "").strip()
+            }
+            for thread in threads
+            if thread.get('href')
+        ]
 
         print(f"Found {len(unanswered_conversations)} unanswered conversations.")
         return unanswered_conversations
@@ -157,9 +231,11 @@ class BrowserService:
     async def send_reply(self, conversation: Dict, message: str):
         """
         Sends a reply to a specific conversation.
-        'conversation' is a dictionary containing the thread_element.
+        'conversation' is a dictionary containing the thread_element or the thread's href.
         """
         thread_element = conversation.get("thread_element")
+        if not thread_element and conversation.get("href"):
+            thread_element = self.page.locator(f"a[href='{conversation['href']}']").first
         if not thread_element:
             print("Error: thread_element not found in conversation object.")
             return
@@ -169,23 +245,19 @@ class BrowserService:
             await thread_element.click()
 
             # Wait for the message input field to be ready.
-            # Facebook uses a div with role='textbox' for the message input.
-            message_input_selector = "div[aria-label='Message'][role='textbox']"
-            await self.page.wait_for_selector(message_input_selector, timeout=10000)
+            await self.message_input.wait_for(timeout=10000)
 
             # Type the message
-            await self.page.locator(message_input_selector).fill(message)
+            await self.message_input.fill(message)
 
             # Click the send button
-            # The send button is often an SVG inside a div with a specific aria-label.
-            send_button_selector = "div[aria-label='Press Enter to send']"
-            await self.page.locator(send_button_selector).click()
+            await self.send_button.click()
 
             print(f"Successfully sent reply: {message}")
 
         except Exception as e:
             print(f"Failed to send reply: {e}")
-            await self.page.screenshot(path=f"send_reply_failed_{conversation.get('conversation_id')}.png")
+            await self.save_failure_screenshot(f"send_reply_failed_{conversation.get('conversation_id')}")
 
     async def logout(self):
         """
@@ -193,20 +265,16 @@ class BrowserService:
         """
         print("Logging out...")
         try:
-            # The selector for the account menu might be something like:
-            account_menu_selector = "div[aria-label='Account Controls and Settings']"
-            await self.page.locator(account_menu_selector).click()
+            await self.account_menu.click()
 
             # The logout button is usually inside the menu and might have a specific test id or role.
-            # Using a selector that looks for a div with a role of button containing the text 'Log Out'.
-            logout_button_selector = "div[role='button']:has-text('Log Out')"
-            await self.page.locator(logout_button_selector).click()
+            await self.logout_button.click()
 
             # Wait for the page to redirect to a page that indicates we are logged out.
             # The URL might contain 'login' or it might be the homepage but with login fields.
-            await self.page.wait_for_selector("input[name='email']", timeout=15000)
+            await self.email_input.wait_for(timeout=15000)
             print("Logout successful.")
         except Exception as e:
             print(f"Logout failed: {e}")
-            await self.page.screenshot(path="logout_failed.png")
-            raise Exception("Logout failed. Check screenshot 'logout_failed.png' for details.")
+            await self.save_failure_screenshot("logout_failed")
+            raise Exception("Logout failed. Check screenshot 'logout_failed.jpg' for details.")
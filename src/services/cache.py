@@ -0,0 +1,148 @@
+"""
+In-process TTL cache for expensive, read-mostly results.
+
+Used to share the output of heavy validation and analytics runs between
+endpoints that are polled repeatedly, so each run is executed at most once
+per TTL window.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe time-to-live cache keyed by any hashable value.
+
+    Entries are stored together with their expiry time; expired entries are
+    treated as missing and replaced on the next ``get_or_compute`` call, and
+    are dropped once they have been expired for a further TTL, so keys that
+    stop being requested do not accumulate. Concurrent ``get_or_compute``
+    calls for the same missing key run the loader once; the others wait for
+    and share its result.
+    """
+
+    def __init__(self, ttl: float = 30.0):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        # [lock, users] per key with a loader running or waiting; the lock is
+        # held while the key's loader runs and the entry goes with its last user
+        self._key_locks: Dict[Hashable, list] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store value under key for ttl seconds (defaults to the cache TTL)."""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._entries[key] = (now + (self.ttl if ttl is None else ttl), value)
+
+    def _prune(self, now: float):
+        """Drop entries expired for longer than the cache TTL; caller holds _lock."""
+        cutoff = now - self.ttl
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= cutoff]:
+            del self._entries[key]
+
+    def get_or_compute(self, key: Hashable, loader: Callable[[], Any],
+                       force_refresh: bool = False,
+                       validator: Optional[Callable[[Any], bool]] = None,
+                       ttl: Optional[float] = None,
+                       serve_stale: bool = False) -> Any:
+        """
+        Return the cached value for key, calling loader to (re)populate it.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing a fresh value
+            force_refresh: Bypass any cached value
+            validator: Optional check applied to a cached value before reuse
+            ttl: Override the cache TTL for this entry
+            serve_stale: While another caller is refreshing an expired (but
+                not yet pruned) entry, return the expired value instead of
+                waiting for the refresh
+
+        Returns:
+            Cached or freshly computed value
+        """
+        stale = _MISSING
+        if not force_refresh:
+            value = self._get_valid(key, validator)
+            if value is not _MISSING:
+                return value
+            if serve_stale:
+                stale = self._get_stale(key, validator)
+
+        key_lock = self._acquire_key_lock(key, blocking=stale is _MISSING)
+        if key_lock is None:
+            return stale
+        try:
+            # Another caller may have refreshed the entry while this one waited
+            if not force_refresh:
+                value = self._get_valid(key, validator)
+                if value is not _MISSING:
+                    return value
+
+            value = loader()
+            self.set(key, value, ttl)
+            return value
+        finally:
+            self._release_key_lock(key, key_lock)
+
+    def _get_valid(self, key: Hashable, validator: Optional[Callable[[Any], bool]]) -> Any:
+        """Return the fresh cached value for key if it passes validator, else _MISSING."""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING and (validator is None or validator(value)):
+            return value
+        return _MISSING
+
+    def _get_stale(self, key: Hashable, validator: Optional[Callable[[Any], bool]]) -> Any:
+        """Return the retained value for key, fresh or expired, if it passes validator, else _MISSING."""
+        entry = self._entries.get(key)
+        if entry is not None and (validator is None or validator(entry[1])):
+            return entry[1]
+        return _MISSING
+
+    def _acquire_key_lock(self, key: Hashable, blocking: bool = True) -> Optional[list]:
+        """
+        Take the loader lock for key, creating it if no one else is using it.
+
+        Returns None, without waiting, if blocking is False and another
+        caller holds the lock.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            key_lock[1] += 1
+        if key_lock[0].acquire(blocking):
+            return key_lock
+        self._drop_key_lock_user(key, key_lock)
+        return None
+
+    def _release_key_lock(self, key: Hashable, key_lock: list):
+        """Release the loader lock for key, dropping it when no other caller is using it."""
+        key_lock[0].release()
+        self._drop_key_lock_user(key, key_lock)
+
+    def _drop_key_lock_user(self, key: Hashable, key_lock: list):
+        """Count one caller off key's loader lock; the last one removes it."""
+        with self._lock:
+            key_lock[1] -= 1
+            if not key_lock[1]:
+                del self._key_locks[key]
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop a single entry, or every entry when no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
@@ -1,97 +1,110 @@
 from datetime import datetime, timedelta
+import json
 import random
+from collections import defaultdict
+import numpy as np
+from sqlalchemy import delete, insert, update
 from src.models import db, FacebookAccount, Conversation, Message, MessageTemplate, AutomationRun, SystemMetric, ValidationLog
+from src.models.conversation import compute_message_stats
+from src.models.message import classify_text
+
+# Read-only reference data for seeding, built once at import
+CUSTOMER_NAMES = (
+    "John Smith", "Sarah Johnson", "Mike Davis", "Emily Brown", "David Wilson",
+    "Lisa Anderson", "Chris Taylor", "Amanda Martinez", "Ryan Garcia", "Jessica Rodriguez",
+    "Kevin Lee", "Michelle White", "Daniel Thompson", "Ashley Harris", "James Clark",
+    "Nicole Lewis", "Brandon Walker", "Stephanie Hall", "Tyler Allen", "Megan Young"
+)
+
+# Profile URL slug for each customer name, in the same order
+CUSTOMER_URL_SLUGS = tuple(name.lower().replace(' ', '.') for name in CUSTOMER_NAMES)
+
+MARKETPLACE_ITEMS = (
+    {"title": "iPhone 13 Pro Max 256GB", "price": 899.99},
+    {"title": "MacBook Air M2 2022", "price": 1199.99},
+    {"title": "Samsung 65\" 4K Smart TV", "price": 649.99},
+    {"title": "PlayStation 5 Console", "price": 499.99},
+    {"title": "Nike Air Jordan 1 Size 10", "price": 179.99},
+    {"title": "Dining Table Set (6 chairs)", "price": 299.99},
+    {"title": "Canon EOS R5 Camera", "price": 2499.99},
+    {"title": "Gaming PC RTX 4080", "price": 1899.99},
+    {"title": "Sectional Sofa - Gray", "price": 799.99},
+    {"title": "Road Bike - Trek 2023", "price": 1299.99}
+)
+
+MESSAGE_EXAMPLES = {
+    'price_inquiry': (
+        "What's your lowest price?",
+        "Is the price negotiable?",
+        "How much are you asking for this?",
+        "Can you do $X for this?",
+        "What's the best price you can offer?"
+    ),
+    'availability_check': (
+        "Is this still available?",
+        "Do you still have this item?",
+        "Can I buy this today?",
+        "Is this sold yet?",
+        "When can I pick this up?"
+    ),
+    'location_inquiry': (
+        "Where are you located?",
+        "Can I pick this up?",
+        "What's your address?",
+        "How far are you from downtown?",
+        "Can you meet somewhere?"
+    ),
+    'condition_inquiry': (
+        "What condition is this in?",
+        "Does everything work properly?",
+        "Are there any scratches or damage?",
+        "How old is this item?",
+        "Why are you selling this?"
+    ),
+    'initial_contact': (
+        "Hi, I'm interested in this item",
+        "Hello, is this available?",
+        "Hey, I saw your listing",
+        "Hi there, I'd like to know more",
+        "Hello, I'm interested in buying this"
+    )
+}
+
+MESSAGE_TYPE_KEYS = tuple(MESSAGE_EXAMPLES)
 
 class DataSeeder:
-    def __init__(self):
-        self.customer_names = [
-            "John Smith", "Sarah Johnson", "Mike Davis", "Emily Brown", "David Wilson",
-            "Lisa Anderson", "Chris Taylor", "Amanda Martinez", "Ryan Garcia", "Jessica Rodriguez",
-            "Kevin Lee", "Michelle White", "Daniel Thompson", "Ashley Harris", "James Clark",
-            "Nicole Lewis", "Brandon Walker", "Stephanie Hall", "Tyler Allen", "Megan Young"
-        ]
-        
-        self.marketplace_items = [
-            {"title": "iPhone 13 Pro Max 256GB", "price": 899.99},
-            {"title": "MacBook Air M2 2022", "price": 1199.99},
-            {"title": "Samsung 65\" 4K Smart TV", "price": 649.99},
-            {"title": "PlayStation 5 Console", "price": 499.99},
-            {"title": "Nike Air Jordan 1 Size 10", "price": 179.99},
-            {"title": "Dining Table Set (6 chairs)", "price": 299.99},
-            {"title": "Canon EOS R5 Camera", "price": 2499.99},
-            {"title": "Gaming PC RTX 4080", "price": 1899.99},
-            {"title": "Sectional Sofa - Gray", "price": 799.99},
-            {"title": "Road Bike - Trek 2023", "price": 1299.99}
-        ]
-        
-        self.message_examples = {
-            'price_inquiry': [
-                "What's your lowest price?",
-                "Is the price negotiable?",
-                "How much are you asking for this?",
-                "Can you do $X for this?",
-                "What's the best price you can offer?"
-            ],
-            'availability_check': [
-                "Is this still available?",
-                "Do you still have this item?",
-                "Can I buy this today?",
-                "Is this sold yet?",
-                "When can I pick this up?"
-            ],
-            'location_inquiry': [
-                "Where are you located?",
-                "Can I pick this up?",
-                "What's your address?",
-                "How far are you from downtown?",
-                "Can you meet somewhere?"
-            ],
-            'condition_inquiry': [
-                "What condition is this in?",
-                "Does everything work properly?",
-                "Are there any scratches or damage?",
-                "How old is this item?",
-                "Why are you selling this?"
-            ],
-            'initial_contact': [
-                "Hi, I'm interested in this item",
-                "Hello, is this available?",
-                "Hey, I saw your listing",
-                "Hi there, I'd like to know more",
-                "Hello, I'm interested in buying this"
-            ]
-        }
-    
     def seed_all_data(self):
         """Seed all data for the system"""
         print("Starting data seeding...")
         
-        # Clear existing data
-        self.clear_existing_data()
-        
-        # Seed in order due to foreign key relationships
-        self.seed_facebook_accounts()
-        self.seed_message_templates()
-        self.seed_conversations()
-        self.seed_messages()
-        self.seed_automation_runs()
-        self.seed_system_metrics()
-        self.seed_validation_logs()
-        
-        db.session.commit()
+        # Clearing and seeding run as one transaction with a single commit, so a
+        # failure part-way rolls back to the previous data instead of leaving
+        # the tables emptied or half-seeded
+        try:
+            # Clear existing data
+            self.clear_existing_data()
+            
+            # Seed in order due to foreign key relationships
+            self.seed_facebook_accounts()
+            self.seed_message_templates()
+            self.seed_conversations()
+            self.seed_messages()
+            self.seed_automation_runs()
+            self.seed_system_metrics()
+            self.seed_validation_logs()
+            
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
         print("Data seeding completed successfully!")
     
     def clear_existing_data(self):
         """Clear existing data from all tables"""
         print("Clearing existing data...")
-        ValidationLog.query.delete()
-        SystemMetric.query.delete()
-        AutomationRun.query.delete()
-        Message.query.delete()
-        MessageTemplate.query.delete()
-        Conversation.query.delete()
-        FacebookAccount.query.delete()
-        db.session.commit()
+        for model in (ValidationLog, SystemMetric, AutomationRun, Message,
+                      MessageTemplate, Conversation, FacebookAccount):
+            db.session.execute(delete(model))
     
     def seed_facebook_accounts(self):
         """Create Facebook accounts"""
@@ -108,22 +121,25 @@ class DataSeeder:
             {"email": "amy.backup@amycomputers.com", "password": "Str0ngP@ssw0rd!", "display_name": "Amy Computers - Backup"}
         ]
         
+        # Seed rows are plain dicts inserted in one batch per table, skipping
+        # per-object ORM unit-of-work overhead
+        now = datetime.utcnow()
+        account_rows = []
         for i, account_data in enumerate(accounts_data):
-            account = FacebookAccount(
-                email=account_data["email"],
-                password=account_data["password"],
-                display_name=account_data["display_name"],
-                is_active=True,
-                is_locked=i == 5,  # Lock the last account for testing
-                lock_reason="Rate limit exceeded" if i == 5 else None,
-                last_used=datetime.utcnow() - timedelta(hours=random.randint(1, 24)),
-                login_attempts=random.randint(5, 50),
-                successful_logins=random.randint(4, 45),
-                failed_logins=random.randint(0, 5)
-            )
-            db.session.add(account)
+            account_rows.append({
+                'email': account_data["email"],
+                'password': account_data["password"],
+                'display_name': account_data["display_name"],
+                'is_active': True,
+                'is_locked': i == 5,  # Lock the last account for testing
+                'lock_reason': "Rate limit exceeded" if i == 5 else None,
+                'last_used': now - timedelta(hours=random.randint(1, 24)),
+                'login_attempts': random.randint(5, 50),
+                'successful_logins': random.randint(4, 45),
+                'failed_logins': random.randint(0, 5)
+            })
         
-        db.session.flush()  # Flush to get IDs
+        db.session.execute(insert(FacebookAccount), account_rows)
     
     def seed_message_templates(self):
         """Create message templates"""
@@ -168,52 +184,66 @@ class DataSeeder:
             }
         ]
         
-        for template_data in templates_data:
-            template = MessageTemplate(
-                name=template_data["name"],
-                message_type=template_data["message_type"],
-                template_text=template_data["template_text"],
-                usage_count=random.randint(10, 100),
-                success_rate=random.uniform(75.0, 95.0)
-            )
-            template.set_variables(template_data["variables"])
-            db.session.add(template)
+        template_rows = [
+            {
+                'name': template_data["name"],
+                'message_type': template_data["message_type"],
+                'template_text': template_data["template_text"],
+                'variables': json.dumps(template_data["variables"]),
+                'usage_count': random.randint(10, 100),
+                'success_rate': random.uniform(75.0, 95.0)
+            }
+            for template_data in templates_data
+        ]
         
-        db.session.flush()
+        db.session.execute(insert(MessageTemplate), template_rows)
     
     def seed_conversations(self):
         """Create conversations"""
         print("Seeding conversations...")
         
-        accounts = FacebookAccount.query.all()
+        # Only the ids are needed, so skip loading full account rows
+        account_ids = [account_id for (account_id,) in db.session.query(FacebookAccount.id)]
         
-        for _ in range(50):  # Create 50 conversations
-            account = random.choice(accounts)
-            item = random.choice(self.marketplace_items)
-            customer = random.choice(self.customer_names)
-            
-            created_time = datetime.utcnow() - timedelta(
-                days=random.randint(0, 30),
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59)
-            )
+        num_conversations = 50  # Create 50 conversations
+        
+        # One batched draw per field instead of several random calls per row
+        account_picks = random.choices(account_ids, k=num_conversations)
+        item_picks = random.choices(MARKETPLACE_ITEMS, k=num_conversations)
+        customer_picks = random.choices(range(len(CUSTOMER_NAMES)), k=num_conversations)
+        day_offsets = random.choices(range(31), k=num_conversations)
+        hour_offsets = random.choices(range(24), k=num_conversations)
+        minute_offsets = random.choices(range(60), k=num_conversations)
+        item_ids = random.choices(range(100000, 1000000), k=num_conversations)
+        statuses = random.choices(['active', 'active', 'active', 'closed'], k=num_conversations)  # More active conversations
+        priorities = random.choices(['normal', 'normal', 'high', 'low'], k=num_conversations)
+        
+        now = datetime.utcnow()
+        conversation_rows = []
+        for i in range(num_conversations):
+            customer_index = customer_picks[i]
+            item = item_picks[i]
             
-            conversation = Conversation(
-                facebook_account_id=account.id,
-                customer_name=customer,
-                customer_profile_url=f"https://facebook.com/{customer.lower().replace(' ', '.')}",
-                marketplace_item_id=f"item_{random.randint(100000, 999999)}",
-                marketplace_item_title=item["title"],
-                marketplace_item_price=item["price"],
-                status=random.choice(['active', 'active', 'active', 'closed']),  # More active conversations
-                priority=random.choice(['normal', 'normal', 'high', 'low']),
-                created_at=created_time,
-                updated_at=created_time
+            created_time = now - timedelta(
+                days=day_offsets[i],
+                hours=hour_offsets[i],
+                minutes=minute_offsets[i]
             )
             
-            db.session.add(conversation)
+            conversation_rows.append({
+                'facebook_account_id': account_picks[i],
+                'customer_name': CUSTOMER_NAMES[customer_index],
+                'customer_profile_url': f"https://facebook.com/{CUSTOMER_URL_SLUGS[customer_index]}",
+                'marketplace_item_id': f"item_{item_ids[i]}",
+                'marketplace_item_title': item["title"],
+                'marketplace_item_price': item["price"],
+                'status': statuses[i],
+                'priority': priorities[i],
+                'created_at': created_time,
+                'updated_at': created_time
+            })
         
-        db.session.flush()
+        db.session.execute(insert(Conversation), conversation_rows)
     
     def seed_messages(self):
         """Create messages for conversations"""
@@ -221,140 +251,174 @@ class DataSeeder:
         
         conversations = Conversation.query.all()
         
-        for conversation in conversations:
-            # Create 2-8 messages per conversation
-            num_messages = random.randint(2, 8)
+        # Draw every random value up front with one vectorized call per field,
+        # then consume them by position while building rows
+        rng = np.random.default_rng()
+        message_counts = rng.integers(2, 9, size=len(conversations)).tolist()  # 2-8 messages per conversation
+        total_messages = sum(message_counts)
+        type_picks = rng.integers(0, len(MESSAGE_TYPE_KEYS), size=total_messages).tolist()
+        example_picks = rng.random(total_messages).tolist()
+        hour_steps = rng.integers(1, 7, size=total_messages).tolist()
+        minute_offsets = rng.integers(0, 60, size=total_messages).tolist()
+        processed_flags = (rng.random(total_messages) < 2 / 3).tolist()  # Most processed
+        processing_times = rng.uniform(0.5, 3.0, size=total_messages).tolist()
+        processed_delays = rng.integers(1, 31, size=total_messages).tolist()
+        
+        message_rows = []
+        position = 0
+        for conversation, num_messages in zip(conversations, message_counts):
+            bot_message_text = f"Thank you for your message! I'll get back to you shortly about the {conversation.marketplace_item_title}."
             
             for i in range(num_messages):
+                n = position + i
                 # Alternate between customer and bot messages
                 is_from_customer = i % 2 == 0
                 
                 if is_from_customer:
                     # Customer message
-                    message_type = random.choice(list(self.message_examples.keys()))
-                    message_text = random.choice(self.message_examples[message_type])
+                    message_type = MESSAGE_TYPE_KEYS[type_picks[n]]
+                    examples = MESSAGE_EXAMPLES[message_type]
+                    message_text = examples[int(example_picks[n] * len(examples))]
+                    # Classify customer messages
+                    classified_type, confidence = classify_text(message_text)
                 else:
                     # Bot response
                     message_type = 'bot_response'
-                    message_text = f"Thank you for your message! I'll get back to you shortly about the {conversation.marketplace_item_title}."
+                    message_text = bot_message_text
                 
                 message_time = conversation.created_at + timedelta(
-                    hours=i * random.randint(1, 6),
-                    minutes=random.randint(0, 59)
+                    hours=i * hour_steps[n],
+                    minutes=minute_offsets[n]
                 )
                 
-                message = Message(
-                    conversation_id=conversation.id,
-                    message_text=message_text,
-                    is_from_customer=is_from_customer,
-                    is_processed=not is_from_customer or random.choice([True, True, False]),  # Most processed
-                    is_automated_response=not is_from_customer,
-                    message_type=message_type if is_from_customer else None,
-                    classification_confidence=random.uniform(0.7, 0.95) if is_from_customer else None,
-                    template_used=f"{message_type}_response" if not is_from_customer else None,
-                    response_generated=message_text if not is_from_customer else None,
-                    response_sent=not is_from_customer,
-                    response_sent_at=message_time if not is_from_customer else None,
-                    processing_time_seconds=random.uniform(0.5, 3.0) if not is_from_customer else None,
-                    timestamp=message_time,
-                    processed_at=message_time + timedelta(seconds=random.randint(1, 30)) if not is_from_customer else None
-                )
-                
-                # Classify customer messages
-                if is_from_customer:
-                    message.classify_message()
-                
-                db.session.add(message)
-            
-            # Update conversation stats
-            conversation.update_message_stats()
+                message_rows.append({
+                    'conversation_id': conversation.id,
+                    'message_text': message_text,
+                    'is_from_customer': is_from_customer,
+                    'is_processed': not is_from_customer or processed_flags[n],
+                    'is_automated_response': not is_from_customer,
+                    'message_type': classified_type if is_from_customer else None,
+                    'classification_confidence': confidence if is_from_customer else None,
+                    'template_used': f"{message_type}_response" if not is_from_customer else None,
+                    'response_generated': message_text if not is_from_customer else None,
+                    'response_sent': not is_from_customer,
+                    'response_sent_at': message_time if not is_from_customer else None,
+                    'processing_time_seconds': processing_times[n] if not is_from_customer else None,
+                    'timestamp': message_time,
+                    'processed_at': message_time + timedelta(seconds=processed_delays[n]) if not is_from_customer else None
+                })
+            position += num_messages
+        
+        db.session.execute(insert(Message), message_rows)
         
-        db.session.flush()
+        # Update conversation stats from the rows just built, rather than
+        # lazy-loading each conversation's messages back, in one bulk UPDATE
+        conversation_messages = defaultdict(list)
+        for row in message_rows:
+            conversation_messages[row['conversation_id']].append(
+                (row['timestamp'], row['is_from_customer'], row['is_processed'])
+            )
+        db.session.execute(update(Conversation), [
+            {'id': conversation_id, **compute_message_stats(messages)}
+            for conversation_id, messages in conversation_messages.items()
+        ])
     
     def seed_automation_runs(self):
         """Create automation run records"""
         print("Seeding automation runs...")
         
-        accounts = FacebookAccount.query.all()
+        account_ids = [account_id for (account_id,) in db.session.query(FacebookAccount.id)]
+        num_runs = 100  # Create 100 automation runs
         
-        for _ in range(100):  # Create 100 automation runs
-            account = random.choice(accounts)
-            
-            start_time = datetime.utcnow() - timedelta(
-                days=random.randint(0, 7),
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59)
-            )
-            
-            duration = random.randint(30, 300)  # 30 seconds to 5 minutes
+        # Vectorized draws for every run, converted to plain Python values for the DB driver
+        rng = np.random.default_rng()
+        account_picks = rng.integers(0, len(account_ids), size=num_runs).tolist()
+        start_offsets = (
+            rng.integers(0, 8, size=num_runs) * 86400
+            + rng.integers(0, 24, size=num_runs) * 3600
+            + rng.integers(0, 60, size=num_runs) * 60
+        ).tolist()
+        durations = rng.integers(30, 301, size=num_runs)  # 30 seconds to 5 minutes
+        conversations_checked = rng.integers(5, 21, size=num_runs)
+        new_messages = rng.integers(0, 11, size=num_runs)
+        processed = rng.integers(0, new_messages + 1)
+        responses_sent = rng.integers(0, processed + 1)
+        errors = rng.integers(0, 3, size=num_runs)
+        run_types = rng.choice(['manual', 'scheduled', 'auto'], size=num_runs).tolist()
+        statuses = rng.choice(['completed', 'completed', 'completed', 'failed'], size=num_runs).tolist()  # Most successful
+        avg_processing_times = rng.uniform(1.0, 5.0, size=num_runs).tolist()
+        success_rates = rng.uniform(80.0, 100.0, size=num_runs).tolist()
+        
+        now = datetime.utcnow()
+        run_rows = []
+        for n, (duration, checked, found, done, sent, error_count) in enumerate(zip(
+            durations.tolist(), conversations_checked.tolist(), new_messages.tolist(),
+            processed.tolist(), responses_sent.tolist(), errors.tolist()
+        )):
+            start_time = now - timedelta(seconds=start_offsets[n])
             end_time = start_time + timedelta(seconds=duration)
             
-            conversations_checked = random.randint(5, 20)
-            new_messages = random.randint(0, 10)
-            processed = random.randint(0, new_messages)
-            responses_sent = random.randint(0, processed)
-            errors = random.randint(0, 2)
-            
-            run = AutomationRun(
-                facebook_account_id=account.id,
-                run_type=random.choice(['manual', 'scheduled', 'auto']),
-                status=random.choice(['completed', 'completed', 'completed', 'failed']),  # Most successful
-                start_time=start_time,
-                end_time=end_time,
-                duration_seconds=duration,
-                conversations_checked=conversations_checked,
-                new_messages_found=new_messages,
-                messages_processed=processed,
-                responses_sent=responses_sent,
-                errors_encountered=errors,
-                avg_processing_time_per_message=random.uniform(1.0, 5.0),
-                success_rate=random.uniform(80.0, 100.0)
-            )
-            
-            if errors > 0:
-                run.set_error_details([
+            run_rows.append({
+                'facebook_account_id': account_ids[account_picks[n]],
+                'run_type': run_types[n],
+                'status': statuses[n],
+                'start_time': start_time,
+                'end_time': end_time,
+                'duration_seconds': duration,
+                'conversations_checked': checked,
+                'new_messages_found': found,
+                'messages_processed': done,
+                'responses_sent': sent,
+                'errors_encountered': error_count,
+                'avg_processing_time_per_message': avg_processing_times[n],
+                'success_rate': success_rates[n],
+                'error_details': json.dumps([
                     {
                         "timestamp": start_time.isoformat(),
                         "type": "network_error",
                         "message": "Temporary connection timeout"
                     }
-                ])
-            
-            db.session.add(run)
+                ]) if error_count > 0 else None
+            })
         
-        db.session.flush()
+        db.session.execute(insert(AutomationRun), run_rows)
     
     def seed_system_metrics(self):
         """Create system metrics"""
         print("Seeding system metrics...")
         
-        # Create metrics for the last 7 days
-        for days_ago in range(7):
-            date = datetime.utcnow() - timedelta(days=days_ago)
-            
-            # Daily metrics
-            metrics = [
-                ("messages_processed", random.randint(50, 200), "counter"),
-                ("response_time_avg", random.uniform(2.0, 8.0), "gauge"),
-                ("success_rate", random.uniform(85.0, 98.0), "gauge"),
-                ("active_conversations", random.randint(20, 80), "gauge"),
-                ("system_uptime", random.uniform(95.0, 100.0), "gauge"),
-                ("error_rate", random.uniform(0.0, 5.0), "gauge"),
-                ("accounts_active", random.randint(4, 6), "gauge"),
-                ("automation_runs", random.randint(10, 30), "counter")
-            ]
+        num_days = 7  # Create metrics for the last 7 days
+        
+        # Daily metrics: one vectorized draw of num_days values per metric
+        rng = np.random.default_rng()
+        metrics = [
+            ("messages_processed", rng.integers(50, 201, size=num_days), "counter"),
+            ("response_time_avg", rng.uniform(2.0, 8.0, size=num_days), "gauge"),
+            ("success_rate", rng.uniform(85.0, 98.0, size=num_days), "gauge"),
+            ("active_conversations", rng.integers(20, 81, size=num_days), "gauge"),
+            ("system_uptime", rng.uniform(95.0, 100.0, size=num_days), "gauge"),
+            ("error_rate", rng.uniform(0.0, 5.0, size=num_days), "gauge"),
+            ("accounts_active", rng.integers(4, 7, size=num_days), "gauge"),
+            ("automation_runs", rng.integers(10, 31, size=num_days), "counter")
+        ]
+        metrics = [(metric_name, values.tolist(), metric_type) for metric_name, values, metric_type in metrics]
+        
+        now = datetime.utcnow()
+        metric_rows = []
+        for days_ago in range(num_days):
+            date = now - timedelta(days=days_ago)
             
-            for metric_name, value, metric_type in metrics:
-                metric = SystemMetric(
-                    metric_name=metric_name,
-                    metric_value=value,
-                    metric_type=metric_type,
-                    timestamp=date
-                )
-                metric.set_tags({"date": date.strftime("%Y-%m-%d")})
-                db.session.add(metric)
+            tags = json.dumps({"date": date.strftime("%Y-%m-%d")})
+            for metric_name, values, metric_type in metrics:
+                metric_rows.append({
+                    'metric_name': metric_name,
+                    'metric_value': values[days_ago],
+                    'metric_type': metric_type,
+                    'tags': tags,
+                    'timestamp': date
+                })
         
-        db.session.flush()
+        db.session.execute(insert(SystemMetric), metric_rows)
     
     def seed_validation_logs(self):
         """Create validation logs"""
@@ -368,29 +432,35 @@ class DataSeeder:
             "system_health_check"
         ]
         
-        for _ in range(50):
-            validation_type = random.choice(validation_types)
-            status = random.choice(['passed', 'passed', 'passed', 'warning', 'failed'])
-            
-            log = ValidationLog(
-                validation_type=validation_type,
-                entity_type=random.choice(['account', 'conversation', 'message', 'system']),
-                entity_id=random.randint(1, 50),
-                validation_status=status,
-                validation_message=f"Validation {status} for {validation_type}",
-                timestamp=datetime.utcnow() - timedelta(
-                    hours=random.randint(0, 168)  # Last week
-                )
-            )
+        num_logs = 50
+        validation_type_picks = random.choices(validation_types, k=num_logs)
+        statuses = random.choices(['passed', 'passed', 'passed', 'warning', 'failed'], k=num_logs)
+        entity_types = random.choices(['account', 'conversation', 'message', 'system'], k=num_logs)
+        entity_ids = random.choices(range(1, 51), k=num_logs)
+        checks_performed = random.choices(range(1, 11), k=num_logs)
+        issues_found = random.choices(range(4), k=num_logs)
+        hour_offsets = random.choices(range(169), k=num_logs)  # Last week
+        
+        now = datetime.utcnow()
+        log_rows = []
+        for i in range(num_logs):
+            validation_type = validation_type_picks[i]
+            status = statuses[i]
             
-            log.set_validation_data({
-                "checks_performed": random.randint(1, 10),
-                "issues_found": random.randint(0, 3) if status != 'passed' else 0
+            log_rows.append({
+                'validation_type': validation_type,
+                'entity_type': entity_types[i],
+                'entity_id': entity_ids[i],
+                'validation_status': status,
+                'validation_message': f"Validation {status} for {validation_type}",
+                'validation_data': json.dumps({
+                    "checks_performed": checks_performed[i],
+                    "issues_found": issues_found[i] if status != 'passed' else 0
+                }),
+                'timestamp': now - timedelta(hours=hour_offsets[i])
             })
-            
-            db.session.add(log)
         
-        db.session.flush()
+        db.session.execute(insert(ValidationLog), log_rows)
 
 def seed_database():
     """Main function to seed the database"""
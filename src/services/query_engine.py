@@ -1,6 +1,213 @@
+import operator
 from datetime import datetime, timedelta
-from sqlalchemy import func, and_, or_, case, text
+from sqlalchemy import bindparam, func, and_, or_, case, literal, select, text, true
 from src.models import db, FacebookAccount, Conversation, Message, MessageTemplate, AutomationRun, SystemMetric, ValidationLog
+from src.services.cache import TTLCache
+
+# Distribution buckets for the analytics breakdowns: (threshold, label) pairs
+# tried in order; values matching none of them get the method's default label
+CONFIDENCE_BUCKETS = ((0.9, 'high'), (0.7, 'medium'), (0.5, 'low'))
+ENGAGEMENT_BUCKETS = ((10, 'high_engagement'), (5, 'medium_engagement'), (2, 'low_engagement'))
+RESPONSE_SPEED_BUCKETS = ((5, 'very_fast'), (15, 'fast'), (60, 'moderate'), (240, 'slow'))
+
+def _rounded(expr, digits):
+    """Round an aggregate in SQL, with NULL (no rows) as 0, so rows come back ready to serialize"""
+    return func.round(func.coalesce(expr, 0.0), digits)
+
+def _bucket(column, buckets, default, compare=operator.ge):
+    """
+    Build a CASE expression labelling column by bucket.
+    
+    Args:
+        column: Column or expression to bucket
+        buckets: (threshold, label) pairs, tried in order
+        default: Label when no bucket matches
+        compare: Comparison of column against each threshold (>= by default)
+        
+    Returns:
+        SQL CASE expression yielding the bucket label
+    """
+    return case(*((compare(column, threshold), label) for threshold, label in buckets), else_=default)
+
+def _hours_of_day():
+    """Recursive CTE yielding each hour of the day, 0-23, as hour"""
+    hours = select(literal(0).label('hour')).cte('hours', recursive=True)
+    return hours.union_all(select(hours.c.hour + 1).where(hours.c.hour < 23))
+
+def _dates_between(start, end):
+    """Recursive CTE yielding every date from start through end as 'YYYY-MM-DD' strings, as date"""
+    dates = select(func.date(start).label('date')).cte('dates', recursive=True)
+    return dates.union_all(select(func.date(dates.c.date, '+1 day')).where(dates.c.date < func.date(end)))
+
+def _percentage(part, total):
+    """part / total as a percentage rounded to 2 places, or 0 when total is 0 or NULL"""
+    return round(part * 100 / total, 2) if total else 0
+
+# System overview: four single-row aggregates cross-joined into one statement,
+# so the overview costs one round-trip and reads one snapshot. It is built once
+# with the window start bound as :since, so calls skip rebuilding the
+# expression tree and reuse SQLAlchemy's compiled-statement cache entry.
+_OVERVIEW_ACCOUNT_STATS = select(
+    func.count(FacebookAccount.id).label('total_accounts'),
+    func.count().filter(FacebookAccount.is_active == True).label('active_accounts'),
+    func.count().filter(FacebookAccount.is_locked == True).label('locked_accounts'),
+    func.count().filter(and_(FacebookAccount.is_active == True, FacebookAccount.is_locked == False)).label('available_accounts')
+).subquery()
+
+_OVERVIEW_CONVERSATION_STATS = select(
+    func.count(Conversation.id).label('total_conversations'),
+    func.count().filter(Conversation.status == 'active').label('active_conversations'),
+    func.avg(Conversation.response_time_avg_minutes).label('avg_response_time')
+).subquery()
+
+_OVERVIEW_MESSAGE_STATS = select(
+    func.count(Message.id).label('total_messages_24h'),
+    func.count().filter(Message.is_from_customer == True).label('customer_messages_24h'),
+    func.count().filter(and_(Message.is_from_customer == False, Message.is_automated_response == True)).label('bot_responses_24h'),
+    func.count().filter(and_(Message.is_from_customer == True, Message.is_processed == False)).label('unprocessed_messages')
+).where(Message.timestamp >= bindparam('since')).subquery()
+
+_OVERVIEW_AUTOMATION_STATS = select(
+    func.count(AutomationRun.id).label('total_runs_24h'),
+    func.count().filter(AutomationRun.status == 'completed').label('successful_runs_24h'),
+    func.count().filter(AutomationRun.status == 'failed').label('failed_runs_24h'),
+    func.avg(AutomationRun.duration_seconds).label('avg_run_duration'),
+    func.sum(AutomationRun.messages_processed).label('total_messages_processed_24h'),
+    func.sum(AutomationRun.responses_sent).label('total_responses_sent_24h')
+).where(AutomationRun.start_time >= bindparam('since')).subquery()
+
+SYSTEM_OVERVIEW_STATEMENT = select(
+    _OVERVIEW_ACCOUNT_STATS, _OVERVIEW_CONVERSATION_STATS, _OVERVIEW_MESSAGE_STATS, _OVERVIEW_AUTOMATION_STATS
+).select_from(
+    _OVERVIEW_ACCOUNT_STATS
+    .join(_OVERVIEW_CONVERSATION_STATS, true())
+    .join(_OVERVIEW_MESSAGE_STATS, true())
+    .join(_OVERVIEW_AUTOMATION_STATS, true())
+)
+
+# Message analytics statements, built once like the overview and executed
+# with the window start bound as :start_date
+_CUSTOMER_MESSAGES_SINCE = and_(
+    Message.is_from_customer == True,
+    Message.timestamp >= bindparam('start_date')
+)
+
+MESSAGE_TYPE_STATS_STATEMENT = select(
+    Message.message_type,
+    func.count(Message.id).label('count'),
+    _rounded(func.avg(Message.classification_confidence), 3).label('avg_confidence'),
+    _rounded(func.min(Message.classification_confidence), 3).label('min_confidence'),
+    _rounded(func.max(Message.classification_confidence), 3).label('max_confidence'),
+    _rounded(func.avg(Message.processing_time_seconds), 3).label('avg_processing_time'),
+    func.count().filter(Message.is_processed == True).label('processed_count'),
+    func.count().filter(Message.response_sent == True).label('responded_count')
+).where(_CUSTOMER_MESSAGES_SINCE).group_by(Message.message_type)
+
+# Recent usage is counted per template name in a grouped subquery over the
+# window, then left-joined, so templates unused in the window still appear
+# with a count of 0
+_RECENT_TEMPLATE_USAGE = select(
+    Message.template_used.label('template_name'),
+    func.count(Message.id).label('recent_usage')
+).where(
+    Message.timestamp >= bindparam('start_date'),
+    Message.template_used.isnot(None)
+).group_by(Message.template_used).subquery()
+
+TEMPLATE_STATS_STATEMENT = select(
+    MessageTemplate.name,
+    MessageTemplate.message_type,
+    MessageTemplate.usage_count,
+    func.round(MessageTemplate.success_rate, 2).label('success_rate'),
+    func.coalesce(_RECENT_TEMPLATE_USAGE.c.recent_usage, 0).label('recent_usage')
+).outerjoin(
+    _RECENT_TEMPLATE_USAGE, _RECENT_TEMPLATE_USAGE.c.template_name == MessageTemplate.name
+)
+
+# Hour of day (0-23) of a message; CAST(strftime('%H', timestamp) AS INTEGER) on SQLite
+_MESSAGE_HOUR = func.extract('hour', Message.timestamp)
+
+# One row for each of the 24 hours (zeros where there were no messages)
+_HOURLY_COUNTS = select(
+    _MESSAGE_HOUR.label('hour'),
+    func.count(Message.id).label('message_count'),
+    func.avg(Message.processing_time_seconds).label('avg_processing_time'),
+    func.count().filter(Message.response_sent == True).label('responses_sent')
+).where(_CUSTOMER_MESSAGES_SINCE).group_by(_MESSAGE_HOUR).subquery()
+
+_HOURS = _hours_of_day()
+
+HOURLY_PERFORMANCE_STATEMENT = select(
+    _HOURS.c.hour,
+    func.coalesce(_HOURLY_COUNTS.c.message_count, 0).label('message_count'),
+    _rounded(_HOURLY_COUNTS.c.avg_processing_time, 3).label('avg_processing_time'),
+    func.coalesce(_HOURLY_COUNTS.c.responses_sent, 0).label('responses_sent')
+).outerjoin(
+    _HOURLY_COUNTS, _HOURLY_COUNTS.c.hour == _HOURS.c.hour
+).order_by(_HOURS.c.hour)
+
+_CONFIDENCE_LEVEL = _bucket(Message.classification_confidence, CONFIDENCE_BUCKETS, 'very_low').label('confidence_level')
+
+CONFIDENCE_DISTRIBUTION_STATEMENT = select(
+    _CONFIDENCE_LEVEL,
+    func.count(Message.id).label('count'),
+    func.count().filter(Message.response_sent == True).label('successful_responses')
+).where(
+    _CUSTOMER_MESSAGES_SINCE,
+    Message.classification_confidence.isnot(None)
+).group_by(_CONFIDENCE_LEVEL)
+
+# Real-time monitoring: the four single-row blocks cross-joined into one
+# statement like the overview, executed with :last_hour and :last_5_minutes.
+# Conditional counts use FILTER (WHERE ...), which yields 0 rather than NULL
+# for an empty window.
+_REAL_TIME_RECENT_ACTIVITY = select(
+    func.count(Message.id).label('messages_last_hour'),
+    func.count(Message.id).filter(Message.timestamp >= bindparam('last_5_minutes')).label('messages_last_5min'),
+    func.count(Message.id).filter(Message.is_from_customer == True).label('customer_messages_last_hour'),
+    func.count(Message.id).filter(Message.is_automated_response == True).label('bot_responses_last_hour')
+).where(Message.timestamp >= bindparam('last_hour')).subquery()
+
+_REAL_TIME_ACTIVE_RUNS = select(
+    func.count(AutomationRun.id).label('active_runs')
+).where(AutomationRun.status == 'running').subquery()
+
+# Independent counts per table; joining these tables together would multiply
+# every count by the other tables' matching rows
+_REAL_TIME_HEALTH = select(
+    select(func.count(FacebookAccount.id)).scalar_subquery().label('total_accounts'),
+    select(func.count(FacebookAccount.id)).where(
+        FacebookAccount.is_active == True, FacebookAccount.is_locked == False
+    ).scalar_subquery().label('healthy_accounts'),
+    select(func.count(Message.id)).where(
+        Message.is_from_customer == True, Message.is_processed == False
+    ).scalar_subquery().label('unprocessed_messages'),
+    select(func.count(Conversation.id)).where(
+        Conversation.status == 'active'
+    ).scalar_subquery().label('active_conversations')
+).subquery()
+
+_REAL_TIME_RECENT_ISSUES = select(
+    func.count(ValidationLog.id).label('total_validations'),
+    func.count(ValidationLog.id).filter(ValidationLog.validation_status == 'failed').label('failed_validations'),
+    func.count(ValidationLog.id).filter(ValidationLog.validation_status == 'warning').label('warning_validations')
+).where(ValidationLog.timestamp >= bindparam('last_hour')).subquery()
+
+REAL_TIME_METRICS_STATEMENT = select(
+    _REAL_TIME_RECENT_ACTIVITY, _REAL_TIME_ACTIVE_RUNS, _REAL_TIME_HEALTH, _REAL_TIME_RECENT_ISSUES
+).select_from(
+    _REAL_TIME_RECENT_ACTIVITY
+    .join(_REAL_TIME_ACTIVE_RUNS, true())
+    .join(_REAL_TIME_HEALTH, true())
+    .join(_REAL_TIME_RECENT_ISSUES, true())
+)
+
+# Dashboard endpoints are polled by many clients while the numbers behind
+# them only move every few seconds, so callers within a method's TTL share
+# one computed result. Entries are keyed on the method name and its
+# arguments (not the instance), and cached results are shared, so callers
+# must not mutate them.
+_ANALYTICS_CACHE = TTLCache(ttl=60)
 
 class QueryEngine:
     """
@@ -25,49 +232,23 @@ class QueryEngine:
         - Response rate percentage
         - System health score (weighted average)
         """
+        return _ANALYTICS_CACHE.get_or_compute('get_system_overview', self._get_system_overview, ttl=5)
+    
+    def _get_system_overview(self):
+        """get_system_overview without the cache"""
         
-        # Account metrics
-        account_stats = self.db.session.query(
-            func.count(FacebookAccount.id).label('total_accounts'),
-            func.sum(case((FacebookAccount.is_active == True, 1), else_=0)).label('active_accounts'),
-            func.sum(case((FacebookAccount.is_locked == True, 1), else_=0)).label('locked_accounts'),
-            func.sum(case((and_(FacebookAccount.is_active == True, FacebookAccount.is_locked == False), 1), else_=0)).label('available_accounts')
-        ).first()
-        
-        # Conversation metrics
-        conversation_stats = self.db.session.query(
-            func.count(Conversation.id).label('total_conversations'),
-            func.sum(case((Conversation.status == 'active', 1), else_=0)).label('active_conversations'),
-            func.avg(Conversation.response_time_avg_minutes).label('avg_response_time')
-        ).first()
-        
-        # Message metrics (last 24 hours)
+        # One prebuilt statement for all four aggregates (see SYSTEM_OVERVIEW_STATEMENT)
         last_24h = datetime.utcnow() - timedelta(hours=24)
-        message_stats = self.db.session.query(
-            func.count(Message.id).label('total_messages_24h'),
-            func.sum(case((Message.is_from_customer == True, 1), else_=0)).label('customer_messages_24h'),
-            func.sum(case((and_(Message.is_from_customer == False, Message.is_automated_response == True), 1), else_=0)).label('bot_responses_24h'),
-            func.sum(case((and_(Message.is_from_customer == True, Message.is_processed == False), 1), else_=0)).label('unprocessed_messages')
-        ).filter(Message.timestamp >= last_24h).first()
-        
-        # Automation run metrics (last 24 hours)
-        automation_stats = self.db.session.query(
-            func.count(AutomationRun.id).label('total_runs_24h'),
-            func.sum(case((AutomationRun.status == 'completed', 1), else_=0)).label('successful_runs_24h'),
-            func.sum(case((AutomationRun.status == 'failed', 1), else_=0)).label('failed_runs_24h'),
-            func.avg(AutomationRun.duration_seconds).label('avg_run_duration'),
-            func.sum(AutomationRun.messages_processed).label('total_messages_processed_24h'),
-            func.sum(AutomationRun.responses_sent).label('total_responses_sent_24h')
-        ).filter(AutomationRun.start_time >= last_24h).first()
+        overview = self.db.session.execute(SYSTEM_OVERVIEW_STATEMENT, {'since': last_24h}).one()
         
         # Calculate derived metrics
-        account_availability_rate = (account_stats.available_accounts / account_stats.total_accounts * 100) if account_stats.total_accounts > 0 else 0
+        account_availability_rate = (overview.available_accounts / overview.total_accounts * 100) if overview.total_accounts > 0 else 0
         
-        message_response_rate = (message_stats.bot_responses_24h / message_stats.customer_messages_24h * 100) if message_stats.customer_messages_24h > 0 else 0
+        message_response_rate = (overview.bot_responses_24h / overview.customer_messages_24h * 100) if overview.customer_messages_24h > 0 else 0
         
-        automation_success_rate = (automation_stats.successful_runs_24h / automation_stats.total_runs_24h * 100) if automation_stats.total_runs_24h > 0 else 100
+        automation_success_rate = (overview.successful_runs_24h / overview.total_runs_24h * 100) if overview.total_runs_24h > 0 else 100
         
-        processing_efficiency = (automation_stats.total_responses_sent_24h / automation_stats.total_messages_processed_24h * 100) if automation_stats.total_messages_processed_24h > 0 else 0
+        processing_efficiency = (overview.total_responses_sent_24h / overview.total_messages_processed_24h * 100) if overview.total_messages_processed_24h > 0 else 0
         
         # Calculate overall system health score (weighted average)
         health_score = (
@@ -79,32 +260,32 @@ class QueryEngine:
         
         return {
             'accounts': {
-                'total': account_stats.total_accounts,
-                'active': account_stats.active_accounts,
-                'locked': account_stats.locked_accounts,
-                'available': account_stats.available_accounts,
+                'total': overview.total_accounts,
+                'active': overview.active_accounts,
+                'locked': overview.locked_accounts,
+                'available': overview.available_accounts,
                 'availability_rate': round(account_availability_rate, 2)
             },
             'conversations': {
-                'total': conversation_stats.total_conversations,
-                'active': conversation_stats.active_conversations,
-                'avg_response_time_minutes': round(float(conversation_stats.avg_response_time or 0), 2)
+                'total': overview.total_conversations,
+                'active': overview.active_conversations,
+                'avg_response_time_minutes': round(float(overview.avg_response_time or 0), 2)
             },
             'messages_24h': {
-                'total': message_stats.total_messages_24h,
-                'customer_messages': message_stats.customer_messages_24h,
-                'bot_responses': message_stats.bot_responses_24h,
-                'unprocessed': message_stats.unprocessed_messages,
+                'total': overview.total_messages_24h,
+                'customer_messages': overview.customer_messages_24h,
+                'bot_responses': overview.bot_responses_24h,
+                'unprocessed': overview.unprocessed_messages,
                 'response_rate': round(message_response_rate, 2)
             },
             'automation_24h': {
-                'total_runs': automation_stats.total_runs_24h,
-                'successful_runs': automation_stats.successful_runs_24h,
-                'failed_runs': automation_stats.failed_runs_24h,
+                'total_runs': overview.total_runs_24h,
+                'successful_runs': overview.successful_runs_24h,
+                'failed_runs': overview.failed_runs_24h,
                 'success_rate': round(automation_success_rate, 2),
-                'avg_duration_seconds': round(float(automation_stats.avg_run_duration or 0), 2),
-                'messages_processed': automation_stats.total_messages_processed_24h,
-                'responses_sent': automation_stats.total_responses_sent_24h,
+                'avg_duration_seconds': round(float(overview.avg_run_duration or 0), 2),
+                'messages_processed': overview.total_messages_processed_24h,
+                'responses_sent': overview.total_responses_sent_24h,
                 'processing_efficiency': round(processing_efficiency, 2)
             },
             'system_health': {
@@ -115,7 +296,7 @@ class QueryEngine:
     
     # ==================== ACCOUNT PERFORMANCE QUERIES ====================
     
-    def get_account_performance_detailed(self, days=7):
+    def get_account_performance_detailed(self, days=7, limit=None):
         """
         Detailed account performance analysis with conversation and automation metrics.
         
@@ -126,10 +307,52 @@ class QueryEngine:
         - Success rates per account
         - Usage distribution
         - Performance rankings
+        
+        Args:
+            days: Number of days of activity to include
+            limit: Only return this many top-ranked accounts (all when None)
         """
+        return _ANALYTICS_CACHE.get_or_compute(
+            ('get_account_performance_detailed', days, limit),
+            lambda: self._get_account_performance_detailed(days, limit),
+            ttl=30
+        )
+    
+    def _get_account_performance_detailed(self, days=7, limit=None):
+        """get_account_performance_detailed without the cache"""
         
         start_date = datetime.utcnow() - timedelta(days=days)
         
+        # Automation run metrics per account, grouped once and joined below
+        runs = self.db.session.query(
+            AutomationRun.facebook_account_id.label('account_id'),
+            func.count(AutomationRun.id).label('total_runs'),
+            func.count().filter(AutomationRun.status == 'completed').label('successful_runs'),
+            func.sum(AutomationRun.messages_processed).label('messages_processed'),
+            func.sum(AutomationRun.responses_sent).label('responses_sent'),
+            func.avg(AutomationRun.duration_seconds).label('avg_duration')
+        ).filter(
+            AutomationRun.start_time >= start_date
+        ).group_by(AutomationRun.facebook_account_id).subquery()
+        
+        # Performance score components (0-100), computed in SQL so the
+        # ranking happens in the ORDER BY rather than in Python
+        total_logins = FacebookAccount.successful_logins + FacebookAccount.failed_logins
+        login_success_rate = case(
+            (total_logins > 0, FacebookAccount.successful_logins * 100.0 / total_logins),
+            else_=100.0
+        )
+        customer_messages = func.sum(Conversation.customer_message_count)
+        conversation_response_rate = case(
+            (func.coalesce(customer_messages, 0) > 0, func.sum(Conversation.bot_response_count) * 100.0 / customer_messages),
+            else_=0.0
+        )
+        automation_success_rate = case(
+            (func.coalesce(runs.c.total_runs, 0) > 0, runs.c.successful_runs * 100.0 / runs.c.total_runs),
+            else_=0.0
+        )
+        performance_score = (login_success_rate * 0.3 + conversation_response_rate * 0.4 + automation_success_rate * 0.3)
+        
         # Main account performance query with subqueries for related metrics
         account_performance = self.db.session.query(
             FacebookAccount.id,
@@ -143,54 +366,40 @@ class QueryEngine:
             
             # Conversation metrics subquery
             func.count(Conversation.id).label('total_conversations'),
-            func.sum(case((Conversation.status == 'active', 1), else_=0)).label('active_conversations'),
+            func.count().filter(Conversation.status == 'active').label('active_conversations'),
             func.avg(Conversation.response_time_avg_minutes).label('avg_response_time'),
             
             # Message metrics subquery  
             func.sum(Conversation.message_count).label('total_messages'),
-            func.sum(Conversation.customer_message_count).label('customer_messages'),
-            func.sum(Conversation.bot_response_count).label('bot_responses')
+            customer_messages.label('customer_messages'),
+            func.sum(Conversation.bot_response_count).label('bot_responses'),
             
-        ).outerjoin(Conversation).filter(
-            or_(Conversation.created_at >= start_date, Conversation.created_at.is_(None))
-        ).group_by(FacebookAccount.id).all()
-        
-        # Get automation run metrics for each account
-        automation_metrics = {}
-        for account in account_performance:
-            runs = self.db.session.query(
-                func.count(AutomationRun.id).label('total_runs'),
-                func.sum(case((AutomationRun.status == 'completed', 1), else_=0)).label('successful_runs'),
-                func.sum(AutomationRun.messages_processed).label('messages_processed'),
-                func.sum(AutomationRun.responses_sent).label('responses_sent'),
-                func.avg(AutomationRun.duration_seconds).label('avg_duration')
-            ).filter(
-                AutomationRun.facebook_account_id == account.id,
-                AutomationRun.start_time >= start_date
-            ).first()
+            # Automation run metrics (NULL when the account had no runs)
+            runs.c.total_runs,
+            runs.c.successful_runs,
+            runs.c.messages_processed,
+            runs.c.responses_sent,
+            runs.c.avg_duration,
             
-            automation_metrics[account.id] = {
-                'total_runs': runs.total_runs or 0,
-                'successful_runs': runs.successful_runs or 0,
-                'success_rate': (runs.successful_runs / runs.total_runs * 100) if runs.total_runs > 0 else 0,
-                'messages_processed': runs.messages_processed or 0,
-                'responses_sent': runs.responses_sent or 0,
-                'response_rate': (runs.responses_sent / runs.messages_processed * 100) if runs.messages_processed > 0 else 0,
-                'avg_duration': float(runs.avg_duration or 0)
-            }
+            login_success_rate.label('login_success_rate'),
+            conversation_response_rate.label('conversation_response_rate'),
+            performance_score.label('performance_score')
+            
+        ).outerjoin(Conversation).outerjoin(
+            runs, runs.c.account_id == FacebookAccount.id
+        ).filter(
+            or_(Conversation.created_at >= start_date, Conversation.created_at.is_(None))
+        ).group_by(
+            FacebookAccount.id, *runs.c
+        ).order_by(performance_score.desc())
+        
+        if limit:
+            account_performance = account_performance.limit(limit)
         
-        # Format results with calculated performance scores
+        # Format results, streaming the column rows in batches instead of
+        # loading them all first
         results = []
-        for account in account_performance:
-            auto_metrics = automation_metrics.get(account.id, {})
-            
-            # Calculate performance score (0-100)
-            login_success_rate = (account.successful_logins / (account.successful_logins + account.failed_logins) * 100) if (account.successful_logins + account.failed_logins) > 0 else 100
-            conversation_response_rate = (account.bot_responses / account.customer_messages * 100) if account.customer_messages > 0 else 0
-            automation_success_rate = auto_metrics.get('success_rate', 0)
-            
-            performance_score = (login_success_rate * 0.3 + conversation_response_rate * 0.4 + automation_success_rate * 0.3)
-            
+        for account in account_performance.yield_per(1000):
             results.append({
                 'id': account.id,
                 'display_name': account.display_name,
@@ -201,7 +410,7 @@ class QueryEngine:
                 'login_metrics': {
                     'successful_logins': account.successful_logins,
                     'failed_logins': account.failed_logins,
-                    'success_rate': round(login_success_rate, 2)
+                    'success_rate': round(account.login_success_rate, 2)
                 },
                 'conversation_metrics': {
                     'total_conversations': account.total_conversations,
@@ -209,18 +418,41 @@ class QueryEngine:
                     'total_messages': account.total_messages or 0,
                     'customer_messages': account.customer_messages or 0,
                     'bot_responses': account.bot_responses or 0,
-                    'response_rate': round(conversation_response_rate, 2),
+                    'response_rate': round(account.conversation_response_rate, 2),
                     'avg_response_time_minutes': round(float(account.avg_response_time or 0), 2)
                 },
-                'automation_metrics': auto_metrics,
-                'performance_score': round(performance_score, 2)
+                'automation_metrics': self._automation_metrics(account),
+                'performance_score': round(account.performance_score, 2)
             })
         
-        # Sort by performance score
-        results.sort(key=lambda x: x['performance_score'], reverse=True)
-        
         return results
     
+    @staticmethod
+    def _automation_metrics(runs):
+        """
+        Format an account's grouped automation run metrics.
+        
+        Args:
+            runs: Row carrying the grouped AutomationRun columns (NULL when the account had no runs)
+            
+        Returns:
+            Dict of automation metrics (zeros when there were no runs)
+        """
+        total_runs = runs.total_runs or 0
+        successful_runs = runs.successful_runs or 0
+        messages_processed = runs.messages_processed or 0
+        responses_sent = runs.responses_sent or 0
+        
+        return {
+            'total_runs': total_runs,
+            'successful_runs': successful_runs,
+            'success_rate': (successful_runs / total_runs * 100) if total_runs > 0 else 0,
+            'messages_processed': messages_processed,
+            'responses_sent': responses_sent,
+            'response_rate': (responses_sent / messages_processed * 100) if messages_processed > 0 else 0,
+            'avg_duration': float(runs.avg_duration or 0)
+        }
+    
     # ==================== MESSAGE ANALYTICS QUERIES ====================
     
     def get_message_classification_analytics(self, days=30):
@@ -235,102 +467,74 @@ class QueryEngine:
         - Processing time analysis
         - Template effectiveness metrics
         """
+        return _ANALYTICS_CACHE.get_or_compute(
+            ('get_message_classification_analytics', days),
+            lambda: self._get_message_classification_analytics(days),
+            ttl=60
+        )
+    
+    def _get_message_classification_analytics(self, days=30):
+        """get_message_classification_analytics without the cache"""
         
         start_date = datetime.utcnow() - timedelta(days=days)
         
+        # Prebuilt statements (see MESSAGE_TYPE_STATS_STATEMENT and friends);
+        # only the window start is bound per call
+        params = {'start_date': start_date}
+        
         # Message type distribution with confidence metrics
-        message_type_stats = self.db.session.query(
-            Message.message_type,
-            func.count(Message.id).label('count'),
-            func.avg(Message.classification_confidence).label('avg_confidence'),
-            func.min(Message.classification_confidence).label('min_confidence'),
-            func.max(Message.classification_confidence).label('max_confidence'),
-            func.avg(Message.processing_time_seconds).label('avg_processing_time'),
-            func.sum(case((Message.is_processed == True, 1), else_=0)).label('processed_count'),
-            func.sum(case((Message.response_sent == True, 1), else_=0)).label('responded_count')
-        ).filter(
-            Message.is_from_customer == True,
-            Message.timestamp >= start_date
-        ).group_by(Message.message_type).all()
+        message_type_stats = self.db.session.execute(MESSAGE_TYPE_STATS_STATEMENT, params).all()
         
         # Template usage and effectiveness
-        template_stats = self.db.session.query(
-            MessageTemplate.name,
-            MessageTemplate.message_type,
-            MessageTemplate.usage_count,
-            MessageTemplate.success_rate,
-            func.count(Message.id).label('recent_usage')
-        ).outerjoin(
-            Message, Message.template_used == MessageTemplate.name
-        ).filter(
-            or_(Message.timestamp >= start_date, Message.timestamp.is_(None))
-        ).group_by(MessageTemplate.id).all()
+        template_stats = self.db.session.execute(TEMPLATE_STATS_STATEMENT, params).all()
         
         # Processing performance by time of day
-        hourly_performance = self.db.session.query(
-            func.extract('hour', Message.timestamp).label('hour'),
-            func.count(Message.id).label('message_count'),
-            func.avg(Message.processing_time_seconds).label('avg_processing_time'),
-            func.sum(case((Message.response_sent == True, 1), else_=0)).label('responses_sent')
-        ).filter(
-            Message.is_from_customer == True,
-            Message.timestamp >= start_date
-        ).group_by(func.extract('hour', Message.timestamp)).all()
+        hourly_performance = self.db.session.execute(HOURLY_PERFORMANCE_STATEMENT, params).all()
         
         # Confidence distribution analysis
-        confidence_distribution = self.db.session.query(
-            case(
-                (Message.classification_confidence >= 0.9, 'high'),
-                (Message.classification_confidence >= 0.7, 'medium'),
-                (Message.classification_confidence >= 0.5, 'low'),
-                else_='very_low'
-            ).label('confidence_level'),
-            func.count(Message.id).label('count'),
-            func.sum(case((Message.response_sent == True, 1), else_=0)).label('successful_responses')
-        ).filter(
-            Message.is_from_customer == True,
-            Message.timestamp >= start_date,
-            Message.classification_confidence.isnot(None)
-        ).group_by('confidence_level').all()
+        confidence_distribution = self.db.session.execute(CONFIDENCE_DISTRIBUTION_STATEMENT, params).all()
         
+        # Rows are unpacked positionally (in select order) rather than read
+        # through Row attribute lookups
         return {
             'message_types': [
                 {
-                    'message_type': stat.message_type,
-                    'count': stat.count,
-                    'avg_confidence': round(float(stat.avg_confidence or 0), 3),
+                    'message_type': message_type,
+                    'count': count,
+                    'avg_confidence': avg_confidence,
                     'confidence_range': {
-                        'min': round(float(stat.min_confidence or 0), 3),
-                        'max': round(float(stat.max_confidence or 0), 3)
+                        'min': min_confidence,
+                        'max': max_confidence
                     },
-                    'avg_processing_time_seconds': round(float(stat.avg_processing_time or 0), 3),
-                    'processing_rate': round((stat.processed_count / stat.count * 100), 2),
-                    'response_rate': round((stat.responded_count / stat.count * 100), 2)
-                } for stat in message_type_stats
+                    'avg_processing_time_seconds': avg_processing_time,
+                    'processing_rate': _percentage(processed_count, count),
+                    'response_rate': _percentage(responded_count, count)
+                } for (message_type, count, avg_confidence, min_confidence, max_confidence,
+                       avg_processing_time, processed_count, responded_count) in message_type_stats
             ],
             'templates': [
                 {
-                    'name': template.name,
-                    'message_type': template.message_type,
-                    'total_usage': template.usage_count,
-                    'recent_usage': template.recent_usage,
-                    'success_rate': round(float(template.success_rate), 2)
-                } for template in template_stats
+                    'name': name,
+                    'message_type': message_type,
+                    'total_usage': usage_count,
+                    'recent_usage': recent_usage,
+                    'success_rate': success_rate
+                } for name, message_type, usage_count, success_rate, recent_usage in template_stats
             ],
             'hourly_performance': [
                 {
-                    'hour': int(hour.hour),
-                    'message_count': hour.message_count,
-                    'avg_processing_time': round(float(hour.avg_processing_time or 0), 3),
-                    'response_rate': round((hour.responses_sent / hour.message_count * 100), 2)
-                } for hour in hourly_performance
+                    'hour': int(hour),
+                    'message_count': message_count,
+                    'avg_processing_time': avg_processing_time,
+                    'response_rate': _percentage(responses_sent, message_count)
+                } for hour, message_count, avg_processing_time, responses_sent in hourly_performance
             ],
             'confidence_distribution': [
                 {
-                    'confidence_level': conf.confidence_level,
-                    'count': conf.count,
-                    'success_rate': round((conf.successful_responses / conf.count * 100), 2)
-                } for conf in confidence_distribution
+                    'confidence_level': confidence_level,
+                    'count': count,
+                    'success_rate': _percentage(successful_responses, count)
+                } for confidence_level, count, successful_responses in confidence_distribution
             ]
         }
     
@@ -348,6 +552,14 @@ class QueryEngine:
         - Resolution rates and times
         - Account workload distribution
         """
+        return _ANALYTICS_CACHE.get_or_compute(
+            ('get_conversation_analytics', days),
+            lambda: self._get_conversation_analytics(days),
+            ttl=60
+        )
+    
+    def _get_conversation_analytics(self, days=30):
+        """get_conversation_analytics without the cache"""
         
         start_date = datetime.utcnow() - timedelta(days=days)
         
@@ -355,83 +567,85 @@ class QueryEngine:
         conversation_lifecycle = self.db.session.query(
             Conversation.status,
             func.count(Conversation.id).label('count'),
-            func.avg(Conversation.message_count).label('avg_messages'),
-            func.avg(Conversation.response_time_avg_minutes).label('avg_response_time'),
-            func.avg(
+            _rounded(func.avg(Conversation.message_count), 2).label('avg_messages'),
+            _rounded(func.avg(Conversation.response_time_avg_minutes), 2).label('avg_response_time'),
+            _rounded(func.avg(
                 func.extract('epoch', Conversation.updated_at - Conversation.created_at) / 3600
-            ).label('avg_duration_hours')
+            ), 2).label('avg_duration_hours')
         ).filter(
             Conversation.created_at >= start_date
         ).group_by(Conversation.status).all()
         
         # Customer engagement patterns
         engagement_patterns = self.db.session.query(
-            case(
-                (Conversation.message_count >= 10, 'high_engagement'),
-                (Conversation.message_count >= 5, 'medium_engagement'),
-                (Conversation.message_count >= 2, 'low_engagement'),
-                else_='single_message'
-            ).label('engagement_level'),
+            _bucket(Conversation.message_count, ENGAGEMENT_BUCKETS, 'single_message').label('engagement_level'),
             func.count(Conversation.id).label('conversation_count'),
-            func.avg(Conversation.response_time_avg_minutes).label('avg_response_time'),
-            func.sum(case((Conversation.status == 'closed', 1), else_=0)).label('closed_count')
+            _rounded(func.avg(Conversation.response_time_avg_minutes), 2).label('avg_response_time'),
+            func.count().filter(Conversation.status == 'closed').label('closed_count')
         ).filter(
             Conversation.created_at >= start_date
         ).group_by('engagement_level').all()
         
-        # Account workload distribution
+        # Account workload distribution (rows streamed into the result below)
         account_workload = self.db.session.query(
             FacebookAccount.display_name,
             func.count(Conversation.id).label('conversation_count'),
             func.sum(Conversation.message_count).label('total_messages'),
-            func.avg(Conversation.response_time_avg_minutes).label('avg_response_time'),
-            func.sum(case((Conversation.status == 'active', 1), else_=0)).label('active_conversations')
+            _rounded(func.avg(Conversation.response_time_avg_minutes), 2).label('avg_response_time'),
+            func.count().filter(Conversation.status == 'active').label('active_conversations')
         ).join(Conversation).filter(
             Conversation.created_at >= start_date
-        ).group_by(FacebookAccount.id).all()
+        ).group_by(FacebookAccount.id).yield_per(1000)
         
         # Response time distribution
         response_time_distribution = self.db.session.query(
-            case(
-                (Conversation.response_time_avg_minutes <= 5, 'very_fast'),
-                (Conversation.response_time_avg_minutes <= 15, 'fast'),
-                (Conversation.response_time_avg_minutes <= 60, 'moderate'),
-                (Conversation.response_time_avg_minutes <= 240, 'slow'),
-                else_='very_slow'
+            _bucket(
+                Conversation.response_time_avg_minutes, RESPONSE_SPEED_BUCKETS, 'very_slow', compare=operator.le
             ).label('response_speed'),
             func.count(Conversation.id).label('count'),
-            func.sum(case((Conversation.status == 'closed', 1), else_=0)).label('closed_count')
+            func.count().filter(Conversation.status == 'closed').label('closed_count')
         ).filter(
             Conversation.created_at >= start_date,
             Conversation.response_time_avg_minutes.isnot(None)
         ).group_by('response_speed').all()
         
-        # Daily conversation trends
-        daily_trends = self.db.session.query(
+        # Daily conversation trends, one row for every day in the window
+        # (zeros on days without new conversations)
+        daily_counts = self.db.session.query(
             func.date(Conversation.created_at).label('date'),
             func.count(Conversation.id).label('new_conversations'),
-            func.sum(case((Conversation.status == 'closed', 1), else_=0)).label('closed_conversations'),
+            func.count().filter(Conversation.status == 'closed').label('closed_conversations'),
             func.avg(Conversation.message_count).label('avg_messages_per_conversation')
         ).filter(
             Conversation.created_at >= start_date
-        ).group_by(func.date(Conversation.created_at)).order_by('date').all()
+        ).group_by(func.date(Conversation.created_at)).subquery()
+        
+        dates = _dates_between(start_date, datetime.utcnow())
+        daily_trends = self.db.session.query(
+            dates.c.date,
+            func.coalesce(daily_counts.c.new_conversations, 0).label('new_conversations'),
+            func.coalesce(daily_counts.c.closed_conversations, 0).label('closed_conversations'),
+            _rounded(daily_counts.c.avg_messages_per_conversation, 2).label('avg_messages_per_conversation')
+        ).outerjoin(
+            daily_counts, daily_counts.c.date == dates.c.date
+        ).order_by(dates.c.date).all()
         
         return {
             'lifecycle_analysis': [
                 {
                     'status': lifecycle.status,
                     'count': lifecycle.count,
-                    'avg_messages': round(float(lifecycle.avg_messages or 0), 2),
-                    'avg_response_time_minutes': round(float(lifecycle.avg_response_time or 0), 2),
-                    'avg_duration_hours': round(float(lifecycle.avg_duration_hours or 0), 2)
+                    'avg_messages': lifecycle.avg_messages,
+                    'avg_response_time_minutes': lifecycle.avg_response_time,
+                    'avg_duration_hours': lifecycle.avg_duration_hours
                 } for lifecycle in conversation_lifecycle
             ],
             'engagement_patterns': [
                 {
                     'engagement_level': pattern.engagement_level,
                     'conversation_count': pattern.conversation_count,
-                    'avg_response_time_minutes': round(float(pattern.avg_response_time or 0), 2),
-                    'closure_rate': round((pattern.closed_count / pattern.conversation_count * 100), 2)
+                    'avg_response_time_minutes': pattern.avg_response_time,
+                    'closure_rate': _percentage(pattern.closed_count, pattern.conversation_count)
                 } for pattern in engagement_patterns
             ],
             'account_workload': [
@@ -439,7 +653,7 @@ class QueryEngine:
                     'account_name': workload.display_name,
                     'conversation_count': workload.conversation_count,
                     'total_messages': workload.total_messages,
-                    'avg_response_time_minutes': round(float(workload.avg_response_time or 0), 2),
+                    'avg_response_time_minutes': workload.avg_response_time,
                     'active_conversations': workload.active_conversations,
                     'workload_score': round((workload.conversation_count * 0.6 + workload.active_conversations * 0.4), 2)
                 } for workload in account_workload
@@ -448,16 +662,16 @@ class QueryEngine:
                 {
                     'response_speed': dist.response_speed,
                     'count': dist.count,
-                    'closure_rate': round((dist.closed_count / dist.count * 100), 2)
+                    'closure_rate': _percentage(dist.closed_count, dist.count)
                 } for dist in response_time_distribution
             ],
             'daily_trends': [
                 {
-                    'date': trend.date.isoformat(),
+                    'date': trend.date,
                     'new_conversations': trend.new_conversations,
                     'closed_conversations': trend.closed_conversations,
-                    'closure_rate': round((trend.closed_conversations / trend.new_conversations * 100), 2) if trend.new_conversations > 0 else 0,
-                    'avg_messages_per_conversation': round(float(trend.avg_messages_per_conversation or 0), 2)
+                    'closure_rate': _percentage(trend.closed_conversations, trend.new_conversations),
+                    'avg_messages_per_conversation': trend.avg_messages_per_conversation
                 } for trend in daily_trends
             ]
         }
@@ -476,14 +690,22 @@ class QueryEngine:
         - Error pattern analysis
         - Efficiency metrics
         """
+        return _ANALYTICS_CACHE.get_or_compute(
+            ('get_automation_performance_analytics', days),
+            lambda: self._get_automation_performance_analytics(days),
+            ttl=30
+        )
+    
+    def _get_automation_performance_analytics(self, days=7):
+        """get_automation_performance_analytics without the cache"""
         
         start_date = datetime.utcnow() - timedelta(days=days)
         
         # Overall automation performance metrics
         overall_performance = self.db.session.query(
             func.count(AutomationRun.id).label('total_runs'),
-            func.sum(case((AutomationRun.status == 'completed', 1), else_=0)).label('successful_runs'),
-            func.sum(case((AutomationRun.status == 'failed', 1), else_=0)).label('failed_runs'),
+            func.count().filter(AutomationRun.status == 'completed').label('successful_runs'),
+            func.count().filter(AutomationRun.status == 'failed').label('failed_runs'),
             func.avg(AutomationRun.duration_seconds).label('avg_duration'),
             func.sum(AutomationRun.conversations_checked).label('total_conversations_checked'),
             func.sum(AutomationRun.new_messages_found).label('total_new_messages'),
@@ -492,37 +714,50 @@ class QueryEngine:
             func.sum(AutomationRun.errors_encountered).label('total_errors')
         ).filter(AutomationRun.start_time >= start_date).first()
         
-        # Performance by account
+        # Performance by account (rows streamed into the result below)
         account_performance = self.db.session.query(
             FacebookAccount.display_name,
             func.count(AutomationRun.id).label('total_runs'),
-            func.sum(case((AutomationRun.status == 'completed', 1), else_=0)).label('successful_runs'),
-            func.avg(AutomationRun.duration_seconds).label('avg_duration'),
+            func.count().filter(AutomationRun.status == 'completed').label('successful_runs'),
+            _rounded(func.avg(AutomationRun.duration_seconds), 2).label('avg_duration'),
             func.sum(AutomationRun.messages_processed).label('messages_processed'),
             func.sum(AutomationRun.responses_sent).label('responses_sent'),
-            func.avg(AutomationRun.success_rate).label('avg_success_rate')
+            _rounded(func.avg(AutomationRun.success_rate), 2).label('avg_success_rate')
         ).join(AutomationRun).filter(
             AutomationRun.start_time >= start_date
-        ).group_by(FacebookAccount.id).all()
+        ).group_by(FacebookAccount.id).yield_per(1000)
         
-        # Daily performance trends
-        daily_performance = self.db.session.query(
+        # Daily performance trends, one row for every day in the window
+        # (zeros on days without runs)
+        daily_counts = self.db.session.query(
             func.date(AutomationRun.start_time).label('date'),
             func.count(AutomationRun.id).label('total_runs'),
-            func.sum(case((AutomationRun.status == 'completed', 1), else_=0)).label('successful_runs'),
+            func.count().filter(AutomationRun.status == 'completed').label('successful_runs'),
             func.avg(AutomationRun.duration_seconds).label('avg_duration'),
             func.sum(AutomationRun.messages_processed).label('messages_processed'),
             func.sum(AutomationRun.responses_sent).label('responses_sent')
         ).filter(
             AutomationRun.start_time >= start_date
-        ).group_by(func.date(AutomationRun.start_time)).order_by('date').all()
+        ).group_by(func.date(AutomationRun.start_time)).subquery()
+        
+        dates = _dates_between(start_date, datetime.utcnow())
+        daily_performance = self.db.session.query(
+            dates.c.date,
+            func.coalesce(daily_counts.c.total_runs, 0).label('total_runs'),
+            func.coalesce(daily_counts.c.successful_runs, 0).label('successful_runs'),
+            _rounded(daily_counts.c.avg_duration, 2).label('avg_duration'),
+            func.coalesce(daily_counts.c.messages_processed, 0).label('messages_processed'),
+            func.coalesce(daily_counts.c.responses_sent, 0).label('responses_sent')
+        ).outerjoin(
+            daily_counts, daily_counts.c.date == dates.c.date
+        ).order_by(dates.c.date).all()
         
         # Error analysis from validation logs
         error_analysis = self.db.session.query(
             ValidationLog.validation_type,
             func.count(ValidationLog.id).label('total_validations'),
-            func.sum(case((ValidationLog.validation_status == 'failed', 1), else_=0)).label('failed_validations'),
-            func.sum(case((ValidationLog.validation_status == 'warning', 1), else_=0)).label('warning_validations')
+            func.count().filter(ValidationLog.validation_status == 'failed').label('failed_validations'),
+            func.count().filter(ValidationLog.validation_status == 'warning').label('warning_validations')
         ).filter(
             ValidationLog.timestamp >= start_date
         ).group_by(ValidationLog.validation_type).all()
@@ -552,24 +787,24 @@ class QueryEngine:
                     'account_name': perf.display_name,
                     'total_runs': perf.total_runs,
                     'successful_runs': perf.successful_runs,
-                    'success_rate': round((perf.successful_runs / perf.total_runs * 100), 2) if perf.total_runs > 0 else 0,
-                    'avg_duration_seconds': round(float(perf.avg_duration or 0), 2),
+                    'success_rate': _percentage(perf.successful_runs, perf.total_runs),
+                    'avg_duration_seconds': perf.avg_duration,
                     'messages_processed': perf.messages_processed,
                     'responses_sent': perf.responses_sent,
-                    'response_rate': round((perf.responses_sent / perf.messages_processed * 100), 2) if perf.messages_processed > 0 else 0,
-                    'avg_success_rate': round(float(perf.avg_success_rate or 0), 2)
+                    'response_rate': _percentage(perf.responses_sent, perf.messages_processed),
+                    'avg_success_rate': perf.avg_success_rate
                 } for perf in account_performance
             ],
             'daily_trends': [
                 {
-                    'date': trend.date.isoformat(),
+                    'date': trend.date,
                     'total_runs': trend.total_runs,
                     'successful_runs': trend.successful_runs,
-                    'success_rate': round((trend.successful_runs / trend.total_runs * 100), 2) if trend.total_runs > 0 else 0,
-                    'avg_duration_seconds': round(float(trend.avg_duration or 0), 2),
+                    'success_rate': _percentage(trend.successful_runs, trend.total_runs),
+                    'avg_duration_seconds': trend.avg_duration,
                     'messages_processed': trend.messages_processed,
                     'responses_sent': trend.responses_sent,
-                    'processing_efficiency': round((trend.responses_sent / trend.messages_processed * 100), 2) if trend.messages_processed > 0 else 0
+                    'processing_efficiency': _percentage(trend.responses_sent, trend.messages_processed)
                 } for trend in daily_performance
             ],
             'error_analysis': [
@@ -578,8 +813,8 @@ class QueryEngine:
                     'total_validations': error.total_validations,
                     'failed_validations': error.failed_validations,
                     'warning_validations': error.warning_validations,
-                    'failure_rate': round((error.failed_validations / error.total_validations * 100), 2) if error.total_validations > 0 else 0,
-                    'warning_rate': round((error.warning_validations / error.total_validations * 100), 2) if error.total_validations > 0 else 0
+                    'failure_rate': _percentage(error.failed_validations, error.total_validations),
+                    'warning_rate': _percentage(error.warning_validations, error.total_validations)
                 } for error in error_analysis
             ]
         }
@@ -598,44 +833,32 @@ class QueryEngine:
         - Active processes
         - Alert conditions
         """
+        # Polled every few seconds: while one caller refreshes an expired
+        # result the others keep getting the previous one
+        return _ANALYTICS_CACHE.get_or_compute(
+            'get_real_time_metrics',
+            self._get_real_time_metrics,
+            ttl=3,
+            serve_stale=True
+        )
+    
+    def _get_real_time_metrics(self):
+        """get_real_time_metrics without the cache"""
         
         # Current time windows
         now = datetime.utcnow()
         last_hour = now - timedelta(hours=1)
         last_5_minutes = now - timedelta(minutes=5)
         
-        # Recent activity metrics
-        recent_activity = self.db.session.query(
-            func.count(Message.id).label('messages_last_hour'),
-            func.sum(case((Message.timestamp >= last_5_minutes, 1), else_=0)).label('messages_last_5min'),
-            func.sum(case((and_(Message.is_from_customer == True, Message.timestamp >= last_hour), 1), else_=0)).label('customer_messages_last_hour'),
-            func.sum(case((and_(Message.is_automated_response == True, Message.timestamp >= last_hour), 1), else_=0)).label('bot_responses_last_hour')
-        ).filter(Message.timestamp >= last_hour).first()
-        
-        # Active automation runs
-        active_runs = self.db.session.query(
-            func.count(AutomationRun.id).label('active_runs')
-        ).filter(AutomationRun.status == 'running').first()
-        
-        # System health indicators
-        health_indicators = self.db.session.query(
-            func.count(FacebookAccount.id).label('total_accounts'),
-            func.sum(case((and_(FacebookAccount.is_active == True, FacebookAccount.is_locked == False), 1), else_=0)).label('healthy_accounts'),
-            func.sum(case((Message.is_processed == False, 1), else_=0)).label('unprocessed_messages'),
-            func.count(Conversation.id).label('active_conversations')
-        ).outerjoin(Message, and_(Message.is_from_customer == True, Message.is_processed == False)).outerjoin(Conversation, Conversation.status == 'active').first()
-        
-        # Recent errors and warnings
-        recent_issues = self.db.session.query(
-            func.count(ValidationLog.id).label('total_validations'),
-            func.sum(case((ValidationLog.validation_status == 'failed', 1), else_=0)).label('failed_validations'),
-            func.sum(case((ValidationLog.validation_status == 'warning', 1), else_=0)).label('warning_validations')
-        ).filter(ValidationLog.timestamp >= last_hour).first()
+        # All four monitoring blocks in one prebuilt statement (see REAL_TIME_METRICS_STATEMENT)
+        metrics = self.db.session.execute(
+            REAL_TIME_METRICS_STATEMENT, {'last_hour': last_hour, 'last_5_minutes': last_5_minutes}
+        ).one()
         
         # Calculate alert conditions
-        account_health_rate = (health_indicators.healthy_accounts / health_indicators.total_accounts * 100) if health_indicators.total_accounts > 0 else 0
-        processing_backlog = health_indicators.unprocessed_messages or 0
-        error_rate = (recent_issues.failed_validations / recent_issues.total_validations * 100) if recent_issues.total_validations > 0 else 0
+        account_health_rate = (metrics.healthy_accounts / metrics.total_accounts * 100) if metrics.total_accounts > 0 else 0
+        processing_backlog = metrics.unprocessed_messages or 0
+        error_rate = (metrics.failed_validations / metrics.total_validations * 100) if metrics.total_validations > 0 else 0
         
         # Determine alert levels
         alerts = []
@@ -663,24 +886,24 @@ class QueryEngine:
         return {
             'timestamp': now.isoformat(),
             'recent_activity': {
-                'messages_last_hour': recent_activity.messages_last_hour,
-                'messages_last_5min': recent_activity.messages_last_5min,
-                'customer_messages_last_hour': recent_activity.customer_messages_last_hour,
-                'bot_responses_last_hour': recent_activity.bot_responses_last_hour,
-                'response_rate_last_hour': round((recent_activity.bot_responses_last_hour / recent_activity.customer_messages_last_hour * 100), 2) if recent_activity.customer_messages_last_hour > 0 else 0
+                'messages_last_hour': metrics.messages_last_hour,
+                'messages_last_5min': metrics.messages_last_5min,
+                'customer_messages_last_hour': metrics.customer_messages_last_hour,
+                'bot_responses_last_hour': metrics.bot_responses_last_hour,
+                'response_rate_last_hour': _percentage(metrics.bot_responses_last_hour, metrics.customer_messages_last_hour)
             },
             'system_status': {
-                'active_automation_runs': active_runs.active_runs,
-                'total_accounts': health_indicators.total_accounts,
-                'healthy_accounts': health_indicators.healthy_accounts,
+                'active_automation_runs': metrics.active_runs,
+                'total_accounts': metrics.total_accounts,
+                'healthy_accounts': metrics.healthy_accounts,
                 'account_health_rate': round(account_health_rate, 2),
                 'unprocessed_messages': processing_backlog,
-                'active_conversations': health_indicators.active_conversations
+                'active_conversations': metrics.active_conversations
             },
             'recent_issues': {
-                'total_validations': recent_issues.total_validations,
-                'failed_validations': recent_issues.failed_validations,
-                'warning_validations': recent_issues.warning_validations,
+                'total_validations': metrics.total_validations,
+                'failed_validations': metrics.failed_validations,
+                'warning_validations': metrics.warning_validations,
                 'error_rate': round(error_rate, 2)
             },
             'alerts': alerts,
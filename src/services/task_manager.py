@@ -10,18 +10,24 @@ This service handles:
 6. Task dependency management
 """
 
+import heapq
+import itertools
 import json
+from collections import OrderedDict
 import logging
 import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Callable
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from queue import Queue, PriorityQueue
 from concurrent.futures import ThreadPoolExecutor, Future
+import numpy as np
+from sqlalchemy import delete
 from src.models import db
 from src.models.automation_run import AutomationRun
+from src.models.facebook_account import FacebookAccount
 from src.services.automation_service import AutomationService
 from src.services.validation_service import ValidationService
 
@@ -43,7 +49,8 @@ class TaskPriority(Enum):
     URGENT = 4
     CRITICAL = 5
 
-@dataclass
+# Slotted: tasks are kept for the life of the manager, so skip the per-instance __dict__
+@dataclass(slots=True)
 class Task:
     """Task definition class"""
     id: str
@@ -66,6 +73,7 @@ class Task:
     metadata: dict = None
     result: Any = None
     error: str = None
+    queue: str = 'default'
     
     def __post_init__(self):
         if self.kwargs is None:
@@ -79,39 +87,95 @@ class Task:
         if self.metadata is None:
             self.metadata = {}
     
-    def __lt__(self, other):
-        """For priority queue ordering"""
-        return self.priority.value > other.priority.value  # Higher priority value = higher priority
-    
     def to_dict(self) -> dict:
         """Convert task to dictionary for serialization"""
-        task_dict = asdict(self)
-        # Convert datetime objects to ISO strings
-        for field in ['created_at', 'scheduled_at', 'started_at', 'completed_at']:
-            if task_dict[field]:
-                task_dict[field] = task_dict[field].isoformat()
-        # Convert enums to values
-        task_dict['priority'] = self.priority.value
-        task_dict['status'] = self.status.value
-        # Remove function reference for serialization
-        task_dict.pop('function', None)
-        return task_dict
+        # Built field by field: asdict() would deep-copy the bound task function
+        # (and its owning manager), which is both slow and unpicklable
+        return {
+            'id': self.id,
+            'name': self.name,
+            'task_type': self.task_type,
+            'args': self.args,
+            'kwargs': self.kwargs,
+            'priority': self.priority.value,
+            'status': self.status.value,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'scheduled_at': self.scheduled_at.isoformat() if self.scheduled_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'retry_count': self.retry_count,
+            'max_retries': self.max_retries,
+            'retry_delay': self.retry_delay,
+            'timeout': self.timeout,
+            'dependencies': self.dependencies,
+            'metadata': self.metadata,
+            'result': self.result,
+            'error': self.error,
+            'queue': self.queue
+        }
+
+# Worker slots per named queue; validation runs and browser-bound automation
+# cycles get their own bounded pools so they can neither starve nor be
+# starved by general work
+DEFAULT_QUEUE_WORKERS = {'validation': 2, 'browser': 3, 'default': 5}
+
+# Task types routed to a non-default queue when no queue is given
+DEFAULT_TASK_QUEUES = {'validate_system': 'validation', 'automation_cycle': 'browser'}
+
+# Statuses a task only leaves through a manual retry
+FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+# Finished tasks kept for lookups and history; beyond this the oldest are dropped
+MAX_FINISHED_TASKS = 10000
+
+# Most recent task execution times kept for the duration percentiles
+DURATION_SAMPLES = 10000
+
+# Upper bound on how long the worker loop sleeps between wakeups; queueing,
+# task completion and stop() all wake it early
+WORKER_MAX_WAIT = 30  # seconds
 
 class TaskManager:
     """Comprehensive task management system"""
     
-    def __init__(self, max_workers: int = 5):
-        self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.task_queue = PriorityQueue()
+    def __init__(self, max_workers: int = 5, queue_workers: Dict[str, int] = None):
+        self.queue_workers = dict(queue_workers or {**DEFAULT_QUEUE_WORKERS, 'default': max_workers})
+        self.max_workers = sum(self.queue_workers.values())
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # Entries are (-priority, seq, task): higher priority first, FIFO within
+        # a priority, and the heap only ever compares ints
+        self.task_queues: Dict[str, PriorityQueue] = {name: PriorityQueue() for name in self.queue_workers}
+        self._queue_seq = itertools.count()
+        self.task_type_queues: Dict[str, str] = dict(DEFAULT_TASK_QUEUES)
         self.tasks: Dict[str, Task] = {}
         self.running_tasks: Dict[str, Future] = {}
         self.completed_tasks: Dict[str, Task] = {}
         self.failed_tasks: Dict[str, Task] = {}
+        # Secondary indexes over self.tasks so lookups by status or type don't
+        # scan the whole history; buckets are insertion-ordered dicts used as
+        # sets and are kept current by _set_status()
+        self._by_status: Dict[TaskStatus, Dict[str, None]] = {status: {} for status in TaskStatus}
+        self._by_type: Dict[str, Dict[str, None]] = {}
+        # Finished task IDs, oldest first, for evicting past max_finished_tasks
+        self._finished: OrderedDict = OrderedDict()
+        # Number of unfinished tasks depending on each task ID; a task listed
+        # here is kept (not evicted or removed) until its dependents finish
+        self._dependents: Dict[str, int] = {}
+        self.max_finished_tasks = MAX_FINISHED_TASKS
+        # (scheduled_at, task_id) for tasks left pending at creation; entries
+        # whose task has since moved on are skipped when popped
+        self._scheduled_heap: List[tuple] = []
         
         self.logger = logging.getLogger(__name__)
         self.is_running = False
         self.worker_thread = None
+        # Wakes the worker loop when work is queued, a task finishes or the manager stops
+        self._cv = threading.Condition()
+        # Guards task status transitions (and the status index) and the
+        # metrics across the worker loop, pool threads and request handlers
+        self._state_lock = threading.Lock()
+        self.app = None
+        self._task_seq = itertools.count(1)
         
         # Task type registry
         self.task_registry = {}
@@ -127,6 +191,10 @@ class TaskManager:
             'tasks_per_minute': 0,
             'last_reset': datetime.utcnow()
         }
+        # Ring buffer of recent execution times (seconds); _duration_count
+        # is the total recorded, so the write slot is count % size
+        self._durations = np.zeros(DURATION_SAMPLES)
+        self._duration_count = 0
         
         # Validation service
         self.validation_service = ValidationService()
@@ -134,6 +202,10 @@ class TaskManager:
         # Automation service
         self.automation_service = AutomationService()
     
+    def init_app(self, app):
+        """Bind the Flask app so tasks run inside an application context"""
+        self.app = app
+    
     def start(self):
         """Start the task manager"""
         if not self.is_running:
@@ -145,6 +217,8 @@ class TaskManager:
     def stop(self):
         """Stop the task manager"""
         self.is_running = False
+        with self._cv:
+            self._cv.notify_all()
         if self.worker_thread:
             self.worker_thread.join(timeout=10)
         self.executor.shutdown(wait=True)
@@ -161,7 +235,8 @@ class TaskManager:
                    max_retries: int = 3,
                    timeout: int = 300,
                    dependencies: List[str] = None,
-                   metadata: dict = None) -> str:
+                   metadata: dict = None,
+                   queue: str = None) -> str:
         """
         Create a new task.
         
@@ -177,11 +252,21 @@ class TaskManager:
             timeout: Task timeout in seconds
             dependencies: List of task IDs this task depends on
             metadata: Additional task metadata
+            queue: Named worker queue (defaults to the task type's queue)
             
         Returns:
             Task ID string
         """
-        task_id = f"{task_type}_{int(time.time() * 1000)}"
+        # Sequence suffix keeps IDs unique when tasks are created in the same millisecond
+        task_id = f"{task_type}_{int(time.time() * 1000)}_{next(self._task_seq)}"
+        
+        if queue is None and task_type == 'automation_cycle' and not (kwargs or {}).get('account_id'):
+            # The all-accounts cycle only waits on the per-account cycles it
+            # dispatches; holding a browser slot meanwhile could starve them
+            queue = 'default'
+        queue = queue or self.task_type_queues.get(task_type, 'default')
+        if queue not in self.task_queues:
+            raise ValueError(f"Unknown task queue: {queue}")
         
         # Get function from registry if not provided
         if function is None:
@@ -201,15 +286,25 @@ class TaskManager:
             max_retries=max_retries,
             timeout=timeout,
             dependencies=dependencies or [],
-            metadata=metadata or {}
+            metadata=metadata or {},
+            queue=queue
         )
         
-        self.tasks[task_id] = task
-        self.metrics['total_tasks_created'] += 1
+        with self._state_lock:
+            self.tasks[task_id] = task
+            self._by_status[task.status][task_id] = None
+            self._by_type.setdefault(task_type, {})[task_id] = None
+            self._pin_dependencies(task, 1)
+            self.metrics['total_tasks_created'] += 1
         
         # Queue task if dependencies are met
         if self._dependencies_met(task):
             self._queue_task(task)
+        else:
+            # Let the worker recompute its next wakeup
+            with self._cv:
+                heapq.heappush(self._scheduled_heap, (task.scheduled_at, task_id))
+                self._cv.notify()
         
         self.logger.info(f"Created task {task_id}: {name}")
         return task_id
@@ -218,6 +313,15 @@ class TaskManager:
         """Get task by ID"""
         return self.tasks.get(task_id)
     
+    def remove_task(self, task_id: str) -> bool:
+        """Forget a task that is not queued or running and that no unfinished task depends on"""
+        with self._state_lock:
+            task = self.tasks.get(task_id)
+            if not task or task.status in (TaskStatus.QUEUED, TaskStatus.RUNNING) or task_id in self._dependents:
+                return False
+            self._forget(task_id)
+            return True
+    
     def get_task_status(self, task_id: str) -> Optional[TaskStatus]:
         """Get task status by ID"""
         task = self.get_task(task_id)
@@ -229,15 +333,14 @@ class TaskManager:
         if not task:
             return False
         
-        if task.status in [TaskStatus.PENDING, TaskStatus.QUEUED]:
-            task.status = TaskStatus.CANCELLED
+        if self._set_status(task, TaskStatus.CANCELLED, expected=(TaskStatus.PENDING, TaskStatus.QUEUED)):
             self.logger.info(f"Cancelled task {task_id}")
             return True
         elif task.status == TaskStatus.RUNNING:
             # Try to cancel running task
             future = self.running_tasks.get(task_id)
             if future and future.cancel():
-                task.status = TaskStatus.CANCELLED
+                self._set_status(task, TaskStatus.CANCELLED)
                 self.running_tasks.pop(task_id, None)
                 self.logger.info(f"Cancelled running task {task_id}")
                 return True
@@ -254,7 +357,8 @@ class TaskManager:
             self.logger.warning(f"Task {task_id} has exceeded max retries")
             return False
         
-        task.status = TaskStatus.RETRYING
+        if not self._set_status(task, TaskStatus.RETRYING, expected=(TaskStatus.FAILED,)):
+            return False
         task.retry_count += 1
         task.error = None
         
@@ -270,11 +374,11 @@ class TaskManager:
     
     def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
         """Get all tasks with specific status"""
-        return [task for task in self.tasks.values() if task.status == status]
+        return [self.tasks[task_id] for task_id in list(self._by_status[status])]
     
     def get_tasks_by_type(self, task_type: str) -> List[Task]:
         """Get all tasks of specific type"""
-        return [task for task in self.tasks.values() if task.task_type == task_type]
+        return [self.tasks[task_id] for task_id in list(self._by_type.get(task_type, {}))]
     
     def get_pending_tasks(self) -> List[Task]:
         """Get all pending tasks"""
@@ -291,37 +395,65 @@ class TaskManager:
     def get_metrics(self) -> Dict[str, Any]:
         """Get task manager performance metrics"""
         current_time = datetime.utcnow()
-        time_diff = (current_time - self.metrics['last_reset']).total_seconds()
-        
-        if time_diff > 0:
-            self.metrics['tasks_per_minute'] = (self.metrics['total_tasks_completed'] / time_diff) * 60
-        
-        if self.metrics['total_tasks_completed'] > 0:
-            self.metrics['average_execution_time'] = self.metrics['total_execution_time'] / self.metrics['total_tasks_completed']
+        # Worker threads update the counters and the ring buffer under the same lock
+        with self._state_lock:
+            time_diff = (current_time - self.metrics['last_reset']).total_seconds()
+            
+            if time_diff > 0:
+                self.metrics['tasks_per_minute'] = (self.metrics['total_tasks_completed'] / time_diff) * 60
+            
+            if self.metrics['total_tasks_completed'] > 0:
+                self.metrics['average_execution_time'] = self.metrics['total_execution_time'] / self.metrics['total_tasks_completed']
+            
+            metrics = dict(self.metrics)
+            samples = self._durations[:min(self._duration_count, DURATION_SAMPLES)].copy()
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99]) if samples.size else (0, 0, 0)
         
         return {
-            **self.metrics,
+            **metrics,
+            'execution_time_percentiles': {'p50': float(p50), 'p95': float(p95), 'p99': float(p99)},
             'active_tasks': len(self.running_tasks),
-            'queued_tasks': self.task_queue.qsize(),
+            'queued_tasks': self.queued_count(),
+            'queues': self.get_queue_stats(),
             'total_tasks': len(self.tasks),
-            'success_rate': (self.metrics['total_tasks_completed'] / max(1, self.metrics['total_tasks_created'])) * 100
+            'success_rate': (metrics['total_tasks_completed'] / max(1, metrics['total_tasks_created'])) * 100
+        }
+    
+    def queued_count(self) -> int:
+        """Get the number of tasks waiting across all queues"""
+        return sum(q.qsize() for q in self.task_queues.values())
+    
+    def get_queue_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get queued/running counts and worker limits per named queue"""
+        running = self._running_by_queue()
+        return {
+            name: {
+                'workers': self.queue_workers[name],
+                'queued': q.qsize(),
+                'running': running.get(name, 0)
+            }
+            for name, q in self.task_queues.items()
         }
     
     def reset_metrics(self):
         """Reset performance metrics"""
-        self.metrics = {
-            'total_tasks_created': 0,
-            'total_tasks_completed': 0,
-            'total_tasks_failed': 0,
-            'total_execution_time': 0,
-            'average_execution_time': 0,
-            'tasks_per_minute': 0,
-            'last_reset': datetime.utcnow()
-        }
+        with self._state_lock:
+            self.metrics = {
+                'total_tasks_created': 0,
+                'total_tasks_completed': 0,
+                'total_tasks_failed': 0,
+                'total_execution_time': 0,
+                'average_execution_time': 0,
+                'tasks_per_minute': 0,
+                'last_reset': datetime.utcnow()
+            }
+            self._duration_count = 0
     
-    def register_task_type(self, task_type: str, function: Callable):
-        """Register a new task type"""
+    def register_task_type(self, task_type: str, function: Callable, queue: str = None):
+        """Register a new task type, optionally routing it to a named queue"""
         self.task_registry[task_type] = function
+        if queue:
+            self.task_type_queues[task_type] = queue
         self.logger.info(f"Registered task type: {task_type}")
     
     def _register_default_tasks(self):
@@ -338,19 +470,23 @@ class TaskManager:
         """Main worker loop for processing tasks"""
         while self.is_running:
             try:
-                # Check for scheduled tasks
-                self._check_scheduled_tasks()
-                
-                # Process queued tasks
-                if not self.task_queue.empty() and len(self.running_tasks) < self.max_workers:
-                    task = self.task_queue.get_nowait()
-                    self._execute_task(task)
-                
-                # Check completed tasks
-                self._check_completed_tasks()
-                
-                # Brief sleep to prevent busy waiting
-                time.sleep(1)
+                # Holding the condition for the whole pass means a notify sent
+                # while dispatching is not lost before the wait below
+                with self._cv:
+                    # Check for scheduled tasks
+                    self._check_scheduled_tasks()
+                    
+                    # Process queued tasks, respecting each queue's worker limit.
+                    # Running counts are re-read per dispatch: a task that finishes
+                    # at once releases its slot (in _task_done) before we wait
+                    for name, task_queue in self.task_queues.items():
+                        while not task_queue.empty() and self._running_by_queue().get(name, 0) < self.queue_workers[name]:
+                            _, _, task = task_queue.get_nowait()
+                            self._execute_task(task)
+                    
+                    # Sleep until new work arrives or the next scheduled task is due
+                    if self.is_running:
+                        self._cv.wait(timeout=self._next_wakeup())
                 
             except Exception as e:
                 self.logger.error(f"Error in worker loop: {str(e)}")
@@ -360,42 +496,120 @@ class TaskManager:
         """Check for tasks that are ready to be queued"""
         current_time = datetime.utcnow()
         
-        for task in list(self.tasks.values()):
-            if (task.status == TaskStatus.PENDING and 
-                task.scheduled_at <= current_time and 
-                self._dependencies_met(task)):
+        # Only tasks at the front of the heap can be due
+        while self._scheduled_heap and self._scheduled_heap[0][0] <= current_time:
+            _, task_id = heapq.heappop(self._scheduled_heap)
+            task = self.tasks.get(task_id)
+            # Tasks with unmet dependencies are queued by _check_dependent_tasks instead
+            if task and task.status == TaskStatus.PENDING and self._dependencies_met(task):
                 self._queue_task(task)
     
+    def _next_wakeup(self) -> float:
+        """Seconds until the earliest scheduled pending task, capped at WORKER_MAX_WAIT"""
+        if not self._scheduled_heap:
+            return WORKER_MAX_WAIT
+        delay = (self._scheduled_heap[0][0] - datetime.utcnow()).total_seconds()
+        return max(0, min(WORKER_MAX_WAIT, delay))
+    
+    def _set_status(self, task: Task, status: TaskStatus, expected: tuple = None) -> bool:
+        """
+        Change a task's status and move it to the matching status bucket.
+        
+        Args:
+            task: Task to update
+            status: New status
+            expected: Only change the status if the task is currently in one of these
+            
+        Returns:
+            True if the status was changed
+        """
+        with self._state_lock:
+            if expected is not None and task.status not in expected:
+                return False
+            was_finished = task.status in FINISHED_STATUSES
+            self._by_status[task.status].pop(task.id, None)
+            self._by_status[status][task.id] = None
+            task.status = status
+            
+            self._finished.pop(task.id, None)
+            if status in FINISHED_STATUSES:
+                self._finished[task.id] = None
+                if not was_finished:
+                    self._pin_dependencies(task, -1)
+                excess = len(self._finished) - self.max_finished_tasks
+                if excess > 0:
+                    # Oldest first, skipping tasks an unfinished task still depends on
+                    evictable = (task_id for task_id in self._finished if task_id not in self._dependents)
+                    for task_id in list(itertools.islice(evictable, excess)):
+                        self._forget(task_id)
+            elif was_finished:
+                self._pin_dependencies(task, 1)
+            return True
+    
+    def _pin_dependencies(self, task: Task, delta: int):
+        """Add delta to the dependent count of each of task's dependencies; caller holds _state_lock"""
+        for dep_id in task.dependencies:
+            count = self._dependents.get(dep_id, 0) + delta
+            if count > 0:
+                self._dependents[dep_id] = count
+            else:
+                self._dependents.pop(dep_id, None)
+    
+    def _forget(self, task_id: str):
+        """Drop a task from self.tasks and every index; caller holds _state_lock"""
+        task = self.tasks.pop(task_id, None)
+        if task:
+            self._by_status[task.status].pop(task_id, None)
+            self._by_type[task.task_type].pop(task_id, None)
+            if task.status not in FINISHED_STATUSES:
+                self._pin_dependencies(task, -1)
+        self._finished.pop(task_id, None)
+    
     def _queue_task(self, task: Task):
         """Add task to execution queue"""
-        task.status = TaskStatus.QUEUED
-        self.task_queue.put(task)
+        # Only one of the paths that can queue a task (creation, schedule,
+        # dependency completion, retry) gets to queue it
+        if not self._set_status(task, TaskStatus.QUEUED, expected=(TaskStatus.PENDING, TaskStatus.RETRYING)):
+            return
+        self.task_queues[task.queue].put((-task.priority.value, next(self._queue_seq), task))
+        with self._cv:
+            self._cv.notify()
         self.logger.debug(f"Queued task {task.id}")
     
-    def _execute_task(self, task: Task):
-        """Execute a task"""
-        task.status = TaskStatus.RUNNING
+    def _execute_task(self, task: Task) -> bool:
+        """Execute a task; returns False if it was cancelled while queued"""
+        if not self._set_status(task, TaskStatus.RUNNING, expected=(TaskStatus.QUEUED,)):
+            return False
         task.started_at = datetime.utcnow()
         
         # Submit task to thread pool
         future = self.executor.submit(self._run_task, task)
         self.running_tasks[task.id] = future
+        future.add_done_callback(lambda _, task_id=task.id: self._task_done(task_id))
         
         self.logger.info(f"Started executing task {task.id}: {task.name}")
+        return True
     
     def _run_task(self, task: Task) -> Any:
         """Run the actual task function"""
         try:
-            # Execute the task function
-            result = task.function(*task.args, **task.kwargs)
+            # Execute the task function (with its own app context and session when bound to an app)
+            if self.app is not None:
+                with self.app.app_context():
+                    result = task.function(*task.args, **task.kwargs)
+            else:
+                result = task.function(*task.args, **task.kwargs)
             task.result = result
-            task.status = TaskStatus.COMPLETED
+            self._set_status(task, TaskStatus.COMPLETED)
             task.completed_at = datetime.utcnow()
             
-            # Update metrics
+            # Update metrics; several pool threads can finish at once
             execution_time = (task.completed_at - task.started_at).total_seconds()
-            self.metrics['total_execution_time'] += execution_time
-            self.metrics['total_tasks_completed'] += 1
+            with self._state_lock:
+                self.metrics['total_execution_time'] += execution_time
+                self.metrics['total_tasks_completed'] += 1
+                self._durations[self._duration_count % DURATION_SAMPLES] = execution_time
+                self._duration_count += 1
             
             self.logger.info(f"Completed task {task.id} in {execution_time:.2f}s")
             
@@ -406,10 +620,11 @@ class TaskManager:
             
         except Exception as e:
             task.error = str(e)
-            task.status = TaskStatus.FAILED
+            self._set_status(task, TaskStatus.FAILED)
             task.completed_at = datetime.utcnow()
             
-            self.metrics['total_tasks_failed'] += 1
+            with self._state_lock:
+                self.metrics['total_tasks_failed'] += 1
             
             self.logger.error(f"Task {task.id} failed: {str(e)}")
             
@@ -419,42 +634,100 @@ class TaskManager:
             
             raise
     
-    def _check_completed_tasks(self):
-        """Check for completed running tasks"""
-        completed_task_ids = []
-        
-        for task_id, future in self.running_tasks.items():
-            if future.done():
-                completed_task_ids.append(task_id)
-        
-        for task_id in completed_task_ids:
+    def _running_by_queue(self) -> Dict[str, int]:
+        """Count running tasks per named queue"""
+        counts: Dict[str, int] = {}
+        for task_id in list(self.running_tasks):
+            task = self.tasks.get(task_id)
+            if task:
+                counts[task.queue] = counts.get(task.queue, 0) + 1
+        return counts
+    
+    def _task_done(self, task_id: str):
+        """Future callback: release the task's worker slot and wake the worker loop (and any _wait_for_tasks callers)"""
+        with self._cv:
             self.running_tasks.pop(task_id, None)
+            self._cv.notify_all()
     
     def _dependencies_met(self, task: Task) -> bool:
-        """Check if all task dependencies are completed"""
+        """
+        Check if all task dependencies are completed.
+        
+        A dependency the manager no longer holds counts as met: finished
+        tasks are only evicted once no unfinished task depends on them, so
+        an unknown ID is one that finished and was dropped before this task
+        was created.
+        """
         for dep_id in task.dependencies:
             dep_task = self.get_task(dep_id)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED:
+            if dep_task and dep_task.status != TaskStatus.COMPLETED:
                 return False
         return True
     
     def _check_dependent_tasks(self, completed_task_id: str):
         """Check for tasks that depend on the completed task"""
-        for task in self.tasks.values():
-            if (task.status == TaskStatus.PENDING and 
-                completed_task_id in task.dependencies and 
+        for task in self.get_pending_tasks():
+            if (completed_task_id in task.dependencies and 
                 self._dependencies_met(task)):
                 self._queue_task(task)
     
     # Default task implementations
     
     def _run_automation_cycle(self, account_id: int = None) -> Dict[str, Any]:
-        """Run automation cycle for specified account or all accounts"""
+        """
+        Run automation cycle for specified account or all accounts.
+        
+        For all accounts, one automation_cycle task is dispatched per account
+        onto the browser queue so accounts run on separate workers; the cycle
+        waits for them and returns the same summary as run_all_accounts().
+        """
         try:
             if account_id:
-                result = self.automation_service.run_automation_cycle(account_id)
+                # Fresh service per task: current_run is per-cycle state and
+                # several browser workers may run cycles concurrently
+                result = AutomationService().run_automation_cycle(account_id)
             else:
-                result = self.automation_service.run_all_accounts()
+                accounts = db.session.query(FacebookAccount.id, FacebookAccount.display_name).filter_by(
+                    is_active=True, is_locked=False
+                ).all()
+                # No retries on the per-account tasks, so each one finishes once;
+                # a failed account is reported in the summary like run_all_accounts does
+                task_ids = {
+                    account.id: self.create_task(
+                        name=f"Automation Cycle - Account {account.id}",
+                        task_type='automation_cycle',
+                        kwargs={'account_id': account.id},
+                        max_retries=0,
+                        metadata={'dispatched_by': 'automation_cycle', 'account_id': account.id}
+                    )
+                    for account in accounts
+                }
+                self._wait_for_tasks(task_ids.values())
+                
+                results = []
+                for account in accounts:
+                    task = self.get_task(task_ids[account.id])
+                    if task and task.status == TaskStatus.COMPLETED:
+                        results.append({
+                            'account_id': account.id,
+                            'account_name': account.display_name,
+                            'success': True,
+                            'summary': task.result['result']['summary']
+                        })
+                    else:
+                        results.append({
+                            'account_id': account.id,
+                            'account_name': account.display_name,
+                            'success': False,
+                            'error': task.error if task and task.error else 'Automation cycle did not complete'
+                        })
+                
+                result = {
+                    'accounts_processed': len(accounts),
+                    'successful_accounts': len([r for r in results if r['success']]),
+                    'failed_accounts': len([r for r in results if not r['success']]),
+                    'results': results
+                }
             
             return {
                 'success': True,
@@ -465,6 +738,18 @@ class TaskManager:
             self.logger.error(f"Automation cycle failed: {str(e)}")
             raise
     
+    def _wait_for_tasks(self, task_ids):
+        """Block until the given tasks have finished (or the manager stops)"""
+        def finished():
+            for task_id in task_ids:
+                task = self.get_task(task_id)
+                if task and task.status not in FINISHED_STATUSES:
+                    return False
+            return True
+        
+        with self._cv:
+            self._cv.wait_for(lambda: finished() or not self.is_running)
+    
     def _process_messages(self, limit: int = 50) -> Dict[str, Any]:
         """Process unprocessed messages"""
         try:
@@ -498,15 +783,15 @@ class TaskManager:
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days_old)
             
-            # Clean up old automation runs
-            old_runs = AutomationRun.query.filter(
-                AutomationRun.created_at < cutoff_date,
-                AutomationRun.status.in_(['completed', 'failed'])
-            ).all()
-            
-            deleted_count = len(old_runs)
-            for run in old_runs:
-                db.session.delete(run)
+            # Clean up old automation runs in a single DELETE; nothing references
+            # automation runs, so the rows need not be loaded first
+            result = db.session.execute(
+                delete(AutomationRun).where(
+                    AutomationRun.created_at < cutoff_date,
+                    AutomationRun.status.in_(['completed', 'failed'])
+                )
+            )
+            deleted_count = result.rowcount
             
             db.session.commit()
             
@@ -568,7 +853,7 @@ class TaskManager:
                 'database_connected': True,
                 'task_manager_running': self.is_running,
                 'active_tasks': len(self.running_tasks),
-                'queued_tasks': self.task_queue.qsize(),
+                'queued_tasks': self.queued_count(),
                 'timestamp': datetime.utcnow().isoformat()
             }
             
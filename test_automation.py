@@ -4,9 +4,14 @@ import sys
 # Add src to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.main import app
+from src.main import create_app
 from src.services.automation_service import AutomationService
 from src.models import FacebookAccount
+from src.services.data_seeder import seed_database
+
+# Only the database and models; the API, background services and the
+# seeding done at server startup aren't run, so the test seeds on its own
+app = create_app('testing')
 
 def run_test():
     """Runs the full automation cycle for a test account."""
@@ -14,9 +19,14 @@ def run_test():
         # Find a test account to use. Let's use the first active one.
         test_account = FacebookAccount.query.filter_by(is_active=True, is_locked=False).first()
 
+        if not test_account:
+            # e.g. a fresh checkout, where the server has never seeded the database
+            print("No active, unlocked test account found in the database; seeding sample data.")
+            seed_database()
+            test_account = FacebookAccount.query.filter_by(is_active=True, is_locked=False).first()
+
         if not test_account:
             print("No active, unlocked test account found in the database.")
-            print("Please run the seeder first.")
             return
 
         print(f"--- Starting E2E Automation Test for account: {test_account.email} ---")
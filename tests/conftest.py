@@ -0,0 +1,22 @@
+import os
+import sys
+
+# Add the repository root to the path so `src` is importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from src.main import create_app
+from src.models import db
+from src.services.data_seeder import seed_database
+
+
+@pytest.fixture
+def app(tmp_path):
+    """A testing app on its own SQLite database, seeded with the sample data."""
+    app = create_app('testing', database_uri=f"sqlite:///{tmp_path / 'app.db'}")
+    with app.app_context():
+        seed_database()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
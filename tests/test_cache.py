@@ -0,0 +1,97 @@
+import threading
+import time
+
+from src.services.cache import TTLCache
+
+
+def test_get_or_compute_reuses_value_until_expiry():
+    cache = TTLCache(ttl=0.05)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute('key', loader) == 1
+    assert cache.get_or_compute('key', loader) == 1
+    time.sleep(0.06)
+    assert cache.get('key') is None
+    assert cache.get_or_compute('key', loader) == 2
+
+
+def test_force_refresh_and_validator_bypass_cached_value():
+    cache = TTLCache(ttl=60)
+    cache.set('key', 'old')
+
+    assert cache.get_or_compute('key', lambda: 'new', validator=lambda value: value == 'old') == 'old'
+    assert cache.get_or_compute('key', lambda: 'new', validator=lambda value: value != 'old') == 'new'
+    assert cache.get_or_compute('key', lambda: 'forced', force_refresh=True) == 'forced'
+
+
+def test_invalidate_drops_one_or_all_entries():
+    cache = TTLCache(ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    cache.invalidate('a')
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+    cache.invalidate()
+    assert cache.get('b') is None
+
+
+def test_long_expired_entries_are_pruned():
+    cache = TTLCache(ttl=0.05)
+    cache.set('old', 1)
+    time.sleep(0.11)
+    cache.set('new', 2)
+
+    assert 'old' not in cache._entries
+    assert 'new' in cache._entries
+
+
+def _slow_loader(calls, started, release):
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return len(calls)
+    return loader
+
+
+def test_concurrent_misses_run_the_loader_once():
+    cache = TTLCache(ttl=60)
+    calls, started, release = [], threading.Event(), threading.Event()
+    loader = _slow_loader(calls, started, release)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('key', loader))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [1, 1]
+
+
+def test_serve_stale_returns_expired_value_during_refresh():
+    cache = TTLCache(ttl=60)
+    cache.set('key', 'stale', ttl=0)
+    calls, started, release = [], threading.Event(), threading.Event()
+    refresher = threading.Thread(
+        target=cache.get_or_compute, args=('key', _slow_loader(calls, started, release)), kwargs={'serve_stale': True}
+    )
+    refresher.start()
+    assert started.wait(5)
+
+    assert cache.get_or_compute('key', lambda: 'unused', serve_stale=True) == 'stale'
+
+    release.set()
+    refresher.join(5)
+    assert cache.get('key') == 1
+    assert len(calls) == 1
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models import db, Conversation
+from src.models.conversation import compute_message_stats
+
+STAT_FIELDS = (
+    'message_count', 'customer_message_count', 'bot_response_count', 'unread_count',
+    'last_message_time', 'last_customer_message_time', 'last_bot_response_time',
+    'response_time_avg_minutes'
+)
+
+
+def test_compute_message_stats():
+    start = datetime(2026, 1, 1, 12, 0)
+    stats = compute_message_stats([
+        (start, True, True),
+        (start + timedelta(minutes=5), False, True),
+        (start + timedelta(minutes=10), True, False),
+        (start + timedelta(minutes=30), False, True),
+        (start + timedelta(minutes=40), True, False),
+    ])
+
+    assert stats['message_count'] == 5
+    assert stats['customer_message_count'] == 3
+    assert stats['bot_response_count'] == 2
+    assert stats['unread_count'] == 2
+    assert stats['last_message_time'] == start + timedelta(minutes=40)
+    assert stats['last_customer_message_time'] == start + timedelta(minutes=40)
+    assert stats['last_bot_response_time'] == start + timedelta(minutes=30)
+    # Only the first two customer messages have a later bot response: (5 + 20) / 2
+    assert stats['response_time_avg_minutes'] == pytest.approx(12.5)
+
+
+def test_compute_message_stats_without_messages():
+    stats = compute_message_stats([])
+
+    assert stats['message_count'] == stats['unread_count'] == 0
+    assert 'last_message_time' not in stats
+    assert 'response_time_avg_minutes' not in stats
+
+
+def test_seeded_stats_match_a_per_conversation_update(app):
+    conversations = db.session.scalars(db.select(Conversation)).all()
+
+    assert conversations
+    for conversation in conversations:
+        seeded = {field: getattr(conversation, field) for field in STAT_FIELDS}
+        conversation.update_message_stats()
+        assert {field: getattr(conversation, field) for field in STAT_FIELDS} == pytest.approx(seeded)
@@ -0,0 +1,67 @@
+import pytest
+
+from src.models import db, Message, MessageTemplate
+from src.models.message import MESSAGE_CLASSIFIERS, classify_text, render_template_text
+
+
+def _classify_by_category(message_text):
+    """The per-category substring checks classify_text replaced."""
+    text = message_text.lower()
+    for message_type, confidence, keywords in MESSAGE_CLASSIFIERS:
+        if any(keyword in text for keyword in keywords):
+            return message_type, confidence
+    return 'general_inquiry', 0.5
+
+
+@pytest.mark.parametrize('message_text', [
+    'Hi, is this still available? What is the price?',
+    'Where can I pick it up?',
+    'HELLO',
+    'Does it work? Any scratches?',
+    'this',
+    'I can come get it tomorrow',
+    '$',
+    'ok',
+    '',
+])
+def test_classify_text_keeps_category_priority(message_text):
+    assert classify_text(message_text) == _classify_by_category(message_text)
+
+
+def test_classify_text_matches_on_seeded_messages(app):
+    texts = db.session.scalars(db.select(Message.message_text)).all()
+
+    assert texts
+    for message_text in texts:
+        assert classify_text(message_text) == _classify_by_category(message_text)
+
+
+def _render_by_replace(template_text, **values):
+    """The str.replace rendering render_template_text replaced."""
+    for key, value in values.items():
+        template_text = template_text.replace(f'{{{key}}}', str(value))
+    return template_text
+
+
+@pytest.mark.parametrize('template_text, values, expected', [
+    ('Hi {customer_name}!', {'customer_name': 'Sam'}, 'Hi Sam!'),
+    ('{item_name} is ${price}', {'item_name': 'Bike', 'price': 120}, 'Bike is $120'),
+    ('Hi {customer_name}, {customer_name} again', {'customer_name': 'Sam'}, 'Hi Sam, Sam again'),
+    ('Hi {customer_name}, see {pickup_location}', {'customer_name': 'Sam'}, 'Hi Sam, see {pickup_location}'),
+    ('Braces { stay } and {not a placeholder}', {}, 'Braces { stay } and {not a placeholder}'),
+    ('No placeholders', {'customer_name': 'Sam'}, 'No placeholders'),
+])
+def test_render_template_text(template_text, values, expected):
+    assert render_template_text(template_text, **values) == expected
+    # A second render comes from the cached parts
+    assert render_template_text(template_text, **values) == expected
+
+
+def test_seeded_templates_render_like_replace(app):
+    values = {'customer_name': 'Sam', 'item_name': 'Bike', 'price': '$120', 'pickup_location': 'Main St'}
+
+    templates = db.session.scalars(db.select(MessageTemplate)).all()
+
+    assert templates
+    for template in templates:
+        assert template.render(**values) == _render_by_replace(template.template_text, **values)
@@ -0,0 +1,88 @@
+import threading
+import time
+
+import pytest
+
+from src.main import create_app
+from src.models import db, FacebookAccount
+from src.services import query_engine
+from src.services.query_engine import QueryEngine
+
+
+@pytest.fixture(autouse=True)
+def empty_analytics_cache():
+    # The cache is process-wide; each test has its own database
+    query_engine._ANALYTICS_CACHE.invalidate()
+    yield
+    query_engine._ANALYTICS_CACHE.invalidate()
+
+
+def test_system_overview_is_shared_within_its_ttl(app):
+    overview = QueryEngine().get_system_overview()
+
+    db.session.add(FacebookAccount(email='new@example.com', password='secret', display_name='New'))
+    db.session.commit()
+
+    assert QueryEngine().get_system_overview() is overview
+
+
+def test_cached_analytics_are_keyed_on_arguments(app):
+    week = QueryEngine().get_automation_performance_analytics(days=7)
+    month = QueryEngine().get_automation_performance_analytics(days=30)
+
+    assert week is not month
+    assert QueryEngine().get_automation_performance_analytics(days=7) is week
+    assert len(month['daily_trends']) > len(week['daily_trends'])
+
+
+def test_concurrent_real_time_misses_query_once(app, monkeypatch):
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+    compute = QueryEngine._get_real_time_metrics
+
+    def slow_compute(engine):
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return compute(engine)
+
+    monkeypatch.setattr(QueryEngine, '_get_real_time_metrics', slow_compute)
+    results = []
+
+    def poll():
+        with app.app_context():
+            results.append(QueryEngine().get_real_time_metrics())
+
+    threads = [threading.Thread(target=poll) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 2 and results[0] is results[1]
+
+
+def test_hourly_analytics_can_read_the_hour_index(app):
+    # The index expression must match what func.extract('hour', ...) compiles to
+    sql = str(query_engine.HOURLY_PERFORMANCE_STATEMENT.compile(db.engine))
+    with db.engine.connect() as conn:
+        conn.exec_driver_sql('ANALYZE')
+        plan = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + sql, (0, 1, 23, 0, 0.0, 3, 0, '2000-01-01')).all()
+
+    assert any('ix_messages_customer_hour' in row[-1] for row in plan)
+
+
+def test_startup_creates_indexes_missing_from_an_existing_database(app):
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql('DROP INDEX ix_messages_customer_hour')
+
+    create_app('testing', database_uri=str(db.engine.url))
+
+    with db.engine.connect() as conn:
+        names = conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'").scalars().all()
+    assert 'ix_messages_customer_hour' in names
@@ -0,0 +1,155 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services.task_manager import TaskManager, TaskStatus
+
+
+@pytest.fixture
+def manager():
+    """A task manager whose worker loop is not started, so tasks stay where the test puts them."""
+    manager = TaskManager()
+    yield manager
+    manager.executor.shutdown(wait=False)
+
+
+def _create(manager, **kwargs):
+    return manager.create_task(name='Test task', task_type='test', function=lambda: None, **kwargs)
+
+
+def _finish(manager, task_id, status=TaskStatus.COMPLETED):
+    manager._set_status(manager.get_task(task_id), status)
+
+
+def test_finished_tasks_beyond_the_limit_are_evicted_oldest_first(manager):
+    manager.max_finished_tasks = 2
+    task_ids = [_create(manager) for _ in range(3)]
+    for task_id in task_ids:
+        _finish(manager, task_id)
+
+    assert manager.get_task(task_ids[0]) is None
+    assert [task.id for task in manager.get_tasks_by_status(TaskStatus.COMPLETED)] == task_ids[1:]
+
+
+def test_dependency_of_an_unfinished_task_is_not_evicted(manager):
+    manager.max_finished_tasks = 1
+    dependency_id = _create(manager)
+    dependent_id = _create(manager, dependencies=[dependency_id])
+    assert manager.get_task(dependent_id).status == TaskStatus.PENDING
+
+    _finish(manager, dependency_id)
+    for _ in range(3):
+        _finish(manager, _create(manager))
+
+    assert manager.get_task(dependency_id) is not None
+    assert not manager.remove_task(dependency_id)
+    assert manager._dependencies_met(manager.get_task(dependent_id))
+
+    # Once the dependent has finished the dependency can go
+    _finish(manager, dependent_id)
+    _finish(manager, _create(manager))
+    assert manager.get_task(dependency_id) is None
+
+
+def test_task_depending_on_an_evicted_task_is_queued(manager):
+    manager.max_finished_tasks = 1
+    dependency_id = _create(manager)
+    _finish(manager, dependency_id)
+    _finish(manager, _create(manager))
+    assert manager.get_task(dependency_id) is None
+
+    dependent_id = _create(manager, dependencies=[dependency_id])
+
+    assert manager.get_task(dependent_id).status == TaskStatus.QUEUED
+
+
+def test_metrics_count_every_concurrent_completion(manager):
+    manager.start()
+    task_ids = [_create(manager) for _ in range(200)]
+    manager._wait_for_tasks(task_ids)
+    manager.stop()
+
+    metrics = manager.get_metrics()
+    assert metrics['total_tasks_created'] == 200
+    assert metrics['total_tasks_completed'] == 200
+    assert manager._duration_count == 200
+
+
+def _ids(tasks):
+    return [task.id for task in tasks]
+
+
+def test_status_and_type_indexes_follow_the_task(manager):
+    queued_id = _create(manager)
+    other_id = manager.create_task(name='Other task', task_type='other', function=lambda: None)
+
+    assert _ids(manager.get_tasks_by_status(TaskStatus.QUEUED)) == [queued_id, other_id]
+    assert _ids(manager.get_tasks_by_type('test')) == [queued_id]
+
+    assert manager.cancel_task(queued_id)
+    assert _ids(manager.get_tasks_by_status(TaskStatus.QUEUED)) == [other_id]
+    assert _ids(manager.get_tasks_by_status(TaskStatus.CANCELLED)) == [queued_id]
+
+    assert manager.remove_task(queued_id)
+    assert manager.get_tasks_by_status(TaskStatus.CANCELLED) == []
+    assert manager.get_tasks_by_type('test') == []
+
+
+def test_scheduled_heap_holds_pending_tasks_until_due(manager):
+    dependency_id = _create(manager)
+    later = datetime.utcnow() + timedelta(seconds=5)
+    due_id = _create(manager, dependencies=[dependency_id], scheduled_at=datetime.utcnow() - timedelta(seconds=1))
+    later_id = _create(manager, dependencies=[dependency_id], scheduled_at=later)
+
+    assert [task_id for _, task_id in sorted(manager._scheduled_heap)] == [due_id, later_id]
+    assert manager._next_wakeup() == 0
+
+    # The due entry is popped; its dependency is unmet, so it stays pending
+    # until the dependency completes
+    manager._check_scheduled_tasks()
+    assert manager._scheduled_heap == [(later, later_id)]
+    assert manager.get_task(due_id).status == TaskStatus.PENDING
+    assert 0 < manager._next_wakeup() <= 5
+
+    _finish(manager, dependency_id)
+    manager._check_dependent_tasks(dependency_id)
+    assert manager.get_task(due_id).status == TaskStatus.QUEUED
+
+
+def test_only_one_concurrent_transition_wins(manager):
+    task = manager.get_task(_create(manager, dependencies=[_create(manager)]))
+    assert task.status == TaskStatus.PENDING
+    barrier = threading.Barrier(8)
+    wins = []
+
+    def transition():
+        barrier.wait()
+        wins.append(manager._set_status(task, TaskStatus.QUEUED, expected=(TaskStatus.PENDING,)))
+
+    threads = [threading.Thread(target=transition) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert wins.count(True) == 1
+    assert task.status == TaskStatus.QUEUED
+
+
+def test_a_task_is_queued_only_once(manager):
+    task = manager.get_task(_create(manager))
+    assert task.status == TaskStatus.QUEUED
+    assert manager.queued_count() == 1
+
+    manager._queue_task(task)
+
+    assert manager.queued_count() == 1
+
+
+def test_cancel_does_not_overwrite_a_running_task(manager):
+    task = manager.get_task(_create(manager))
+    assert manager._set_status(task, TaskStatus.RUNNING, expected=(TaskStatus.QUEUED,))
+
+    assert not manager.cancel_task(task.id)
+    assert task.status == TaskStatus.RUNNING
@@ -0,0 +1,97 @@
+import pytest
+
+from src.routes import validation
+from src.routes.validation import validation_bp, validation_cache
+
+
+@pytest.fixture
+def client(app):
+    """Test client for the validation API on the seeded testing app."""
+    app.register_blueprint(validation_bp, url_prefix='/api/validation')
+    # The cache is process-wide; each test has its own database
+    validation_cache.invalidate()
+    yield app.test_client()
+    validation_cache.invalidate()
+
+
+@pytest.fixture
+def validation_runs(monkeypatch):
+    """Count the full validation runs made through the routes."""
+    runs = []
+    validate_all_systems = validation.validation_service.validate_all_systems
+
+    def counting_validate_all_systems(*args, **kwargs):
+        runs.append(1)
+        return validate_all_systems(*args, **kwargs)
+
+    monkeypatch.setattr(validation.validation_service, 'validate_all_systems', counting_validate_all_systems)
+    return runs
+
+
+def test_quick_validations_share_one_cached_run(client, validation_runs):
+    first = client.post('/api/validation/run-quick-validation')
+    second = client.post('/api/validation/run-quick-validation')
+
+    assert first.status_code == second.status_code == 200
+    assert first.get_json()['validation_result'] == second.get_json()['validation_result']
+    assert len(validation_runs) == 1
+
+
+def test_applied_fix_invalidates_cached_results(client, monkeypatch):
+    runs = []
+
+    def validate_all_systems():
+        runs.append(1)
+        return {
+            'timestamp': '2026-01-01T00:00:00',
+            'overall_status': 'failed',
+            'validations': {
+                'database': {'status': 'failed', 'errors': [{'type': 'missing_tables'}], 'warnings': []}
+            }
+        }
+
+    monkeypatch.setattr(validation.validation_service, 'validate_all_systems', validate_all_systems)
+
+    response = client.post('/api/validation/fix-issues', json={'dry_run': False})
+
+    assert response.status_code == 200
+    assert response.get_json()['fix_results']['fixes_applied'][0]['action'] == 'recreated_missing_tables'
+    assert validation_cache.get('all_systems') is None
+    assert validation_cache.get('database') is None
+    client.post('/api/validation/run-quick-validation')
+    assert len(runs) == 2
+
+
+@pytest.mark.parametrize('body', [
+    {'report_type': 'everything'},
+    {'include_history': 'sometimes'},
+])
+def test_invalid_report_body_is_rejected(client, body):
+    response = client.post('/api/validation/validation-report', json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_invalid_fix_issues_body_is_rejected(client):
+    response = client.post('/api/validation/fix-issues', json={'issue_types': 'missing_tables'})
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_unknown_body_keys_are_ignored(client):
+    response = client.post('/api/validation/fix-issues', json={'dry_run': True, 'requested_by': 'dashboard'})
+
+    assert response.status_code == 200
+    assert response.get_json()['fix_results']['dry_run'] is True
+
+
+def test_domain_results_carry_the_snapshot_time(client, validation_runs):
+    quick = client.post('/api/validation/run-quick-validation').get_json()
+    integrity = client.get('/api/validation/database-integrity').get_json()
+
+    # Served from the full run's snapshot, with the time it was taken
+    assert len(validation_runs) == 1
+    assert integrity['validated_at'] == quick['validated_at'] == quick['validation_result']['timestamp']
+    assert integrity['database_integrity'] == quick['validation_result']['validations']['database']
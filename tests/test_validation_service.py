@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+
+from src.models import db, AutomationRun, Conversation, Message
+from src.services.validation_service import ValidationService
+
+
+def test_resource_check_reports_row_estimates_as_estimates(app):
+    first_message = db.session.query(Message).order_by(Message.id).first()
+    db.session.delete(first_message)
+    db.session.commit()
+    message_count = db.session.query(Message).count()
+
+    with db.engine.connect() as conn:
+        resource_utilization = ValidationService()._check_resource_utilization(conn)
+
+    assert 'total_messages' not in resource_utilization
+    # Deleted ids still count, so the estimate is an upper bound
+    assert resource_utilization['estimated_messages'] == message_count + 1
+
+
+def _add_violations():
+    conversation = db.session.query(Conversation).first()
+    three_hours_ago = datetime.utcnow() - timedelta(hours=3)
+    db.session.add_all([
+        Message(conversation_id=conversation.id, message_text='Still there?', is_from_customer=True,
+                timestamp=three_hours_ago),
+        Message(conversation_id=conversation.id, message_text='Yes', is_from_customer=False,
+                response_generated='Yes', timestamp=three_hours_ago),
+        AutomationRun(facebook_account_id=conversation.facebook_account_id, run_type='manual',
+                      status='running', start_time=three_hours_ago),
+        AutomationRun(facebook_account_id=conversation.facebook_account_id, run_type='manual',
+                      status='failed')
+    ])
+    db.session.commit()
+
+
+def test_business_logic_counts_match_separate_queries(app):
+    _add_violations()
+    now = datetime.utcnow()
+    expected = {
+        'unclassified': Message.query.filter(Message.message_type.is_(None),
+                                             Message.timestamp < now - timedelta(hours=1),
+                                             Message.is_from_customer.is_(True)).count(),
+        'low_confidence': Message.query.filter(Message.classification_confidence < 0.5,
+                                               Message.message_type.isnot(None)).count(),
+        'unanswered': Message.query.filter(Message.is_from_customer.is_(True),
+                                           Message.response_sent.is_(False),
+                                           Message.timestamp < now - timedelta(hours=2)).count(),
+        'unsent': Message.query.filter(Message.response_generated.isnot(None),
+                                       Message.response_sent.is_(False),
+                                       Message.timestamp < now - timedelta(minutes=30)).count(),
+        'stuck': AutomationRun.query.filter(AutomationRun.status == 'running',
+                                            AutomationRun.start_time < now - timedelta(hours=1)).count(),
+        'failed_without_details': AutomationRun.query.filter(AutomationRun.status == 'failed',
+                                                             AutomationRun.error_details.is_(None)).count()
+    }
+    assert all(expected[name] >= 1 for name in ('unclassified', 'unanswered', 'unsent', 'stuck',
+                                                'failed_without_details'))
+
+    with db.engine.connect() as conn:
+        counts = ValidationService()._business_logic_counts(conn)
+
+    assert {name: counts[name] for name in expected} == expected
+
+    results = ValidationService().validate_business_logic()
+    assert results['checks_performed'] == ['message_classification', 'response_generation',
+                                           'automation_workflow', 'account_rotation']
+    assert results['metrics']['workflow']['violations'] == expected['stuck'] + expected['failed_without_details']
+
+
+def test_performance_stats_match_separate_queries(app):
+    since = datetime.utcnow() - timedelta(hours=24)
+    recent = Message.query.filter(Message.timestamp > since)
+    recent_customer = recent.filter(Message.is_from_customer.is_(True))
+
+    with db.engine.connect() as conn:
+        stats = ValidationService()._performance_message_stats(conn)
+
+    assert stats['total_processed'] == recent.filter(Message.processing_time_seconds.isnot(None)).count()
+    assert stats['total_customer_messages'] == recent_customer.count()
+    assert stats['responses_sent'] == recent_customer.filter(Message.response_sent.is_(True)).count()
+    assert stats['max_time'] == db.session.query(func.max(Message.processing_time_seconds)).filter(
+        Message.timestamp > since).scalar()